@@ -0,0 +1,109 @@
+"""
+DataFetcher 처리량/꼬리 지연 부하 테스트
+
+로컬 가짜 거래소(benchmarks.mock_exchange)를 띄우고 여러 스레드에서 DataFetcher 로
+현재가와 OHLCV 를 반복 요청하여 초당 처리량과 p50/p95/p99/최대 지연을 측정합니다.
+서버의 지연/흔들림/요청 제한/오류 비율을 바꿔가며 같은 조건에서 비교할 수 있습니다.
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.fetcher_load --workers 8 --duration 10 --latency 30 --jitter 20
+    python -m benchmarks.fetcher_load --rate-limit 600 --error-rate 0.02
+    python -m benchmarks.fetcher_load --url http://127.0.0.1:8765   # 이미 실행 중인 서버 사용
+"""
+import argparse
+import sys
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.mock_exchange import MockExchangeServer
+from benchmarks.run_benchmarks import format_seconds
+from data.data_fetcher import DataFetcher
+
+
+def worker(url, deadline, limit, client_throttle, results, lock):
+    """deadline 까지 현재가 → OHLCV 요청 반복, (종류, 지연, 성공 여부) 기록"""
+    fetcher = DataFetcher(base_url=url)
+    # ccxt 자체 요청 간격 제한 (기본 50ms) 사용 여부
+    fetcher.exchange.enableRateLimit = client_throttle
+    fetcher.exchange.load_markets()
+    samples = []
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        ok = fetcher.get_current_price() is not None
+        samples.append(('ticker', time.perf_counter() - start, ok))
+
+        start = time.perf_counter()
+        candle_data, _ = fetcher.fetch_ohlcv(limit=limit)
+        samples.append(('ohlcv', time.perf_counter() - start, candle_data is not None))
+    with lock:
+        results.extend(samples)
+
+
+def report(results, elapsed):
+    """요청 종류별 처리량과 지연 분위수 출력"""
+    print(f"{'request':<10}{'req/s':>9}{'ok':>8}{'fail':>7}"
+          f"{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for kind in ('ticker', 'ohlcv', 'all'):
+        rows = [r for r in results if kind == 'all' or r[0] == kind]
+        if not rows:
+            continue
+        latency = np.array([r[1] for r in rows])
+        ok = sum(1 for r in rows if r[2])
+        p50, p95, p99 = np.quantile(latency, (0.5, 0.95, 0.99))
+        print(f"{kind:<10}{len(rows) / elapsed:>9.1f}{ok:>8}{len(rows) - ok:>7}"
+              f"{format_seconds(p50):>10}{format_seconds(p95):>10}"
+              f"{format_seconds(p99):>10}{format_seconds(latency.max()):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DataFetcher 처리량/꼬리 지연 부하 테스트')
+    parser.add_argument('--url', help='이미 실행 중인 거래소 주소 (생략하면 가짜 거래소를 직접 실행)')
+    parser.add_argument('--workers', type=int, default=4, help='동시 요청 스레드 수')
+    parser.add_argument('--duration', type=float, default=10.0, help='측정 시간 (초)')
+    parser.add_argument('--limit', type=int, default=300, help='OHLCV 봉 개수')
+    parser.add_argument('--latency', type=float, default=0.0, help='서버 응답 지연 (ms)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연 흔들림 ± (ms)')
+    parser.add_argument('--rate-limit', type=int, default=1_000_000, help='rate-window 동안 허용 가중치')
+    parser.add_argument('--rate-window', type=float, default=60.0, help='요청 제한 구간 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='503 오류 응답 비율 (0~1)')
+    parser.add_argument('--no-client-throttle', action='store_true',
+                        help='ccxt 요청 간격 제한을 끄고 서버 조건만 측정')
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        server = MockExchangeServer(latency=args.latency, jitter=args.jitter,
+                                    rate_limit=args.rate_limit, rate_window=args.rate_window,
+                                    error_rate=args.error_rate).start()
+        url = server.url
+        print(f'가짜 거래소 서버: {url} (지연 {args.latency:g}±{args.jitter:g}ms, '
+              f'제한 {args.rate_limit}/{args.rate_window:g}s, 오류 {args.error_rate:.1%})')
+
+    results = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+    deadline = start + args.duration
+    threads = [threading.Thread(target=worker, args=(url, deadline, args.limit,
+                                                     not args.no_client_throttle, results, lock))
+               for _ in range(args.workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print(f'\n{args.workers}개 스레드, {elapsed:.1f}s 동안 {len(results)}회 요청\n')
+    report(results, elapsed)
+
+    if server is not None:
+        print(f'\n서버: 요청 {server.request_count}회, 429 {server.throttled_count}회, '
+              f'503 {server.error_count}회')
+        server.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
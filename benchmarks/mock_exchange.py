@@ -0,0 +1,561 @@
+"""
+로컬 가짜 거래소 서버 (Binance 현물 REST API 일부 흉내)
+
+DataFetcher(ccxt) 가 사용하는 엔드포인트만 구현합니다.
+    GET /api/v3/time          서버 시각
+    GET /api/v3/exchangeInfo  마켓 목록 (load_markets)
+    GET /api/v3/ticker/24hr   현재가 (fetch_ticker)
+    GET /api/v3/klines        OHLCV (fetch_ohlcv)
+    GET /api/v3/depth         호가 스냅샷 (fetch_order_book)
+    GET /api/v3/aggTrades     최근 체결 (fetch_trades, fromId 로 이어 받기)
+
+가격은 심볼별 시드로 만든 분 단위 랜덤 워크이며, 같은 시드면 항상 같은 가격이 나옵니다.
+지연 시간/흔들림, 429 요청 제한, 오류 응답 비율을 설정할 수 있습니다.
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.mock_exchange --port 8765 --latency 50 --jitter 20 --error-rate 0.01
+    TRADING_EXCHANGE_URL=http://127.0.0.1:8765 python main.py
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+
+MINUTE_MS = 60 * 1000
+
+# Binance 봉 간격 → 분
+INTERVAL_MINUTES = {
+    '1m': 1, '3m': 3, '5m': 5, '15m': 15, '30m': 30,
+    '1h': 60, '2h': 120, '4h': 240, '6h': 360, '8h': 480, '12h': 720, '1d': 1440,
+}
+# 초 단위 간격 (Binance 현물은 1s 만 지원) - 앱의 실시간 봉 보정이 1s klines 를 요청함
+SECOND_INTERVALS = {'1s': 1}
+
+# 엔드포인트별 요청 가중치 (Binance 기준)
+ENDPOINT_WEIGHTS = {
+    '/api/v3/time': 1,
+    '/api/v3/exchangeInfo': 20,
+    '/api/v3/ticker/24hr': 2,
+    '/api/v3/klines': 2,
+    '/api/v3/depth': 5,
+    '/api/v3/aggTrades': 2,
+}
+
+# 심볼 → (기준 자산, 호가 자산, 시작 가격)
+DEFAULT_SYMBOLS = {
+    'BTCUSDT': ('BTC', 'USDT', 60000.0),
+    'ETHUSDT': ('ETH', 'USDT', 3000.0),
+    'SOLUSDT': ('SOL', 'USDT', 150.0),
+}
+
+
+class PriceGenerator:
+    """
+    심볼 하나의 가짜 분봉 생성기
+
+    - 서버 시작 시각 기준 history_minutes 분 전부터 분봉을 미리 생성하고, 시간이 지나면 두 배씩 늘림
+    - 진행 중인 분봉은 경과 초에 따라 시가에서 종가로 움직이는 값으로 계산
+    """
+
+    def __init__(self, start_price, seed, history_minutes=100_000, volatility=0.0008):
+        self.start_price = start_price
+        self.volatility = volatility
+        self.rng = np.random.default_rng(seed)
+        self.seed = seed
+        now_minute = int(time.time() * 1000) // MINUTE_MS
+        self.origin_minute = now_minute - history_minutes
+        self.size = 0
+        self.open = np.empty(0)
+        self.high = np.empty(0)
+        self.low = np.empty(0)
+        self.close = np.empty(0)
+        self.volume = np.empty(0)
+        self.lock = threading.Lock()
+        self._extend(history_minutes + 1)
+
+    def _extend(self, count):
+        """분봉 count 개를 이어서 생성"""
+        last_close = self.close[-1] if self.size else self.start_price
+        returns = self.rng.normal(0, self.volatility, count)
+        close = last_close * np.exp(np.cumsum(returns))
+        open_ = np.concatenate(([last_close], close[:-1]))
+        spread = np.abs(self.rng.normal(0, self.volatility / 2, (2, count))) * close
+        high = np.maximum(open_, close) + spread[0]
+        low = np.minimum(open_, close) - spread[1]
+        volume = self.rng.gamma(2.0, 5.0, count)
+        self.open = np.concatenate((self.open, open_))
+        self.high = np.concatenate((self.high, high))
+        self.low = np.concatenate((self.low, low))
+        self.close = np.concatenate((self.close, close))
+        self.volume = np.concatenate((self.volume, volume))
+        self.size += count
+
+    def _ensure(self, minute_index):
+        """minute_index 번째 분봉까지 생성되어 있도록 보장"""
+        if minute_index >= self.size:
+            self._extend(max(minute_index + 1 - self.size, self.size))
+
+    def minute_bars(self, start_index, end_index, now_ms):
+        """
+        [start_index, end_index) 분봉 배열 (open, high, low, close, volume)
+        마지막 분봉이 진행 중이면 now_ms 기준으로 일부만 반영
+        """
+        with self.lock:
+            self._ensure(end_index)
+        start_index = max(start_index, 0)
+        o = self.open[start_index:end_index].copy()
+        h = self.high[start_index:end_index].copy()
+        l = self.low[start_index:end_index].copy()
+        c = self.close[start_index:end_index].copy()
+        v = self.volume[start_index:end_index].copy()
+
+        current = now_ms // MINUTE_MS - self.origin_minute
+        if len(c) and start_index <= current < end_index:
+            i = current - start_index
+            progress = (now_ms % MINUTE_MS) / MINUTE_MS
+            c[i] = o[i] + (c[i] - o[i]) * progress
+            h[i] = o[i] + (h[i] - o[i]) * progress
+            l[i] = o[i] + (l[i] - o[i]) * progress
+            h[i] = max(h[i], o[i], c[i])
+            l[i] = min(l[i], o[i], c[i])
+            v[i] *= progress
+            # 진행 중인 분봉 뒤는 아직 없는 봉
+            o, h, l, c, v = o[:i + 1], h[:i + 1], l[:i + 1], c[:i + 1], v[:i + 1]
+        return o, h, l, c, v
+
+    def klines(self, interval_minutes, limit, now_ms, start_ms=None, end_ms=None):
+        """
+        Binance klines 응답 형식의 봉 목록
+        봉 시작 시각은 1970-01-01 기준 interval 배수로 정렬
+        """
+        interval_ms = interval_minutes * MINUTE_MS
+        end_ms = min(end_ms if end_ms is not None else now_ms, now_ms)
+        if start_ms is not None:
+            first_bar = -(-start_ms // interval_ms) * interval_ms
+            last_bar = min(first_bar + (limit - 1) * interval_ms, end_ms // interval_ms * interval_ms)
+        else:
+            last_bar = end_ms // interval_ms * interval_ms
+            first_bar = last_bar - (limit - 1) * interval_ms
+        first_bar = max(first_bar, self.origin_minute * MINUTE_MS // interval_ms * interval_ms + interval_ms)
+        if last_bar < first_bar:
+            return []
+
+        start_index = first_bar // MINUTE_MS - self.origin_minute
+        end_index = last_bar // MINUTE_MS - self.origin_minute + interval_minutes
+        o, h, l, c, v = self.minute_bars(start_index, end_index, now_ms)
+        if len(o) == 0:
+            return []
+
+        # 분봉을 interval 단위로 묶기
+        starts = np.arange(0, len(o), interval_minutes)
+        ends = np.minimum(starts + interval_minutes, len(o)) - 1
+        bar_open = o[starts]
+        bar_high = np.maximum.reduceat(h, starts)
+        bar_low = np.minimum.reduceat(l, starts)
+        bar_close = c[ends]
+        bar_volume = np.add.reduceat(v, starts)
+        open_times = first_bar + np.arange(len(starts), dtype=np.int64) * interval_ms
+
+        rows = []
+        for i in range(len(starts)):
+            quote_volume = bar_volume[i] * bar_close[i]
+            rows.append([
+                int(open_times[i]), f'{bar_open[i]:.2f}', f'{bar_high[i]:.2f}', f'{bar_low[i]:.2f}',
+                f'{bar_close[i]:.2f}', f'{bar_volume[i]:.5f}', int(open_times[i] + interval_ms - 1),
+                f'{quote_volume:.4f}', int(bar_volume[i] * 10), f'{bar_volume[i] / 2:.5f}',
+                f'{quote_volume / 2:.4f}', '0',
+            ])
+        return rows
+
+    def second_klines(self, limit, now_ms, start_ms=None, end_ms=None):
+        """
+        1s klines - 분봉 안의 가격을 시가 → 종가로 이어지는 경로로 보고 1초 구간씩 잘라서 만듦
+        (진행 중인 분봉과 같은 방식이라 분봉/현재가와 어긋나지 않음)
+        """
+        end_ms = min(end_ms if end_ms is not None else now_ms, now_ms)
+        if start_ms is not None:
+            first_bar = -(-start_ms // 1000) * 1000
+            last_bar = min(first_bar + (limit - 1) * 1000, end_ms // 1000 * 1000)
+        else:
+            last_bar = end_ms // 1000 * 1000
+            first_bar = last_bar - (limit - 1) * 1000
+        first_bar = max(first_bar, (self.origin_minute + 1) * MINUTE_MS)
+        if last_bar < first_bar:
+            return []
+
+        open_times = np.arange(first_bar, last_bar + 1000, 1000, dtype=np.int64)
+        minutes = open_times // MINUTE_MS - self.origin_minute
+        with self.lock:
+            self._ensure(int(minutes[-1]) + 1)
+        o, c, h, l, v = (self.open[minutes], self.close[minutes], self.high[minutes], self.low[minutes],
+                         self.volume[minutes])
+        start = (open_times % MINUTE_MS) / MINUTE_MS
+        # 진행 중인 초는 now_ms 까지만
+        end = np.minimum(start + 1000 / MINUTE_MS, start + np.maximum(now_ms - open_times, 0) / MINUTE_MS)
+        bar_open = o + (c - o) * start
+        bar_close = o + (c - o) * end
+        # 1초 동안의 흔들림은 분봉 꼬리 길이의 일부로 (분봉 고가/저가를 넘지 않음)
+        wiggle = np.sqrt(1000 / MINUTE_MS)
+        bar_high = np.minimum(np.maximum(bar_open, bar_close) + (h - np.maximum(o, c)) * wiggle, h)
+        bar_low = np.maximum(np.minimum(bar_open, bar_close) - (np.minimum(o, c) - l) * wiggle, l)
+        bar_volume = v * (end - start)
+
+        rows = []
+        for i in range(len(open_times)):
+            quote_volume = bar_volume[i] * bar_close[i]
+            rows.append([
+                int(open_times[i]), f'{bar_open[i]:.2f}', f'{bar_high[i]:.2f}', f'{bar_low[i]:.2f}',
+                f'{bar_close[i]:.2f}', f'{bar_volume[i]:.5f}', int(open_times[i] + 999),
+                f'{quote_volume:.4f}', int(bar_volume[i] * 10), f'{bar_volume[i] / 2:.5f}',
+                f'{quote_volume / 2:.4f}', '0',
+            ])
+        return rows
+
+    def ticker(self, symbol, now_ms):
+        """Binance 24시간 현재가 응답 형식"""
+        current = now_ms // MINUTE_MS - self.origin_minute
+        o, h, l, c, v = self.minute_bars(current - 24 * 60 + 1, current + 1, now_ms)
+        last = c[-1]
+        open_price = o[0]
+        volume = v.sum()
+        quote_volume = float((v * c).sum())
+        return {
+            'symbol': symbol,
+            'priceChange': f'{last - open_price:.2f}',
+            'priceChangePercent': f'{(last - open_price) / open_price * 100:.3f}',
+            'weightedAvgPrice': f'{quote_volume / volume:.2f}' if volume else f'{last:.2f}',
+            'prevClosePrice': f'{open_price:.2f}',
+            'lastPrice': f'{last:.2f}',
+            'lastQty': '0.01000',
+            'bidPrice': f'{last - 0.01:.2f}',
+            'bidQty': '1.00000',
+            'askPrice': f'{last + 0.01:.2f}',
+            'askQty': '1.00000',
+            'openPrice': f'{open_price:.2f}',
+            'highPrice': f'{h.max():.2f}',
+            'lowPrice': f'{l.min():.2f}',
+            'volume': f'{volume:.5f}',
+            'quoteVolume': f'{quote_volume:.4f}',
+            'openTime': int(now_ms - 24 * 60 * MINUTE_MS),
+            'closeTime': int(now_ms),
+            'firstId': 0,
+            'lastId': int(volume * 10),
+            'count': int(volume * 10),
+        }
+
+
+    def depth(self, limit, now_ms, rng):
+        """Binance 호가 스냅샷 형식 (현재가 주변 0.01 단위 호가)"""
+        current = now_ms // MINUTE_MS - self.origin_minute
+        last = self.minute_bars(current, current + 1, now_ms)[3][-1]
+        best_bid = np.floor(last * 100) / 100
+        offsets = np.arange(limit) * 0.01 + rng.integers(0, 3, limit).cumsum() * 0.01
+        quantity = rng.gamma(1.5, 0.4, (2, limit))
+        return {
+            'lastUpdateId': now_ms,
+            'bids': [[f'{best_bid - o:.2f}', f'{q:.5f}'] for o, q in zip(offsets, quantity[0])],
+            'asks': [[f'{best_bid + 0.01 + o:.2f}', f'{q:.5f}'] for o, q in zip(offsets, quantity[1])],
+        }
+
+
+    def second_trades(self, second, now_ms, trades_per_second):
+        """
+        second 초의 집계 체결 (now_ms 이후 체결은 제외)
+        초마다 trades_per_second 건이라 번호(초 × trades_per_second + 순번)가 거래소처럼 끊김 없이 이어짐
+        """
+        rng = np.random.default_rng((self.seed, second))
+        count = trades_per_second
+        offsets = np.sort(rng.integers(0, 1000, count))
+        times = second * 1000 + offsets
+        current = second * 1000 // MINUTE_MS - self.origin_minute
+        price = self.minute_bars(current, current + 1, second * 1000)[3][-1]
+        prices = price + np.cumsum(rng.normal(0, price * 1e-5, count))
+        sizes = rng.gamma(1.2, 0.02, count)
+        buyer_maker = rng.random(count) < 0.5
+        trades = []
+        for j in range(count):
+            if times[j] > now_ms:
+                break
+            trade_id = int(second * trades_per_second + j)
+            trades.append({
+                'a': trade_id, 'p': f'{prices[j]:.2f}', 'q': f'{sizes[j]:.5f}',
+                'f': trade_id, 'l': trade_id, 'T': int(times[j]),
+                'm': bool(buyer_maker[j]), 'M': True,
+            })
+        return trades
+
+    def agg_trades(self, limit, now_ms, from_id=None, trades_per_second=20):
+        """
+        Binance 집계 체결 형식의 최근 체결 limit 건 (from_id 를 주면 그 번호부터 limit 건)
+        초 단위로 시드를 정해 생성하므로 같은 초의 체결은 몇 번을 요청해도 같음
+        """
+        trades = []
+        if from_id is not None:
+            second = max(from_id // trades_per_second, (self.origin_minute + 1) * MINUTE_MS // 1000)
+            while len(trades) < limit and second <= now_ms // 1000:
+                trades += [t for t in self.second_trades(second, now_ms, trades_per_second) if t['a'] >= from_id]
+                second += 1
+            return trades[:limit]
+        second = now_ms // 1000
+        while len(trades) < limit and now_ms // 1000 - second < 60:
+            trades = self.second_trades(second, now_ms, trades_per_second) + trades
+            second -= 1
+        return trades[-limit:]
+
+
+class ExchangeError(Exception):
+    """HTTP 오류 응답으로 보낼 예외"""
+
+    def __init__(self, status, code, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+        self.headers = headers or {}
+
+
+class MockExchangeServer(ThreadingHTTPServer):
+    """
+    가짜 거래소 HTTP 서버
+
+    - latency/jitter: 모든 응답 전에 latency ± jitter (ms) 만큼 대기
+    - rate_limit: rate_window 초 동안 허용하는 요청 가중치 합, 넘으면 429 + Retry-After
+    - error_rate: 이 확률로 503 오류 응답
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, symbols=None, seed=42, latency=0.0, jitter=0.0,
+                 rate_limit=1200, rate_window=60.0, error_rate=0.0):
+        super().__init__((host, port), MockExchangeHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+
+        symbols = symbols or DEFAULT_SYMBOLS
+        self.symbols = symbols
+        self.generators = {
+            symbol: PriceGenerator(start_price, seed + zlib.crc32(symbol.encode()))
+            for symbol, (_, _, start_price) in symbols.items()
+        }
+
+        # 요청 제한: (시각, 가중치) 기록
+        self.requests = deque()
+        self.used_weight = 0
+        self.rate_lock = threading.Lock()
+
+        # 통계
+        self.request_count = 0
+        self.throttled_count = 0
+        self.error_count = 0
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self.shutdown()
+        self.server_close()
+
+    def delay(self):
+        """설정한 지연 시간만큼 대기"""
+        if self.latency <= 0 and self.jitter <= 0:
+            return
+        with self.random_lock:
+            delay = self.latency + self.random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def should_fail(self):
+        """오류 응답을 보낼지 결정"""
+        if self.error_rate <= 0:
+            return False
+        with self.random_lock:
+            return self.random.random() < self.error_rate
+
+    def consume_weight(self, weight):
+        """
+        요청 가중치 반영 후 현재 사용량 반환
+        제한을 넘으면 429 ExchangeError
+        """
+        now = time.monotonic()
+        with self.rate_lock:
+            self.request_count += 1
+            while self.requests and now - self.requests[0][0] >= self.rate_window:
+                self.used_weight -= self.requests.popleft()[1]
+            if self.used_weight + weight > self.rate_limit:
+                self.throttled_count += 1
+                retry_after = max(1, int(self.rate_window - (now - self.requests[0][0])) + 1)
+                raise ExchangeError(429, -1003, 'Too many requests; current limit is '
+                                    f'{self.rate_limit} request weight per {self.rate_window:g} seconds.',
+                                    {'Retry-After': str(retry_after),
+                                     'X-MBX-USED-WEIGHT-1M': str(self.used_weight)})
+            self.requests.append((now, weight))
+            self.used_weight += weight
+            return self.used_weight
+
+    def generator(self, query):
+        """쿼리의 symbol 에 해당하는 가격 생성기"""
+        symbol = query.get('symbol')
+        if symbol not in self.generators:
+            raise ExchangeError(400, -1121, 'Invalid symbol.')
+        return symbol, self.generators[symbol]
+
+    def exchange_info(self, now_ms):
+        """마켓 목록 응답"""
+        symbols = []
+        for symbol, (base, quote, _) in self.symbols.items():
+            symbols.append({
+                'symbol': symbol,
+                'status': 'TRADING',
+                'baseAsset': base,
+                'baseAssetPrecision': 8,
+                'quoteAsset': quote,
+                'quotePrecision': 8,
+                'quoteAssetPrecision': 8,
+                'orderTypes': ['LIMIT', 'MARKET'],
+                'icebergAllowed': True,
+                'ocoAllowed': True,
+                'isSpotTradingAllowed': True,
+                'isMarginTradingAllowed': False,
+                'permissions': ['SPOT'],
+                'permissionSets': [['SPOT']],
+                'filters': [
+                    {'filterType': 'PRICE_FILTER', 'minPrice': '0.01000000',
+                     'maxPrice': '1000000.00000000', 'tickSize': '0.01000000'},
+                    {'filterType': 'LOT_SIZE', 'minQty': '0.00001000',
+                     'maxQty': '9000.00000000', 'stepSize': '0.00001000'},
+                    {'filterType': 'NOTIONAL', 'minNotional': '5.00000000',
+                     'maxNotional': '9000000.00000000'},
+                ],
+            })
+        return {
+            'timezone': 'UTC',
+            'serverTime': now_ms,
+            'rateLimits': [{'rateLimitType': 'REQUEST_WEIGHT', 'interval': 'MINUTE',
+                            'intervalNum': 1, 'limit': self.rate_limit}],
+            'exchangeFilters': [],
+            'symbols': symbols,
+        }
+
+    def handle_path(self, path, query):
+        """경로별 응답 본문 생성"""
+        now_ms = int(time.time() * 1000)
+        if path == '/api/v3/time':
+            return {'serverTime': now_ms}
+        if path == '/api/v3/exchangeInfo':
+            return self.exchange_info(now_ms)
+        if path == '/api/v3/ticker/24hr':
+            symbol, generator = self.generator(query)
+            return generator.ticker(symbol, now_ms)
+        if path == '/api/v3/klines':
+            _, generator = self.generator(query)
+            limit = min(int(query.get('limit', 500)), 1000)
+            start_ms = int(query['startTime']) if 'startTime' in query else None
+            end_ms = int(query['endTime']) if 'endTime' in query else None
+            if query.get('interval') in SECOND_INTERVALS:
+                return generator.second_klines(limit, now_ms, start_ms, end_ms)
+            interval = INTERVAL_MINUTES.get(query.get('interval'))
+            if interval is None:
+                raise ExchangeError(400, -1120, 'Invalid interval.')
+            return generator.klines(interval, limit, now_ms, start_ms, end_ms)
+        if path == '/api/v3/depth':
+            _, generator = self.generator(query)
+            limit = min(int(query.get('limit', 100)), 5000)
+            with self.random_lock:
+                rng = np.random.default_rng(self.random.getrandbits(32))
+            return generator.depth(limit, now_ms, rng)
+        if path == '/api/v3/aggTrades':
+            _, generator = self.generator(query)
+            limit = min(int(query.get('limit', 500)), 1000)
+            from_id = int(query['fromId']) if 'fromId' in query else None
+            return generator.agg_trades(limit, now_ms, from_id)
+        raise ExchangeError(404, -1000, f'Unknown path {path}')
+
+
+class MockExchangeHandler(BaseHTTPRequestHandler):
+    """요청 하나 처리: 지연 → 요청 제한 → 오류 주입 → 응답"""
+
+    protocol_version = 'HTTP/1.1'
+    # 헤더와 본문을 나눠 보낼 때 Nagle 알고리즘 때문에 생기는 40ms 지연 방지
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        parsed = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        headers = {}
+        server.delay()
+        try:
+            weight = server.consume_weight(ENDPOINT_WEIGHTS.get(parsed.path, 1))
+            headers['X-MBX-USED-WEIGHT-1M'] = str(weight)
+            if server.should_fail():
+                server.error_count += 1
+                raise ExchangeError(503, -1001, 'Internal error; unable to process your request. '
+                                    'Please try again.')
+            self.send_json(200, server.handle_path(parsed.path, query), headers)
+        except ExchangeError as e:
+            headers.update(e.headers)
+            self.send_json(e.status, {'code': e.code, 'msg': e.message}, headers)
+
+    def send_json(self, status, body, headers):
+        data = json.dumps(body, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json;charset=UTF-8')
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 콘솔 출력 생략
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 가짜 거래소 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', type=int, default=42, help='가격 생성 시드')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 (ms)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연 흔들림 ± (ms)')
+    parser.add_argument('--rate-limit', type=int, default=1200, help='rate-window 동안 허용 가중치')
+    parser.add_argument('--rate-window', type=float, default=60.0, help='요청 제한 구간 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='503 오류 응답 비율 (0~1)')
+    args = parser.parse_args()
+
+    server = MockExchangeServer(args.host, args.port, seed=args.seed, latency=args.latency,
+                                jitter=args.jitter, rate_limit=args.rate_limit,
+                                rate_window=args.rate_window, error_rate=args.error_rate)
+    print(f'가짜 거래소 서버 시작: {server.url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+기록 재생 기반 전체 파이프라인 부하 테스트
+
+네트워크 없이 시세 기록 파일을 TradingView 에 그대로 흘려보내면서
+update_data 한 번(현재가 → 포지션/수익률 → OHLCV → 지표 → 차트)의 단계별 지연 시간을 측정합니다.
+재생 시계를 직접 넘기므로 같은 기록 파일이면 항상 같은 입력 순서로 실행됩니다.
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.replay_pipeline --synthesize recordings/synthetic.jsonl.gz  # 가짜 기록 생성
+    python -m benchmarks.replay_pipeline recordings/synthetic.jsonl.gz --speed 100    # 100배속 재생
+
+실제 시세 기록은 앱을 TRADING_RECORD=<파일> 환경 변수와 함께 실행하면 만들어집니다.
+"""
+import os
+import tempfile
+
+# Qt 를 불러오기 전에 화면 없는 모드로 설정
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# 앱 모듈을 불러오기 전에 세션 스냅샷/내보낸 봉 경로를 임시 폴더로 (사용자의 실제 세션 파일을 건드리지 않음)
+_scratch = tempfile.mkdtemp(prefix='replay_pipeline_')
+os.environ.setdefault('TRADING_SNAPSHOT', os.path.join(_scratch, 'snapshot.npz'))
+os.environ.setdefault('TRADING_HISTORY_DIR', os.path.join(_scratch, 'history'))
+
+import argparse
+import shutil
+import sys
+import time
+
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.synthetic_data import make_ohlcv, MINUTE_MS
+from benchmarks.run_benchmarks import format_seconds
+from data.market_recorder import MarketRecorder, ReplayDataFetcher
+
+POLL_INTERVAL = 1.0  # 앱의 update_timer 주기 (초)
+
+
+def write_synthetic_recording(path, minutes=60, limit=300, symbol='BTC/USDT', timeframe='1m'):
+    """
+    1초마다 현재가와 1분봉을 받은 것처럼 가짜 기록 파일 생성
+    Args:
+        minutes: 기록 길이 (분)
+        limit: 한 번에 받는 봉 개수
+    """
+    ohlcv = make_ohlcv(limit + minutes)
+    start_ms = int(ohlcv[limit - 1][0])
+    recorder = MarketRecorder(path)
+    for second in range(minutes * 60):
+        now_ms = start_ms + second * 1000
+        last = limit - 1 + second * 1000 // MINUTE_MS
+        # 진행 중인 봉은 초마다 종가가 조금씩 움직임
+        bar = list(ohlcv[last])
+        progress = (now_ms - bar[0]) / MINUTE_MS
+        bar[4] = bar[1] + (bar[4] - bar[1]) * progress
+        bar[2] = max(bar[2], bar[1], bar[4])
+        bar[3] = min(bar[3], bar[1], bar[4])
+        bar[5] = bar[5] * progress
+        payload = ohlcv[last - limit + 1:last] + [bar]
+        recorder.record('ticker', symbol, {'symbol': symbol, 'timestamp': now_ms, 'last': bar[4]},
+                        timestamp=now_ms)
+        recorder.record('ohlcv', symbol, payload, timeframe, timestamp=now_ms)
+    recorder.close()
+    print(f'가짜 기록 생성: {path} ({minutes}분, {minutes * 60}회 수신)')
+
+
+class ManualClock:
+    """재생 시계를 직접 넘기기 위한 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def run_replay(path, speed):
+    """기록 파일을 끝까지 재생하며 update_data 를 반복 호출"""
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # 앱 생성 중 첫 update_data 도 네트워크 대신 기록 파일을 사용
+    os.environ['TRADING_REPLAY'] = path
+    from ui.trading_view import TradingView
+    from utils.perf_monitor import perf_monitor
+
+    view = TradingView()
+    for timer in (view.update_timer, view.time_timer, view.metrics_timer):
+        timer.stop()
+    view.show()
+    app.processEvents()
+
+    clock = ManualClock()
+    view.data_fetcher = ReplayDataFetcher(path, speed=speed, loop=False, clock=clock)
+    polls = int(view.data_fetcher.duration / 1000 / speed / POLL_INTERVAL) + 1
+    perf_monitor.clear()
+
+    start = time.perf_counter()
+    for _ in range(polls):
+        view.update_data()
+        app.processEvents()
+        clock.now += POLL_INTERVAL
+    elapsed = time.perf_counter() - start
+
+    print(f'{polls}회 재생 ({speed:g}배속), 총 {elapsed:.2f}s, 초당 {polls / elapsed:.1f}회 처리\n')
+    print(f"{'stage':<20}{'p50':>10}{'p95':>10}{'p99':>10}{'n':>8}")
+    for name, stats in perf_monitor.summary().items():
+        print(f"{name:<20}{format_seconds(stats['p50']):>10}{format_seconds(stats['p95']):>10}"
+              f"{format_seconds(stats['p99']):>10}{stats['count']:>8}")
+    view.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기록 재생 기반 전체 파이프라인 부하 테스트')
+    parser.add_argument('recording', nargs='?', help='재생할 기록 파일 (.jsonl.gz)')
+    parser.add_argument('--speed', type=float, default=100, help='재생 배속 (1, 10, 100 ...)')
+    parser.add_argument('--synthesize', metavar='PATH', help='가짜 기록 파일 생성')
+    parser.add_argument('--minutes', type=int, default=60, help='가짜 기록 길이 (분)')
+    args = parser.parse_args()
+
+    try:
+        if args.synthesize:
+            write_synthetic_recording(args.synthesize, minutes=args.minutes)
+            return 0
+        if not args.recording:
+            parser.error('재생할 기록 파일을 지정하세요.')
+        run_replay(args.recording, args.speed)
+    finally:
+        shutil.rmtree(_scratch, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+렌더링/데이터 경로 벤치마크
+
+화면 없이(QT_QPA_PLATFORM=offscreen) 가짜 데이터로 주요 경로의 1회당 시간과 최대 메모리를 측정하고,
+저장된 기준값(JSON)과 비교하여 느려진 항목을 표시합니다.
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.run_benchmarks                  # 측정 후 기준값과 비교
+    python -m benchmarks.run_benchmarks --save-baseline  # 현재 결과를 기준값으로 저장
+    python -m benchmarks.run_benchmarks --quick          # 가장 큰 크기는 제외
+    python -m benchmarks.run_benchmarks --only parse     # 이름에 parse 가 들어간 항목만
+"""
+import os
+
+# Qt 를 불러오기 전에 화면 없는 모드로 설정
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.synthetic_data import make_ohlcv, make_candle_data, make_trades, make_daily_profits
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'baseline.json')
+
+# 측정 크기
+BAR_SIZES = (300, 10_000, 1_000_000)
+TRADE_SIZES = (10, 1_000, 100_000)
+PROFIT_SIZES = (7, 30, 365)  # 수익률 차트는 일 단위 점 개수
+
+
+def bench_generate_picture(size):
+    """CandlestickItem.generate_picture - 캔들 QPicture 생성"""
+    from chart.candlestick import CandlestickItem
+    item = CandlestickItem()
+    item.data = make_candle_data(size)
+    return item.generate_picture
+
+
+def bench_profit_chart(size):
+    """TotalProfitChart.update_display - 수익률 꺾은선/마커/텍스트 다시 그리기"""
+    from chart.profit_rate_chart import TotalProfitChart
+    chart = TotalProfitChart()
+    chart.daily_total_profits = make_daily_profits(size)
+    return chart.update_display
+
+
+def bench_profit_chart_tick(size):
+    """TotalProfitChart.set_profits - 오늘 값만 바뀐 경우 (마지막 점만 갱신)"""
+    from chart.profit_rate_chart import TotalProfitChart
+    chart = TotalProfitChart()
+    profits = make_daily_profits(size)
+    chart.set_profits(profits)
+    state = {'tick': 0}
+
+    def tick():
+        state['tick'] += 1
+        date, profit = profits[-1]
+        chart.set_profits(profits[:-1] + [(date, profit + state['tick'] % 10 * 0.01)])
+    return tick
+
+
+def bench_trade_table(size):
+    """TradeHistoryTable.update_trade_history - 거래 기록 테이블 채우기"""
+    from ui.components.trade_history_table import TradeHistoryTable
+    table = TradeHistoryTable()
+    trades = make_trades(size)
+    return lambda: table.update_trade_history(trades)
+
+
+def bench_parse_ohlcv(size):
+    """DataFetcher.parse_ohlcv - 거래소 응답을 DataFrame/캔들 배열로 변환"""
+    from data.data_fetcher import DataFetcher
+    ohlcv = make_ohlcv(size)
+    return lambda: DataFetcher.parse_ohlcv(ohlcv)
+
+
+# (이름, 준비 함수, 크기 목록)
+BENCHMARKS = [
+    ('candlestick.generate_picture', bench_generate_picture, BAR_SIZES),
+    ('profit_chart.update_display', bench_profit_chart, PROFIT_SIZES),
+    ('profit_chart.set_profits_tick', bench_profit_chart_tick, PROFIT_SIZES),
+    ('trade_table.update_trade_history', bench_trade_table, TRADE_SIZES),
+    ('data_fetcher.parse_ohlcv', bench_parse_ohlcv, BAR_SIZES),
+]
+
+
+def measure(op, min_time=0.2, min_repeats=5, max_repeats=50):
+    """
+    1회당 실행 시간(중앙값)과 최대 메모리 측정
+    - 시간: 총 min_time 이상이면서 min_repeats 회 이상, 또는 max_repeats 회가 될 때까지 반복
+      (한 번에 min_time 을 넘는 큰 케이스도 1회 측정값이 중앙값이 되지 않도록)
+    - 메모리: tracemalloc 으로 한 번 더 실행하여 파이썬/numpy 할당 최대치 기록 (Qt 내부 할당은 제외)
+    """
+    app = QApplication.instance()
+    times = []
+    total = 0.0
+    while (total < min_time or len(times) < min_repeats) and len(times) < max_repeats:
+        start = time.perf_counter()
+        op()
+        app.processEvents()
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        total += elapsed
+
+    tracemalloc.start()
+    op()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'seconds': statistics.median(times),
+        'min_seconds': min(times),
+        'repeats': len(times),
+        'peak_bytes': peak,
+    }
+
+
+def run(only=None, quick=False):
+    """모든 벤치마크 실행 후 {키: 결과} 반환"""
+    results = {}
+    for name, setup, sizes in BENCHMARKS:
+        if only and only not in name:
+            continue
+        for size in (sizes[:-1] if quick else sizes):
+            key = f'{name}[{size}]'
+            op = setup(size)
+            result = measure(op)
+            results[key] = result
+            print(f"{key:<48} {format_seconds(result['seconds']):>10}/op  "
+                  f"peak {format_bytes(result['peak_bytes']):>10}  (x{result['repeats']})")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """기준값 대비 느려지거나 메모리가 늘어난 항목 목록 반환"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        time_ratio = result['seconds'] / base['seconds'] if base['seconds'] else 1.0
+        # 메모리는 1MB 미만 차이는 무시
+        memory_grew = result['peak_bytes'] - base['peak_bytes'] > 1024 * 1024
+        memory_ratio = result['peak_bytes'] / base['peak_bytes'] if base['peak_bytes'] else 1.0
+        if time_ratio > 1.0 + tolerance:
+            regressions.append(f'{key}: 시간 {time_ratio:.2f}배 '
+                               f'({format_seconds(base["seconds"])} → {format_seconds(result["seconds"])})')
+        if memory_grew and memory_ratio > 1.0 + tolerance:
+            regressions.append(f'{key}: 메모리 {memory_ratio:.2f}배 '
+                               f'({format_bytes(base["peak_bytes"])} → {format_bytes(result["peak_bytes"])})')
+    return regressions
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f'{seconds:.2f}s'
+    if seconds >= 1e-3:
+        return f'{seconds * 1e3:.2f}ms'
+    return f'{seconds * 1e6:.1f}us'
+
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f'{size:.0f}{unit}'
+        size /= 1024
+    return f'{size:.1f}GB'
+
+
+def load_baseline(path):
+    """기준값 파일 읽기 (없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_results(path, results):
+    """측정 결과를 실행 환경 정보와 함께 JSON 으로 저장"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    data = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='렌더링/데이터 경로 벤치마크')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='기준값 JSON 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='현재 결과를 기준값으로 저장')
+    parser.add_argument('--output', help='현재 결과를 저장할 JSON 경로')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 오차 비율 (기본 0.2 = 20%%)')
+    parser.add_argument('--quick', action='store_true', help='가장 큰 크기 제외')
+    parser.add_argument('--only', help='이름에 이 문자열이 포함된 항목만 실행')
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    results = run(only=args.only, quick=args.quick)
+
+    if args.output:
+        save_results(args.output, results)
+
+    if args.save_baseline:
+        # 일부만 실행한 경우 기존 기준값에 덮어써서 합침
+        baseline = load_baseline(args.baseline)
+        merged = dict(baseline['results']) if baseline else {}
+        merged.update(results)
+        save_results(args.baseline, merged)
+        print(f'기준값 저장: {args.baseline}')
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print('기준값이 없습니다. --save-baseline 으로 먼저 저장하세요.')
+        return 0
+
+    regressions = compare(results, baseline['results'], args.tolerance)
+    if regressions:
+        print('\n⚠️ 성능 저하 감지:')
+        for line in regressions:
+            print(f'  - {line}')
+        return 1
+
+    print('\n✅ 기준값 대비 성능 저하 없음')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+파라미터 스윕 처리량 측정 (작업 프로세스 수별)
+
+가짜 1분봉으로 engine.param_sweep.run_sweep 를 작업 프로세스 수를 바꿔가며 돌리고,
+초당 조합 수와 1개일 때 대비 속도 향상/효율을 표시합니다.
+작업 프로세스 시작 시간(spawn, numpy import)도 포함한 값입니다.
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.sweep_scaling                          # 1년치 1분봉, 1, 2, 4, ... 코어 수
+    python -m benchmarks.sweep_scaling --bars 100000 --workers 1,2,4,8 --strategy Breakout
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.synthetic_data import make_ohlcv
+from engine.param_sweep import SWEEP_GRIDS, run_sweep
+
+
+def default_worker_counts():
+    """1, 2, 4, ... 코어 수"""
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 < cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='파라미터 스윕 처리량 측정')
+    parser.add_argument('--bars', type=int, default=525_600, help='봉 개수 (기본: 1분봉 1년치)')
+    parser.add_argument('--strategy', default='SMA Cross', choices=list(SWEEP_GRIDS), help='전략')
+    parser.add_argument('--workers', help='쉼표로 구분한 작업 프로세스 수 (기본: 1, 2, 4, ... 코어 수)')
+    args = parser.parse_args()
+
+    counts = [int(count) for count in args.workers.split(',')] if args.workers else default_worker_counts()
+    bars = np.asarray(make_ohlcv(args.bars), dtype=np.float64)
+    print(f'{args.strategy} · {args.bars:,}봉 · CPU {os.cpu_count()}개\n')
+    print(f"{'workers':>8}{'조합':>8}{'시간(s)':>10}{'조합/s':>10}{'향상':>8}{'효율':>8}")
+
+    base = None
+    for workers in counts:
+        start = time.perf_counter()
+        done = sum(1 for _ in run_sweep(bars, args.strategy, workers=workers))
+        elapsed = time.perf_counter() - start
+        rate = done / elapsed
+        base = base or rate
+        print(f'{workers:>8}{done:>8}{elapsed:>10.2f}{rate:>10.1f}{rate / base:>7.2f}x{rate / base / workers:>8.0%}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
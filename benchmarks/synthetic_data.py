@@ -0,0 +1,52 @@
+import numpy as np
+
+# 1분봉 간격 (밀리초)
+MINUTE_MS = 60 * 1000
+
+
+def make_ohlcv(count, start_ms=1_700_000_000_000, seed=0):
+    """
+    거래소 응답 형식의 가짜 OHLCV 생성
+    Returns:
+        [[타임스탬프(ms), 시가, 고가, 저가, 종가, 거래량], ...] 리스트
+    """
+    rng = np.random.default_rng(seed)
+    close = 60000.0 + np.cumsum(rng.normal(0, 25, count))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    high = np.maximum(open_, close) + rng.random(count) * 20
+    low = np.minimum(open_, close) - rng.random(count) * 20
+    volume = rng.random(count) * 10
+    timestamps = start_ms + np.arange(count, dtype=np.int64) * MINUTE_MS
+    return np.column_stack((timestamps, open_, high, low, close, volume)).tolist()
+
+
+def make_candle_data(count, seed=0):
+    """CandlestickItem.set_data 형식의 [인덱스, 시가, 고가, 저가, 종가] 배열 생성"""
+    ohlcv = np.asarray(make_ohlcv(count, seed=seed))
+    return np.column_stack((np.arange(count), ohlcv[:, 1:5]))
+
+
+def make_trades(count, seed=0):
+    """TradeHistoryTable.update_trade_history 형식의 가짜 거래 데이터 생성"""
+    rng = np.random.default_rng(seed)
+    quantity = rng.random(count)
+    liq_price = 50000.0 + rng.random(count) * 10000
+    unrealized = rng.normal(0, 5, count)
+    realized = rng.normal(0, 100, count)
+    return [
+        {
+            "coin": f"COIN{i % 500}",
+            "quantity": float(quantity[i]),
+            "liq_price": float(liq_price[i]),
+            "unrealized_pl": float(unrealized[i]),
+            "realized_pl": float(realized[i]),
+        }
+        for i in range(count)
+    ]
+
+
+def make_daily_profits(count, seed=0):
+    """TotalProfitChart.daily_total_profits 형식의 [(날짜, 수익률)] 생성"""
+    rng = np.random.default_rng(seed)
+    profits = np.cumsum(rng.normal(0, 1.5, count))
+    return [(f"{(i // 28) % 12 + 1:02d}/{i % 28 + 1:02d}", float(p)) for i, p in enumerate(profits)]
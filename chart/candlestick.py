@@ -1,7 +1,9 @@
 import pyqtgraph as pg
 from PyQt5.QtGui import QPainter,QColor, QFont
-from PyQt5.QtWidgets import QGraphicsDropShadowEffect
+from PyQt5.QtWidgets import QGraphicsDropShadowEffect, QGraphicsItem
 from PyQt5.QtCore import Qt
+
+from utils.perf_monitor import perf_monitor
 \
 
 class CandlestickItem(pg.GraphicsObject):
@@ -10,6 +12,8 @@ class CandlestickItem(pg.GraphicsObject):
         self.picture = None
         self.data = None
         self.time_axis = None
+        # 십자선처럼 위에 겹친 아이템이 움직일 때 QPicture 를 다시 재생하지 않고 캐시된 이미지를 사용
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
     def set_data(self, data, timestamps=None):
         """
@@ -27,6 +31,10 @@ class CandlestickItem(pg.GraphicsObject):
         if self.data is None:
             return
 
+        with perf_monitor.stage('generate_picture'):
+            self._draw_picture()
+
+    def _draw_picture(self):
         # 봉의 너비 설정 (시간 간격의 60%)
         w = 0.6
         self.picture = pg.QtGui.QPicture()
@@ -48,23 +56,48 @@ class CandlestickItem(pg.GraphicsObject):
     def paint(self, p, *args):
         # 캔들스틱 실제로 화면에 그리기
         if self.picture is not None:
-            self.picture.play(p)
+            with perf_monitor.stage('paint_candles'):
+                self.picture.play(p)
 
     def boundingRect(self):
         # 그래프 영역 계산
         # 데이터 없으면 빈 영역 반환
         if self.data is None:
             return pg.QtCore.QRectF()
-        # 전체 데이터 범위에 맞게 영역 계산해서 반환
+        # 전체 데이터 범위에 맞게 영역 계산해서 반환 (x 는 그릴 때와 같은 0 부터의 인덱스)
         return pg.QtCore.QRectF(
-            self.data[:, 0].min(),
+            0,
             self.data[:, 3].min(),
-            self.data[:, 0].max() - self.data[:, 0].min(),
+            len(self.data) - 1,
             self.data[:, 2].max() - self.data[:, 3].min()
         )
 
+def tint_chart(chart_widget, colors, axis_width=2, blur=15, add_glow=True):
+    """
+    차트 하나에 테마 색 적용 - 배경, 축 선/글자, 네온 그림자
+    그림자가 이미 있으면 색만 바꿈 (테마 전환 때 다시 불러도 효과가 쌓이지 않음)
+    add_glow=False 이면 그림자가 없는 차트에는 새로 만들지 않음
+    """
+    chart_widget.setBackground(QColor(colors['chart_bg']))
+    for name in ('left', 'bottom'):
+        axis = chart_widget.getAxis(name)
+        axis.setPen(pg.mkPen(color=colors['border_soft'], width=axis_width))
+        axis.setTextPen(colors['accent_soft'])
+
+    glow = chart_widget.graphicsEffect()
+    if not isinstance(glow, QGraphicsDropShadowEffect):
+        if not add_glow:
+            return
+        glow = QGraphicsDropShadowEffect()
+        glow.setBlurRadius(blur)
+        glow.setOffset(0, 0)
+        chart_widget.setGraphicsEffect(glow)
+    glow.setColor(QColor(colors['highlight_soft']))
+
+
 def apply_matching_neon_style(trading_view):
-    """수익률 차트와 동일한 네온 스타일을 캔들스틱 차트에 적용 - 부드러운 테두리"""
+    """수익률 차트와 동일한 스타일을 캔들스틱 차트에 적용 - 색은 지금 테마(palette)에서 가져옴"""
+    from ui.theme import palette
     
     # 전역 app_font_name을 가져오기 시도
     try:
@@ -74,86 +107,29 @@ def apply_matching_neon_style(trading_view):
         # 가져오기 실패 시 기본값 사용
         app_font_name = "NanumSquareOTF_acR"  
     
-    # 소프트한 네온 색상 정의 (더 어둡고 덜 눈아픈 버전)
-    dark_bg = "#0F0326"              # 매우 어두운 보라색 배경
-    soft_pink = "#AA0A80"            # 부드러운 핑크 테두리 (더 어두움)
-    soft_purple = "#5E1387"          # 부드러운 보라색 (더 어두움)
-    soft_cyan = "#077A8F"            # 부드러운 청록색 (더 어두움)
-    soft_yellow = "#B3AD33"          # 부드러운 노랑색 (더 어두움)
-    
-    # 캔들스틱 차트 스타일 설정
-    trading_view.left_chart_widget.setBackground(QColor(dark_bg))
-    
-    # 축 스타일 설정 - 부드러운 색상으로 변경
-    trading_view.left_chart_widget.getAxis('left').setPen(pg.mkPen(color=soft_pink, width=2))
-    trading_view.left_chart_widget.getAxis('bottom').setPen(pg.mkPen(color=soft_pink, width=2))
-    trading_view.left_chart_widget.getAxis('left').setTextPen(soft_cyan)
-    trading_view.left_chart_widget.getAxis('bottom').setTextPen(soft_cyan)
+    # 배경, 축 선/글자, 부드러운 네온 그림자 (네온 테마: 어두운 보라 배경, 부드러운 핑크 축, 청록 글자)
+    tint_chart(trading_view.left_chart_widget, palette())
     
     # 축 라벨 폰트 설정
     axis_font = QFont(app_font_name, 8)
     trading_view.left_chart_widget.getAxis('left').setTickFont(axis_font)
     trading_view.left_chart_widget.getAxis('bottom').setTickFont(axis_font)
     
-    # 그리드 설정 - 부드러운 보라색 점선
-    grid_color = QColor(soft_purple)
-    grid_color.setAlpha(77)  # 30% 투명도
-    grid_pen = pg.mkPen(color=grid_color, width=1, style=Qt.DotLine)
+    # 그리드 - 30% 투명도
     trading_view.left_chart_widget.showGrid(x=True, y=True, alpha=0.3)
     
-    # 테두리 설정 - 더 부드러운 색상과 투명도 적용
-    trading_view.left_chart_widget.setStyleSheet(f'''
-        border: 2px solid {soft_pink};
-        border-radius: 10px;
-    ''')
-    
-    # 부드러운 네온 효과 추가 - 더 낮은 블러와 더 낮은 투명도
-    glow = QGraphicsDropShadowEffect()
-    glow.setBlurRadius(15)  # 블러 줄임
-    glow.setColor(QColor(soft_purple))
-    glow.setOffset(0, 0)
-    trading_view.left_chart_widget.setGraphicsEffect(glow)
+    # 테두리는 테마 스타일시트의 QGraphicsView#price_chart 규칙
 
 # TotalProfitChart에도 같은 스타일 적용하는 함수
 def apply_soft_neon_to_profit_chart(profit_chart):
-    """수익률 차트에 부드러운 네온 스타일 적용"""
-    from PyQt5.QtGui import QColor, QFont, QGraphicsDropShadowEffect
-    from PyQt5.QtCore import Qt
-    import pyqtgraph as pg
-    
-    # 전역 app_font_name 기본값
-    app_font_name = "NanumSquareOTF_acR"
-    
-    # 소프트한 네온 색상 정의
-    dark_bg = "#0F0326"              # 매우 어두운 보라색 배경
-    soft_pink = "#AA0A80"            # 부드러운 핑크 테두리
-    soft_purple = "#5E1387"          # 부드러운 보라색
-    soft_cyan = "#077A8F"            # 부드러운 청록색
-    soft_yellow = "#B3AD33"          # 부드러운 노랑색
+    """수익률 차트에 지금 테마(palette)의 부드러운 네온 스타일 적용"""
+    from ui.theme import palette
     
     chart_widget = profit_chart.get_widget()
+    tint_chart(chart_widget, palette())
     
-    # 배경색 설정
-    chart_widget.setBackground(QColor(dark_bg))
-    
-    # 축 스타일 설정
-    chart_widget.getAxis('left').setPen(pg.mkPen(color=soft_pink, width=2))
-    chart_widget.getAxis('bottom').setPen(pg.mkPen(color=soft_pink, width=2))
-    chart_widget.getAxis('left').setTextPen(soft_cyan)
-    chart_widget.getAxis('bottom').setTextPen(soft_cyan)
-    
-    # 테두리 설정
-    chart_widget.setStyleSheet(f'''
-        border: 2px solid {soft_pink};
-        border-radius: 10px;
-    ''')
-    
-    # 부드러운 네온 효과 추가
-    glow = QGraphicsDropShadowEffect()
-    glow.setBlurRadius(15)
-    glow.setColor(QColor(soft_purple))
-    glow.setOffset(0, 0)
-    chart_widget.setGraphicsEffect(glow)
+    # 테두리는 테마 스타일시트의 QGraphicsView#profit_chart 규칙
+    chart_widget.setObjectName("profit_chart")
     
     # 차트 업데이트하여 변경사항 적용
     profit_chart.update_display()
\ No newline at end of file
@@ -0,0 +1,165 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+
+from utils.perf_monitor import perf_monitor
+
+# 한국 시간(KST) = UTC+9
+KST = timedelta(hours=9)
+EPOCH = datetime(1970, 1, 1)
+
+
+def nearest_index(xs, x):
+    """정렬된 xs 에서 x 에 가장 가까운 위치 (이진 탐색, O(log n)), 비어 있으면 None"""
+    n = len(xs)
+    if n == 0:
+        return None
+    i = int(np.searchsorted(xs, x))
+    if i <= 0:
+        return 0
+    if i >= n:
+        return n - 1
+    return i if xs[i] - x < x - xs[i - 1] else i - 1
+
+
+def format_value(value, digits=1):
+    """지표 값 표시 (계산 전 구간의 NaN 은 '-')"""
+    return '-' if not np.isfinite(value) else f'{value:,.{digits}f}'
+
+
+class Crosshair:
+    """
+    캔들 차트 십자선 + 커서 아래 봉의 OHLCV/시간/지표 값 표시
+
+    - 마우스 이동은 SignalProxy 로 화면 주기(rate_limit 회/초)에 맞춰 모아서 처리
+    - 커서 x 에 해당하는 봉은 정렬된 x 좌표 배열에서 이진 탐색 (봉 수와 무관하게 O(log n))
+    - 선과 축 레이블은 위치만 옮기는 별도 아이템이라 캔들 그림을 다시 만들지 않음
+    """
+
+    PEN_COLOR = '#0AFFE6'
+    LABEL_TEXT_COLOR = '#0F0326'
+    UP_COLOR = '#39FF14'
+    DOWN_COLOR = '#FF2D2D'
+
+    def __init__(self, plot_widget, linked_charts=(), rate_limit=60):
+        """
+        Args:
+            plot_widget: 십자선을 표시할 캔들 차트 PlotWidget
+            linked_charts: x 축을 공유하는 차트 (세로선만 같이 표시)
+            rate_limit: 마우스 이동 처리 최대 횟수 (초당)
+        """
+        self.plot_widget = plot_widget
+        self.view_box = plot_widget.getViewBox()
+
+        pen = pg.mkPen(self.PEN_COLOR, width=1, style=Qt.DashLine)
+        self.v_line = pg.InfiniteLine(angle=90, movable=False, pen=pen)
+        self.h_line = pg.InfiniteLine(angle=0, movable=False, pen=pen)
+        self.linked_lines = [pg.InfiniteLine(angle=90, movable=False, pen=pen) for _ in linked_charts]
+
+        # 축을 따라 움직이는 가격/시간 레이블과 봉 정보
+        label_brush = pg.mkBrush(self.PEN_COLOR)
+        self.price_label = pg.TextItem(anchor=(1, 0.5), color=self.LABEL_TEXT_COLOR, fill=label_brush)
+        self.time_label = pg.TextItem(anchor=(0.5, 1), color=self.LABEL_TEXT_COLOR, fill=label_brush)
+        self.info_label = pg.TextItem(anchor=(0, 0), fill=pg.mkBrush(15, 3, 38, 200))
+
+        font = QFont()
+        font.setPointSize(8)
+        for label in (self.price_label, self.time_label, self.info_label):
+            label.setFont(font)
+
+        for item in (self.v_line, self.h_line, self.price_label, self.time_label, self.info_label):
+            item.setZValue(20)
+            plot_widget.addItem(item, ignoreBounds=True)
+        for chart, line in zip(linked_charts, self.linked_lines):
+            line.setZValue(20)
+            chart.addItem(line, ignoreBounds=True)
+
+        self.xs = None
+        self.timestamps = None
+        self.columns = None
+        self.indicators = {}
+        self.index = None  # 정보가 표시 중인 봉 위치
+        self.set_visible(False)
+
+        self.proxy = pg.SignalProxy(plot_widget.scene().sigMouseMoved, rateLimit=rate_limit,
+                                    slot=self.mouse_moved)
+
+    def set_data(self, timestamps, open_, high, low, close, volume, indicators=None, xs=None):
+        """
+        표시할 봉 설정 (배열은 복사하지 않고 참조만 보관)
+        Args:
+            timestamps: 봉 시작 시각 (UTC ms)
+            indicators: {표시 이름: 봉과 같은 인덱스의 값 배열}
+            xs: 봉의 x 좌표 (정렬됨), None 이면 0 부터의 인덱스
+        """
+        self.timestamps = timestamps
+        self.columns = (open_, high, low, close, volume)
+        self.indicators = indicators or {}
+        self.xs = np.arange(len(timestamps)) if xs is None else xs
+        # 커서가 그대로여도 진행 중인 봉 값이 바뀌었을 수 있으므로 다시 표시
+        if self.index is not None and self.v_line.isVisible() and len(timestamps):
+            self.index = min(self.index, len(timestamps) - 1)
+            self.update_info(self.index)
+
+    def set_visible(self, visible):
+        for item in [self.v_line, self.h_line, self.price_label, self.time_label,
+                     self.info_label] + self.linked_lines:
+            item.setVisible(visible)
+        if not visible:
+            self.index = None
+
+    def mouse_moved(self, event):
+        """SignalProxy 가 모아서 전달한 마지막 마우스 위치 처리"""
+        position = event[0]
+        if self.xs is None or len(self.xs) == 0 \
+                or not self.view_box.sceneBoundingRect().contains(position):
+            if self.v_line.isVisible():
+                self.set_visible(False)
+            return
+
+        with perf_monitor.stage('crosshair'):
+            point = self.view_box.mapSceneToView(position)
+            index = nearest_index(self.xs, point.x())
+            x = float(self.xs[index])
+            (x_min, x_max), (y_min, y_max) = self.view_box.viewRange()
+
+            self.v_line.setPos(x)
+            for line in self.linked_lines:
+                line.setPos(x)
+            self.h_line.setPos(point.y())
+            self.price_label.setText(f'{point.y():,.1f}')
+            self.price_label.setPos(x_max, point.y())
+            self.time_label.setPos(x, y_min)
+            self.info_label.setPos(x_min, y_max)
+
+            if index != self.index:
+                self.update_info(index)
+            if not self.v_line.isVisible():
+                self.set_visible(True)
+
+    def update_info(self, index):
+        """index 번째 봉의 시간/OHLCV/지표 값 표시"""
+        self.index = index
+        moment = EPOCH + timedelta(milliseconds=int(self.timestamps[index])) + KST
+        self.time_label.setText(moment.strftime('%m-%d %H:%M:%S'))
+
+        open_, high, low, close, volume = (float(column[index]) for column in self.columns)
+        change = (close - open_) / open_ * 100 if open_ else 0.0
+        color = self.UP_COLOR if close >= open_ else self.DOWN_COLOR
+        lines = [
+            f'<span style="color:#e6e9ef">{moment:%Y-%m-%d %H:%M:%S}</span>',
+            f'<span style="color:{color}">O {open_:,.1f}  H {high:,.1f}  L {low:,.1f}  '
+            f'C {close:,.1f}  ({change:+.2f}%)</span>',
+            f'<span style="color:#e6e9ef">V {volume:,.4f}</span>',
+        ]
+        values = []
+        for name, series in self.indicators.items():
+            # 지표 배열이 봉보다 짧으면 뒤쪽(최근)을 맞춤
+            i = index - (len(self.timestamps) - len(series))
+            values.append(f'{name} {format_value(float(series[i])) if 0 <= i < len(series) else "-"}')
+        if values:
+            lines.append(f'<span style="color:{self.PEN_COLOR}">{"  ".join(values)}</span>')
+        self.info_label.setHtml('<br>'.join(lines))
@@ -0,0 +1,97 @@
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
+
+from utils.perf_monitor import perf_monitor
+
+# ✅ NanumSquareOTF_acR 폰트 적용
+app_font_name = "NanumSquareOTF_acR"
+
+
+def step_series(prices, cumulative):
+    """누적 수량을 계단 모양으로 그리기 위한 (x, y) 배열"""
+    if len(prices) == 0:
+        return np.empty(0), np.empty(0)
+    x = np.repeat(prices, 2)[1:]
+    y = np.repeat(cumulative, 2)[:-1]
+    # 최우선 호가에서 0 부터 시작
+    return np.concatenate(([prices[0]], x)), np.concatenate(([0.0], y))
+
+
+class DepthChart(QWidget):
+    """
+    누적 호가 깊이 차트 + 최우선 매수/매도 호가, 스프레드 표시
+
+    - OrderBook.depth() 가 미리 계산한 누적 수량을 그대로 계단 곡선으로 그림
+    - 매수(왼쪽)는 형광 연두, 매도(오른쪽)는 형광 빨강
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 지금 테마(palette)의 색 (네온: 어두운 보라 배경, 부드러운 핑크 축, 청록 글자, 형광 연두/빨강)
+        from ui.theme import palette
+        colors = palette()
+        dark_bg = colors['chart_bg']
+        soft_pink = colors['border_soft']
+        soft_cyan = colors['accent_soft']
+        neon_green = colors['up']    # 매수
+        neon_red = colors['down']    # 매도
+
+        self.spread_label = QLabel('호가 대기 중')
+        self.spread_label.setObjectName("depth_spread_label")  # 글자 색/크기는 테마 스타일시트
+
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setBackground(QColor(dark_bg))
+        self.plot_widget.hideButtons()
+        self.plot_widget.setMenuEnabled(False)
+        self.plot_widget.setMouseEnabled(x=False, y=False)
+        self.plot_widget.showGrid(x=False, y=True, alpha=0.2)
+        axis_font = QFont(app_font_name, 7)
+        for name in ('left', 'bottom'):
+            axis = self.plot_widget.getAxis(name)
+            axis.setTickFont(axis_font)
+            axis.setPen(pg.mkPen(color=soft_pink, width=1))
+            axis.setTextPen(soft_cyan)
+        self.plot_widget.getAxis('left').setWidth(35)
+
+        bid_fill = QColor(neon_green)
+        bid_fill.setAlpha(60)
+        ask_fill = QColor(neon_red)
+        ask_fill.setAlpha(60)
+        self.bid_curve = self.plot_widget.plot(pen=pg.mkPen(neon_green, width=1.5),
+                                               fillLevel=0, brush=bid_fill, skipFiniteCheck=True)
+        self.ask_curve = self.plot_widget.plot(pen=pg.mkPen(neon_red, width=1.5),
+                                               fillLevel=0, brush=ask_fill, skipFiniteCheck=True)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 2, 4, 4)
+        layout.setSpacing(0)
+        layout.addWidget(self.spread_label)
+        layout.addWidget(self.plot_widget)
+
+    def set_depth(self, depth):
+        """
+        깊이 차트 갱신
+        Args:
+            depth: OrderBook.depth() 결과
+        """
+        with perf_monitor.stage('depth_chart'):
+            self.bid_curve.setData(*step_series(depth['bid_prices'], depth['bid_cumulative']))
+            self.ask_curve.setData(*step_series(depth['ask_prices'], depth['ask_cumulative']))
+
+            best_bid, best_ask = depth['best_bid'], depth['best_ask']
+            if best_bid is None or best_ask is None:
+                self.spread_label.setText('호가 없음')
+                return
+            spread = best_ask[0] - best_bid[0]
+            mid = (best_ask[0] + best_bid[0]) / 2
+            self.spread_label.setText(
+                f'매수 {best_bid[0]:,.1f}  매도 {best_ask[0]:,.1f}  '
+                f'스프레드 {spread:,.2f} ({spread / mid * 1e4:.2f}bp)'
+            )
+
+    def set_status(self, status):
+        """재동기화 등 상태 표시"""
+        if status != 'synced':
+            self.spread_label.setText(status)
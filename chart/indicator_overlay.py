@@ -0,0 +1,117 @@
+import pyqtgraph as pg
+from PyQt5.QtCore import Qt
+import numpy as np
+
+
+class IndicatorOverlay:
+    """
+    IndicatorEngine 결과를 차트에 표시
+    - 가격 차트 위 오버레이: SMA, EMA, 볼린저 밴드, VWAP
+    - 보조 차트(서브 패널): RSI 또는 MACD
+    """
+
+    @staticmethod
+    def colors():
+        """지표별 선 색상 - 지금 테마(palette)에서 가져옴 (네온: 노랑/청록/보라/핑크)"""
+        from ui.theme import palette
+        c = palette()
+        return {
+            'sma': c['sma'],
+            'ema': c['accent'],
+            'bb': c['highlight'],
+            'vwap': c['border'],
+            'rsi': c['accent'],
+            'macd': c['accent'],
+            'macd_signal': c['border'],
+            'guide': c['highlight_soft'],
+            'up': c['up'],
+            'down': c['down'],
+        }
+
+    def __init__(self, price_chart, sub_chart):
+        """
+        Args:
+            price_chart: 캔들 차트 PlotWidget (오버레이 대상)
+            sub_chart: RSI/MACD 를 그릴 보조 PlotWidget
+        """
+        self.price_chart = price_chart
+        self.sub_chart = sub_chart
+        self.sub_type = 'RSI'
+
+        # 오버레이 선 (NaN 구간은 끊어서 그림, 색은 apply_theme_colors 에서)
+        self.sma_line = price_chart.plot(connect='finite')
+        self.ema_line = price_chart.plot(connect='finite')
+        self.vwap_line = price_chart.plot(connect='finite')
+        self.bb_upper = price_chart.plot(connect='finite')
+        self.bb_lower = price_chart.plot(connect='finite')
+        for item in (self.sma_line, self.ema_line, self.vwap_line, self.bb_upper, self.bb_lower):
+            item.setZValue(5)
+
+        # 보조 차트 - RSI
+        self.rsi_line = sub_chart.plot(connect='finite')
+        self.rsi_guides = [sub_chart.addLine(y=70), sub_chart.addLine(y=30)]
+
+        # 보조 차트 - MACD (히스토그램 + MACD/시그널 선)
+        self.macd_hist = pg.BarGraphItem(x=[], height=[], width=0.6)
+        sub_chart.addItem(self.macd_hist)
+        self.macd_line = sub_chart.plot(connect='finite')
+        self.macd_signal = sub_chart.plot(connect='finite')
+        self.hist_colors = None  # (상승, 하락) 히스토그램 색
+
+        self.apply_theme_colors()
+        self.set_sub_type(self.sub_type)
+
+    def apply_theme_colors(self):
+        """테마 전환 - 모든 지표 선 색을 지금 테마 색으로 (히스토그램은 다음 갱신부터)"""
+        colors = self.colors()
+        self.sma_line.setPen(pg.mkPen(colors['sma'], width=1))
+        self.ema_line.setPen(pg.mkPen(colors['ema'], width=1))
+        self.vwap_line.setPen(pg.mkPen(colors['vwap'], width=1, style=Qt.DashLine))
+        bb_pen = pg.mkPen(colors['bb'], width=1)
+        self.bb_upper.setPen(bb_pen)
+        self.bb_lower.setPen(bb_pen)
+        self.rsi_line.setPen(pg.mkPen(colors['rsi'], width=1))
+        guide_pen = pg.mkPen(colors['guide'], width=1, style=Qt.DashLine)
+        for guide in self.rsi_guides:
+            guide.setPen(guide_pen)
+        self.macd_line.setPen(pg.mkPen(colors['macd'], width=1))
+        self.macd_signal.setPen(pg.mkPen(colors['macd_signal'], width=1))
+        self.hist_colors = (colors['up'], colors['down'])
+
+    def set_sub_type(self, sub_type):
+        """보조 차트 종류 선택 ('RSI' 또는 'MACD')"""
+        self.sub_type = sub_type
+        is_rsi = sub_type == 'RSI'
+        for item in [self.rsi_line] + self.rsi_guides:
+            item.setVisible(is_rsi)
+        for item in (self.macd_hist, self.macd_line, self.macd_signal):
+            item.setVisible(not is_rsi)
+        if is_rsi:
+            self.sub_chart.setYRange(0, 100, padding=0.05)
+        else:
+            self.sub_chart.enableAutoRange(axis='y')
+
+    def set_data(self, engine, length):
+        """
+        엔진의 최근 length 개 지표 값을 차트에 반영 (캔들 버퍼와 같은 x 인덱스)
+        Args:
+            engine: IndicatorEngine 인스턴스
+            length: 캔들 버퍼 길이
+        """
+        x = np.arange(min(length, engine.size))
+
+        self.sma_line.setData(x, engine.window_view('sma', length))
+        self.ema_line.setData(x, engine.window_view('ema', length))
+        self.vwap_line.setData(x, engine.window_view('vwap', length))
+        self.bb_upper.setData(x, engine.window_view('bb_upper', length))
+        self.bb_lower.setData(x, engine.window_view('bb_lower', length))
+
+        # 보이는 보조 지표만 갱신
+        if self.sub_type == 'RSI':
+            self.rsi_line.setData(x, engine.window_view('rsi', length))
+        else:
+            hist = np.nan_to_num(engine.window_view('macd_hist', length))
+            brushes = np.where(hist >= 0, *self.hist_colors)
+            self.macd_hist.setOpts(x=x, height=hist, width=0.6, brushes=list(brushes), pen=None)
+            self.macd_line.setData(x, engine.window_view('macd', length))
+            self.macd_signal.setData(x, engine.window_view('macd_signal', length))
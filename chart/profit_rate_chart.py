@@ -13,16 +13,21 @@ class TotalProfitChart:
     def __init__(self):
         self.chart_widget = self._setup_base_chart()
         self.daily_total_profits = []  # [(날짜, 수익률)] 형태로 저장
+        # update_display 가 만든 항목 (오늘 값만 바뀌면 마지막 항목만 고쳐서 다시 그림)
+        self.segments = []  # 구간 꺾은선
+        self.markers = []   # 점 마커
+        self.texts = []     # 수익률 글자
+        self.y_range = None
         
     def _setup_base_chart(self):
-        """차트 기본 설정 - 부드러운 네온 테마 적용"""
-        # 부드러운 네온 색상 정의
-        dark_bg = "#0F0326"              # 매우 어두운 보라색 배경
-        soft_pink = "#AA0A80"            # 부드러운 핑크 테두리 (더 어두움)
-        soft_purple = "#5E1387"          # 부드러운 보라색 (더 어두움)
-        soft_cyan = "#077A8F"            # 부드러운 청록색 (더 어두움)
-        soft_yellow = "#B3AD33"          # 부드러운 노랑색 (더 어두움)
-        neon_green = "#39FF14"           # 형광 연두색 (이미 밝아서 그대로 유지)
+        """차트 기본 설정 - 지금 테마(palette)의 부드러운 색 적용"""
+        from ui.theme import palette
+        colors = palette()
+        dark_bg = colors['chart_bg']            # 네온: 매우 어두운 보라색 배경
+        soft_pink = colors['border_soft']       # 네온: 부드러운 핑크 테두리
+        soft_purple = colors['highlight_soft']  # 네온: 부드러운 보라색
+        soft_cyan = colors['accent_soft']       # 네온: 부드러운 청록색
+        soft_yellow = colors['selected_text']   # 네온: 부드러운 노랑색
         
         chart = pg.PlotWidget()
         chart.setBackground(QColor(dark_bg))  # 어두운 보라색 배경
@@ -75,20 +80,76 @@ class TotalProfitChart:
         glow.setOffset(0, 0)
         chart.setGraphicsEffect(glow)
         
-        # 테두리 설정 - 부드러운 핑크
-        chart.setStyleSheet(f'''
-            border: 2px solid {soft_pink};
-            border-radius: 10px;
-        ''')
+        # 테두리는 테마 스타일시트의 QGraphicsView#profit_chart 규칙
+        chart.setObjectName("profit_chart")
 
         return chart
 
+    def set_profits(self, daily_total_profits):
+        """
+        일별 수익률 반영 - 바뀐 부분만 다시 그림
+        날짜 목록이 같고 오늘(마지막) 값만 바뀌었으면 마지막 점만 갱신, 새 날이 추가되면 전체를 다시 그림
+        Returns:
+            다시 그렸으면 True
+        """
+        old = self.daily_total_profits
+        if daily_total_profits == old:
+            return False
+        self.daily_total_profits = daily_total_profits
+        same_days = (len(old) == len(daily_total_profits) and len(self.markers) == len(old)
+                     and old[:-1] == daily_total_profits[:-1] and old[-1][0] == daily_total_profits[-1][0])
+        if same_days:
+            self.update_last_point()
+        else:
+            self.update_display()
+        return True
+
+    @staticmethod
+    def _y_range(profits):
+        min_val = min(profits) * 1.2 if min(profits) < 0 else -5
+        max_val = max(profits) * 1.2 if profits else 10
+        return min_val, max_val
+
+    @staticmethod
+    def _text_position(profit, max_val):
+        """수익률 글자 위치 (양수는 점 위, 음수는 점 아래)"""
+        offset = max_val * 0.03
+        return profit + offset if profit >= 0 else profit - offset
+
+    def update_last_point(self):
+        """오늘 값만 바뀐 경우 - 마지막 구간/마커/글자만 고침 (전체를 지우고 다시 만들지 않음)"""
+        neon_green = "#39FF14"
+        neon_red = "#FF2D2D"
+        profits = [data[1] for data in self.daily_total_profits]
+        last = len(profits) - 1
+        profit = profits[-1]
+        color = neon_green if profit >= 0 else neon_red
+
+        if self.segments:
+            previous = profits[-2]
+            self.segments[-1].setData([last - 1, last], [previous, profit])
+            self.segments[-1].setPen(pg.mkPen(color=neon_green if profit >= previous else neon_red, width=2))
+        self.markers[-1].setData([last], [profit], symbolBrush=color)
+
+        # 범위가 바뀌면 글자 간격도 바뀌므로 모든 글자 위치 재계산 (최대 며칠치라 가벼움)
+        y_range = self._y_range(profits)
+        if y_range != self.y_range:
+            self.y_range = y_range
+            self.chart_widget.setYRange(*y_range, padding=0.1)
+            for i, text_item in enumerate(self.texts[:-1]):
+                text_item.setPos(i, self._text_position(profits[i], y_range[1]))
+        text_item = self.texts[-1]
+        text_item.setText(f'{profit:+.1f}%', color=color)
+        text_item.setAnchor((0.5, 1 if profit >= 0 else 0))
+        text_item.setPos(last, self._text_position(profit, self.y_range[1]))
+
     def update_display(self):
         """✅ 꺾은선 그래프로 수익률 표시 - 형광색으로 업데이트"""
         if not self.daily_total_profits:
             return
 
         self.chart_widget.clear()
+        self.segments, self.markers, self.texts = [], [], []
         
         # 네온 색상 정의
         neon_green = "#39FF14"   # 형광 연두색
@@ -106,8 +167,7 @@ class TotalProfitChart:
         self.chart_widget.getAxis('bottom').setTicks([list(enumerate(dates))])
 
         # ✅ Y축 범위 자동 조정
-        min_val = min(profits) * 1.2 if min(profits) < 0 else -5
-        max_val = max(profits) * 1.2 if profits else 10
+        min_val, max_val = self.y_range = self._y_range(profits)
         self.chart_widget.setYRange(min_val, max_val, padding=0.1)
 
         # ✅ 꺾은선 그래프 그리기 - 형광색 적용
@@ -120,28 +180,27 @@ class TotalProfitChart:
 
             pen = line_pen if next_profit >= current_profit else line_pen_red
 
-            self.chart_widget.plot(
+            self.segments.append(self.chart_widget.plot(
                 [x[i], x[i + 1]], [current_profit, next_profit],
                 pen=pen, antialias=True
-            )
+            ))
 
         # ✅ 마커 & 텍스트 추가 - 형광색 적용
-        offset = max_val * 0.03  
         for i, profit in enumerate(profits):
             marker_color = neon_green if profit >= 0 else neon_red
 
             # 마커 추가 (동그라미)
-            self.chart_widget.plot(
+            self.markers.append(self.chart_widget.plot(
                 [i], [profit],
                 pen=pg.mkPen('#FFFFFF', width=0.5),
                 symbol='o',
                 symbolSize=5,
                 symbolBrush=marker_color,
                 symbolPen=pg.mkPen('#FFFFFF', width=0.5)
-            )
+            ))
 
             # ✅ 위/아래 정렬 유지
-            text_y = profit + offset if profit >= 0 else profit - offset
+            text_y = self._text_position(profit, max_val)
             anchor_y = 1 if profit >= 0 else 0
 
             # ✅ NanumSquareOTF_acR 폰트 적용 & 색상 변경
@@ -154,6 +213,7 @@ class TotalProfitChart:
             text_item.setFont(QFont(app_font_name, 9))
             text_item.setPos(i, text_y)
             self.chart_widget.addItem(text_item)
+            self.texts.append(text_item)
 
     def get_widget(self):
         """차트 위젯 반환"""
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+# 한국 시간(KST) = UTC+9
+KST_OFFSET_MINUTES = 9 * 60
+
+# 눈금 간격 후보 (분)
+TICK_STEPS = (1, 5, 10, 15, 30, 60, 120, 240, 360, 720, 1440, 10080)
+
+
+def kst_time_ticks(timestamps_ms, step_minutes=30, fmt='%H:%M'):
+    """
+    한국 시간 기준으로 step_minutes 의 배수인 봉에만 시간 레이블 생성
+    (초 단위 봉처럼 한 분에 봉이 여러 개면 그 분의 첫 봉에만 표시)
+    Args:
+        timestamps_ms: 봉 시작 시각 배열 (UTC ms)
+        step_minutes: 레이블 간격 (예: 30 → 정각/30분)
+        fmt: 레이블 형식
+    Returns:
+        [(x 인덱스, 레이블), ...] - AxisItem.setTicks 형식
+    """
+    timestamps_ms = np.asarray(timestamps_ms, dtype=np.int64)
+    kst_minutes = timestamps_ms // 60000 + KST_OFFSET_MINUTES
+    first_in_minute = np.diff(kst_minutes, prepend=kst_minutes[:1] - 1) != 0
+    label_index = np.flatnonzero((kst_minutes % step_minutes == 0) & first_in_minute)
+    if len(label_index) == 0:
+        return []
+    labels = pd.to_datetime(kst_minutes[label_index] * 60000, unit='ms').strftime(fmt)
+    return list(zip(label_index.tolist(), labels))
+
+
+def tick_step_for(timestamps_ms, max_labels=6):
+    """레이블이 max_labels 개 이하가 되는 가장 작은 눈금 간격 (분)"""
+    if len(timestamps_ms) < 2:
+        return TICK_STEPS[0]
+    span_minutes = (int(timestamps_ms[-1]) - int(timestamps_ms[0])) / 60000
+    for step in TICK_STEPS:
+        if span_minutes / step <= max_labels:
+            return step
+    return TICK_STEPS[-1]
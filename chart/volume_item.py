@@ -0,0 +1,153 @@
+import pyqtgraph as pg
+from PyQt5.QtCore import QRectF
+import numpy as np
+
+from utils.perf_monitor import perf_monitor
+
+
+def visible_index_range(item, count, margin=1):
+    """
+    아이템이 속한 ViewBox 의 X 범위에 들어오는 인덱스 구간 [start, end)
+    Args:
+        item: ViewBox 에 추가된 GraphicsObject
+        count: 전체 데이터 개수
+        margin: 양 끝에 여유로 더 포함할 봉 개수
+    """
+    view_box = item.getViewBox()
+    if view_box is None or count == 0:
+        return 0, count
+    x_min, x_max = view_box.viewRange()[0]
+    start = max(0, int(np.floor(x_min)) - margin)
+    end = min(count, int(np.ceil(x_max)) + 1 + margin)
+    return start, max(start, end)
+
+
+class VolumeItem(pg.GraphicsObject):
+    """
+    거래량 막대를 한 개의 아이템으로 그리는 클래스
+
+    - 화면에 보이는 봉만 상승/하락 두 개의 QPainterPath 로 한 번에 생성 (벡터 연산)
+    - 확정된 봉의 경로는 보이는 구간이 바뀔 때만 다시 생성
+    - 진행 중인 마지막 봉은 따로 그려서, 실시간 갱신 시 마지막 막대만 바뀜
+    """
+
+    def __init__(self, width=0.6):
+        pg.GraphicsObject.__init__(self)
+        self.width = width
+        self.volume = None   # 거래량 배열
+        self.rising = None   # 상승 봉 여부 (종가 >= 시가)
+        self.max_volume = 0.0
+
+        self.up_brush = None    # 상승 (네온: 형광 연두색)
+        self.down_brush = None  # 하락 (네온: 형광 빨간색)
+        self.apply_theme_colors()
+
+        # 확정된 봉 경로 캐시
+        self.cache_range = None
+        self.up_path = None
+        self.down_path = None
+
+    def apply_theme_colors(self):
+        """테마 전환 - 상승/하락 막대 색을 지금 테마 색으로"""
+        from ui.theme import palette
+        colors = palette()
+        self.up_brush = pg.mkBrush(colors['up'])
+        self.down_brush = pg.mkBrush(colors['down'])
+        self.update()
+
+    def set_data(self, volume, rising):
+        """
+        거래량 전체 설정
+        Args:
+            volume: 거래량 배열 (x 인덱스는 0부터)
+            rising: 상승 봉 여부 배열
+        """
+        self.prepareGeometryChange()
+        self.volume = np.array(volume, dtype=np.float64)
+        self.rising = np.array(rising, dtype=bool)
+        self.max_volume = float(self.volume.max()) if len(self.volume) else 0.0
+        self.cache_range = None
+        self.informViewBoundsChanged()
+        self.fit_visible_range()
+        self.update()
+
+    def update_last(self, volume, rising):
+        """진행 중인 마지막 봉만 갱신 (확정된 봉 경로는 그대로 사용)"""
+        if self.volume is None or len(self.volume) == 0:
+            return
+        self.volume[-1] = volume
+        self.rising[-1] = rising
+        if volume > self.max_volume:
+            self.prepareGeometryChange()
+            self.max_volume = float(volume)
+            self.informViewBoundsChanged()
+            self.fit_visible_range()
+        self.update()
+
+    def _bar_path(self, x, height):
+        """막대 여러 개를 하나의 경로로 생성"""
+        if len(x) == 0:
+            return None
+        half = self.width / 2
+        # 막대 하나당 5개 점 (닫힌 사각형), 마지막 점에서 다음 막대와 연결 끊기
+        xs = np.column_stack((x - half, x + half, x + half, x - half, x - half)).ravel()
+        zeros = np.zeros(len(x))
+        ys = np.column_stack((zeros, zeros, height, height, zeros)).ravel()
+        connect = np.tile(np.array([1, 1, 1, 1, 0], dtype=np.int32), len(x))
+        return pg.arrayToQPath(xs, ys, connect=connect)
+
+    def viewRangeChanged(self):
+        """X 범위가 바뀌면 Y 범위도 다시 맞춤"""
+        super().viewRangeChanged()
+        self.fit_visible_range()
+
+    def fit_visible_range(self):
+        """보이는 봉의 최대 거래량에 맞춰 Y 범위 조정"""
+        if self.volume is None or len(self.volume) == 0:
+            return
+        start, end = visible_index_range(self, len(self.volume), margin=0)
+        if end <= start:
+            return
+        visible_max = float(self.volume[start:end].max())
+        view_box = self.getViewBox()
+        if view_box is not None and visible_max > 0:
+            view_box.setYRange(0, visible_max, padding=0.05)
+
+    def paint(self, p, *args):
+        if self.volume is None or len(self.volume) == 0:
+            return
+
+        with perf_monitor.stage('paint_volume'):
+            self._paint_bars(p)
+
+    def _paint_bars(self, p):
+        last = len(self.volume) - 1
+        start, end = visible_index_range(self, len(self.volume))
+        committed_end = min(end, last)
+
+        # 보이는 구간이 바뀐 경우에만 확정 봉 경로 재생성
+        if self.cache_range != (start, committed_end):
+            x = np.arange(start, committed_end)
+            volume = self.volume[start:committed_end]
+            rising = self.rising[start:committed_end]
+            self.up_path = self._bar_path(x[rising], volume[rising])
+            self.down_path = self._bar_path(x[~rising], volume[~rising])
+            self.cache_range = (start, committed_end)
+
+        p.setPen(pg.mkPen(None))
+        if self.up_path is not None:
+            p.setBrush(self.up_brush)
+            p.drawPath(self.up_path)
+        if self.down_path is not None:
+            p.setBrush(self.down_brush)
+            p.drawPath(self.down_path)
+
+        # 진행 중인 마지막 봉
+        if start <= last < end:
+            p.setBrush(self.up_brush if self.rising[last] else self.down_brush)
+            p.drawRect(QRectF(last - self.width / 2, 0, self.width, self.volume[last]))
+
+    def boundingRect(self):
+        if self.volume is None or len(self.volume) == 0:
+            return QRectF()
+        return QRectF(-0.5, 0, len(self.volume), self.max_volume)
@@ -0,0 +1,212 @@
+import math
+import os
+import time
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# 거래소 분당 요청 가중치 한도 (Binance 현물 REQUEST_WEIGHT 기본값)
+WEIGHT_LIMIT = int(os.environ.get('TRADING_WEIGHT_LIMIT', '6000'))
+
+
+class PollChannel:
+    """AdaptivePoller 가 주기를 정하는 타이머 하나 (타이머 없이 작업 스레드가 주기만 읽어 가는 채널도 있음)"""
+
+    def __init__(self, name, timer, callback, base, minimum, maximum, volatility, uses_weight, hidden_factor):
+        self.name = name
+        self.timer = timer            # None 이면 작업 스레드가 seconds() 로 주기를 읽어 감
+        self.callback = callback      # None 이면 다른 객체가 시작/정지하는 타이머 (또는 타이머 없는 채널)
+        self.base = base              # 평소 주기 (ms)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.volatility = volatility  # 변동성에 따라 빨라지고 느려지는지
+        self.uses_weight = uses_weight  # 거래소 요청 가중치를 쓰는지
+        self.hidden_factor = hidden_factor  # 창이 안 보일 때 몇 배 느리게
+        self.interval = base          # 현재 주기 (ms)
+
+
+class AdaptivePoller(QObject):
+    """
+    변동성/창 표시 여부/거래소 요청 가중치 여유에 따라 주기를 바꾸는 폴링 타이머 묶음
+
+    - 채널마다 QTimer 하나, 주기 = 기본 주기 × 변동성 계수 × 창 계수 × 가중치 계수 (최소~최대 사이)
+      (체결/호가처럼 작업 스레드가 직접 요청하는 채널은 타이머 없이 seconds() 로 주기만 읽어 감)
+    - 변동성: 최근 30초 변동성이 최근 10분 변동성보다 크면 빠르게, 가격이 멈춰 있으면 느리게 (0.5 ~ 4배)
+        * 로그 수익률² / 경과 시간(= 초당 분산)을 시간 기준 EWMA 로 평균 → 폴링 주기가 바뀌어도 추정값이 같음
+          (|Δ|/dt 는 1/√dt 에 비례해서 빨리 폴링할수록 변동성이 커 보이는 문제가 있음)
+        * 계수가 HYSTERESIS(25%) 이상 바뀔 때만 반영해서 일정한 변동성에서는 주기가 흔들리지 않음
+    - 창이 최소화/가려지면 채널별 hidden_factor 배 느리게, 다시 보이면 바로 한 번 실행
+    - 거래소 응답의 X-MBX-USED-WEIGHT-1M 이 한도의 절반을 넘으면 남은 여유에 반비례해서 느리게
+    - 주기는 step 단위로 맞춰서, 조건이 조금씩 흔들려도 타이머를 다시 시작하지 않음
+    """
+
+    rates_changed = pyqtSignal()
+
+    FAST_WINDOW = 30.0   # 최근 변동성 평균 시간 (초)
+    SLOW_WINDOW = 600.0  # 평소 변동성 평균 시간 (초)
+    WARMUP = 10          # 변동성 계수를 쓰기 전 최소 가격 개수 (FAST_WINDOW 초 이상 관찰한 뒤부터)
+    HYSTERESIS = 0.25    # 계수가 이 비율 이상 바뀌어야 주기에 반영
+    MIN_VOLATILITY_FACTOR = 0.5
+    MAX_VOLATILITY_FACTOR = 4.0
+
+    def __init__(self, fetcher=None, weight_limit=WEIGHT_LIMIT, step=250, parent=None):
+        """
+        Args:
+            fetcher: used_weight() 로 요청 가중치 사용량을 알려 주는 시세 소스 (없으면 가중치 무시)
+            weight_limit: 분당 요청 가중치 한도
+            step: 주기 단위 (ms)
+        """
+        super().__init__(parent)
+        self.fetcher = fetcher
+        self.weight_limit = weight_limit
+        self.step = step
+        self.channels = {}
+        self.visible = True
+
+        self.last_price = None
+        self.last_price_time = None
+        self.fast_variance = 0.0  # 초당 로그 수익률 분산의 짧은 EWMA
+        self.slow_variance = 0.0
+        self.samples = 0
+        self.observed_seconds = 0.0  # 가격을 관찰한 시간 합 (초)
+        self.current_volatility_factor = 1.0  # 주기에 반영 중인 변동성 계수
+        self.used_weight = None
+
+    def add(self, name, base, minimum=None, maximum=None, callback=None, timer=None,
+            volatility=False, uses_weight=False, hidden_factor=5.0):
+        """
+        채널 추가
+        Args:
+            base: 평소 주기 (ms)
+            minimum, maximum: 주기 범위 (ms), 기본값은 base 와 base × 10
+            callback: 주기마다 호출할 함수 (timer 를 주지 않았을 때)
+            timer: 이미 있는 QTimer 의 주기만 맡길 때 (시작/정지는 원래 주인이 함)
+            callback 과 timer 를 둘 다 주지 않으면 타이머 없는 채널 (작업 스레드가 seconds(name) 로 주기를 읽음)
+        """
+        if timer is not None:
+            callback = None
+        elif callback is not None:
+            timer = QTimer(self)
+            timer.timeout.connect(callback)
+            timer.timeout.connect(self.refresh)
+        channel = PollChannel(name, timer, callback, base, minimum or base, maximum or base * 10,
+                              volatility, uses_weight, hidden_factor)
+        self.channels[name] = channel
+        channel.interval = self.interval_for(channel)
+        if timer is not None:
+            timer.setInterval(channel.interval)
+        return timer
+
+    def seconds(self, name):
+        """채널의 현재 주기 (초) - 작업 스레드에서 요청할 때마다 읽어 감 (등록 전이면 None)"""
+        channel = self.channels.get(name)
+        return channel.interval / 1000 if channel is not None else None
+
+    def start(self):
+        for channel in self.channels.values():
+            if channel.callback is not None:
+                channel.timer.start()
+        self.rates_changed.emit()
+
+    def stop(self):
+        for channel in self.channels.values():
+            if channel.callback is not None:
+                channel.timer.stop()
+
+    def observe_price(self, price, now=None):
+        """새 가격 반영 (변동성 계수 계산용)"""
+        now = time.monotonic() if now is None else now
+        if price is None or price <= 0:
+            return
+        if self.last_price is not None and now > self.last_price_time:
+            dt = now - self.last_price_time
+            variance = math.log(price / self.last_price) ** 2 / dt
+            self.samples += 1
+            self.observed_seconds += dt
+            # 시간 기준 EWMA: 간격이 길면 한 번에 더 많이 반영 (폴링 주기와 무관한 평균 시간)
+            # 처음에는 1/n 보다 작게 반영하지 않아서 첫 값 하나에 끌려가지 않음 (그때까지는 단순 평균)
+            floor = 1.0 / self.samples
+            fast_alpha = max(1.0 - math.exp(-dt / self.FAST_WINDOW), floor)
+            slow_alpha = max(1.0 - math.exp(-dt / self.SLOW_WINDOW), floor)
+            self.fast_variance += fast_alpha * (variance - self.fast_variance)
+            self.slow_variance += slow_alpha * (variance - self.slow_variance)
+            self.update_volatility_factor()
+        self.last_price = price
+        self.last_price_time = now
+
+    def set_visible(self, visible):
+        """창 표시 여부 변경 - 다시 보이면 숨김 동안 느려졌던 채널을 바로 한 번 실행"""
+        if visible == self.visible:
+            return
+        self.visible = visible
+        self.refresh()
+        if visible:
+            for channel in self.channels.values():
+                if channel.callback is not None and channel.hidden_factor > 1 and channel.timer.isActive():
+                    channel.callback()
+
+    def target_volatility_factor(self):
+        """짧은/긴 변동성(표준편차) 비율의 역수 (가격이 크게 움직이면 1 보다 작음)"""
+        if self.samples < self.WARMUP or self.observed_seconds < self.FAST_WINDOW:
+            return 1.0
+        if self.fast_variance <= 0:
+            return self.MAX_VOLATILITY_FACTOR
+        if self.slow_variance <= 0:
+            return self.MIN_VOLATILITY_FACTOR
+        ratio = math.sqrt(self.fast_variance / self.slow_variance)
+        return min(max(1.0 / ratio, self.MIN_VOLATILITY_FACTOR), self.MAX_VOLATILITY_FACTOR)
+
+    def update_volatility_factor(self):
+        """목표 계수가 지금 계수에서 HYSTERESIS 이상 벗어났을 때만 바꿈"""
+        target = self.target_volatility_factor()
+        current = self.current_volatility_factor
+        if abs(target / current - 1.0) >= self.HYSTERESIS:
+            self.current_volatility_factor = target
+
+    def volatility_factor(self):
+        """주기에 반영 중인 변동성 계수"""
+        return self.current_volatility_factor
+
+    def weight_factor(self):
+        """요청 가중치 사용량이 한도의 절반을 넘으면 남은 여유에 반비례 (최대 10배)"""
+        if self.used_weight is None or self.weight_limit <= 0:
+            return 1.0
+        headroom = 1.0 - self.used_weight / self.weight_limit
+        return max(1.0, 0.5 / max(headroom, 0.05))
+
+    def interval_for(self, channel):
+        factor = 1.0
+        if channel.volatility:
+            factor *= self.volatility_factor()
+        if channel.uses_weight:
+            factor *= self.weight_factor()
+        if not self.visible:
+            factor *= channel.hidden_factor
+        interval = min(max(channel.base * factor, channel.minimum), channel.maximum)
+        return int(round(interval / self.step) * self.step) or self.step
+
+    def refresh(self):
+        """가중치 사용량을 다시 읽고 바뀐 채널의 주기만 변경"""
+        used_weight = getattr(self.fetcher, 'used_weight', None)
+        value = used_weight() if used_weight is not None else None
+        if value is not None:
+            self.used_weight = value
+        changed = False
+        for channel in self.channels.values():
+            interval = self.interval_for(channel)
+            if interval != channel.interval:
+                channel.interval = interval
+                if channel.timer is not None:
+                    channel.timer.setInterval(interval)
+                changed = True
+        if changed:
+            self.rates_changed.emit()
+
+    def intervals(self):
+        """{채널 이름: 현재 주기(ms)}"""
+        return {name: channel.interval for name, channel in self.channels.items()}
+
+    def headroom(self):
+        """남은 요청 가중치 비율 (모르면 None)"""
+        if self.used_weight is None or self.weight_limit <= 0:
+            return None
+        return max(0.0, 1.0 - self.used_weight / self.weight_limit)
@@ -0,0 +1,44 @@
+import threading
+
+
+class CandleStore:
+    """
+    (심볼, 봉 간격)별 최신 캔들 데이터 저장소
+
+    - 여러 차트가 같은 데이터를 공유하고, 버전 번호로 새 데이터가 들어왔는지 확인
+    - 가져오기 스레드에서 쓰고 UI 스레드에서 읽으므로 잠금으로 보호
+    """
+
+    def __init__(self):
+        self.entries = {}  # (심볼, 봉 간격) → (버전, 캔들 배열, 데이터프레임)
+        self.lock = threading.Lock()
+
+    def put(self, symbol, timeframe, candle_data, df):
+        """새 데이터 저장 후 버전 반환"""
+        key = (symbol, timeframe)
+        with self.lock:
+            version = self.entries[key][0] + 1 if key in self.entries else 1
+            self.entries[key] = (version, candle_data, df)
+        return version
+
+    def get(self, symbol, timeframe):
+        """
+        저장된 데이터 조회
+        Returns:
+            (버전, 캔들 배열, 데이터프레임), 없으면 (0, None, None)
+        """
+        with self.lock:
+            return self.entries.get((symbol, timeframe), (0, None, None))
+
+    def memory_usage(self):
+        """(심볼, 봉 간격)별 캔들 배열과 데이터프레임이 차지하는 메모리 (바이트)"""
+        with self.lock:
+            entries = list(self.entries.items())
+        return {key: candle_data.nbytes + int(df.memory_usage(index=True).sum())
+                for key, (_, candle_data, df) in entries}
+
+    def version(self, symbol, timeframe):
+        """저장된 데이터의 버전 (없으면 0)"""
+        with self.lock:
+            entry = self.entries.get((symbol, timeframe))
+        return entry[0] if entry else 0
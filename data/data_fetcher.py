@@ -1,12 +1,103 @@
+import threading
+
 import ccxt
 import pandas as pd
 from datetime import datetime, timedelta
 import numpy as np
 
+from utils.perf_monitor import perf_monitor
+
+
+def header_weight(headers):
+    """응답 헤더의 분당 요청 가중치 사용량 (X-MBX-USED-WEIGHT-1M), 없으면 None"""
+    for key, value in (headers or {}).items():
+        if key.lower() == 'x-mbx-used-weight-1m':
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+class BinanceClient(ccxt.binance):
+    """
+    DataFetcher 가 스레드마다 하나씩 만드는 Binance 클라이언트
+    ccxt 동기 클라이언트는 요청 세션/요청 간격 제한/last_response_headers 를 공유하므로 스레드끼리 같이 쓰면 안 됨
+    - 마켓 정보는 먼저 불러온 클라이언트의 것을 같이 씀 (스레드마다 exchangeInfo 를 다시 요청하지 않음)
+    - 응답을 받을 때마다 요청 가중치 사용량을 DataFetcher 에 알림
+    """
+    def __init__(self, owner):
+        super().__init__()
+        self.owner = owner
+
+    def load_markets(self, reload=False, params={}):
+        with self.owner.markets_lock:
+            if not reload and not self.markets and self.owner.markets is not None:
+                self.set_markets(*self.owner.markets)
+            markets = super().load_markets(reload, params)
+            self.owner.markets = (self.markets, self.currencies)
+        return markets
+
+    def fetch(self, url, method='GET', headers=None, body=None):
+        try:
+            return super().fetch(url, method, headers, body)
+        finally:
+            # 오류 응답(429 등)도 헤더에 가중치가 실려 옴
+            self.owner.note_weight(header_weight(self.last_response_headers))
+
+
 class DataFetcher:
-    def __init__(self):
-        # Binance 거래소 객체 생성
-        self.exchange = ccxt.binance()
+    def __init__(self, recorder=None, base_url=None):
+        """
+        Args:
+            recorder: 받은 원본 응답을 기록할 MarketRecorder
+            base_url: 거래소 대신 접속할 주소 (예: 로컬 가짜 거래소 http://127.0.0.1:8765)
+        """
+        self.base_url = base_url  # None 이면 실제 Binance
+        # 스레드별 거래소 객체 (exchange 속성으로 접근)
+        self.local = threading.local()
+        # 클라이언트끼리 같이 쓰는 마켓 정보 (markets, currencies)
+        self.markets = None
+        self.markets_lock = threading.Lock()
+        # 가장 최근에 받은 응답의 요청 가중치 사용량
+        self.weight = None
+        self.weight_lock = threading.Lock()
+        # 받은 원본 응답을 기록할 MarketRecorder (없으면 기록 안 함)
+        self.recorder = recorder
+
+    @property
+    def exchange(self):
+        """현재 스레드의 Binance 거래소 객체 (스레드마다 처음 접근할 때 생성)"""
+        exchange = getattr(self.local, 'exchange', None)
+        if exchange is None:
+            exchange = self.local.exchange = self.create_exchange()
+        return exchange
+
+    def create_exchange(self):
+        """
+        같은 설정으로 새 Binance 거래소 객체 생성
+        다른 스레드에서 쓸 객체가 필요할 때 (체결/호가 스레드 등) 호출
+        """
+        exchange = BinanceClient(self)
+        if self.base_url:
+            self.use_base_url(exchange, self.base_url)
+        return exchange
+
+    @staticmethod
+    def use_base_url(exchange, base_url):
+        """현물 REST API 주소를 base_url 로 변경 (현물 마켓만 불러오도록 설정)"""
+        api_url = base_url.rstrip('/') + '/api/v3'
+        exchange.urls['api']['public'] = api_url
+        exchange.urls['api']['private'] = api_url
+        exchange.options['fetchMarkets']['types'] = ['spot']
+        exchange.options['fetchCurrencies'] = False
+
+    def note_weight(self, weight):
+        """응답의 요청 가중치 사용량 기록 (어느 스레드의 응답이든 가장 늦게 받은 값이 최신)"""
+        if weight is None:
+            return
+        with self.weight_lock:
+            self.weight = weight
 
     def fetch_ohlcv(self, symbol='BTC/USDT', timeframe='1m', limit=300):
         """
@@ -14,37 +105,62 @@ class DataFetcher:
         기본값: BTC/USDT, 1시간봉, 100개 봉
         """
         try:
-            # 캔들 데이터 가져오기
-            ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-            
-            # 데이터프레임으로 변환
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            
-            # 타임스탬프를 읽기 쉬운 날짜형식으로 변환
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            
-            # 캔들스틱 차트용 배열 생성
-            candle_data = np.column_stack((
-                np.arange(len(df)),  # x축 인덱스
-                df['open'].values,   # 시가
-                df['high'].values,   # 고가
-                df['low'].values,    # 저가
-                df['close'].values   # 종가
-            ))
-            
-            return candle_data, df
+            # 캔들 데이터 가져오기 (네트워크 왕복과 변환 시간을 따로 측정)
+            with perf_monitor.stage('fetch_ohlcv'):
+                ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+            if self.recorder is not None:
+                self.recorder.record('ohlcv', symbol, ohlcv, timeframe)
+            with perf_monitor.stage('parse_ohlcv'):
+                return self.parse_ohlcv(ohlcv)
         except Exception as e:
             print(f"데이터 가져오기 실패: {e}")
             return None, None
 
+    @staticmethod
+    def parse_ohlcv(ohlcv):
+        """
+        거래소 OHLCV 응답을 차트용 배열과 데이터프레임으로 변환합니다
+        Args:
+            ohlcv: [[타임스탬프(ms), 시가, 고가, 저가, 종가, 거래량], ...]
+        Returns:
+            (캔들스틱 배열, 데이터프레임)
+        """
+        # 데이터프레임으로 변환
+        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        
+        # 타임스탬프를 읽기 쉬운 날짜형식으로 변환
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        
+        # 캔들스틱 차트용 배열 생성
+        candle_data = np.column_stack((
+            np.arange(len(df)),  # x축 인덱스
+            df['open'].values,   # 시가
+            df['high'].values,   # 고가
+            df['low'].values,    # 저가
+            df['close'].values   # 종가
+        ))
+        
+        return candle_data, df
+
     def get_current_price(self, symbol='BTC/USDT'):
         """
         특정 코인의 현재가를 가져옵니다
         기본값: BTC/USDT
         """
         try:
-            ticker = self.exchange.fetch_ticker(symbol)
+            with perf_monitor.stage('fetch_ticker'):
+                ticker = self.exchange.fetch_ticker(symbol)
+            if self.recorder is not None:
+                self.recorder.record('ticker', symbol, ticker)
             return ticker['last']  # 최근 거래가 반환
         except Exception as e:
             print(f"현재가 가져오기 실패: {e}")
             return None
+
+    def used_weight(self):
+        """
+        모든 스레드의 응답 중 가장 최근 응답 헤더의 분당 요청 가중치 사용량 (X-MBX-USED-WEIGHT-1M)
+        아직 응답이 없거나 헤더가 없으면 None
+        """
+        with self.weight_lock:
+            return self.weight
@@ -0,0 +1,226 @@
+import json
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from engine.candle_buffer import COLUMNS as CANDLE_COLUMNS
+from utils.perf_monitor import perf_monitor
+
+# 내보낸 파일을 저장할 폴더
+EXPORT_DIR = os.environ.get('TRADING_EXPORT_DIR', 'exports')
+# 한 번에 읽고 쓰는 행 수 (메모리 사용량 상한)
+CHUNK_ROWS = 65536
+# CSV 는 이 행 수마다 잠깐 쉬어서 UI 스레드에 GIL 을 넘겨줌
+YIELD_ROWS = 2048
+YIELD_SECONDS = 0.005
+
+FILL_COLUMNS = ('timestamp', 'symbol', 'quantity', 'price', 'fee', 'realized_pnl')
+EQUITY_COLUMNS = ('timestamp', 'equity')
+# 열 이름 → 열 형식 파일에 쓸 dtype (나머지는 float64)
+COLUMN_DTYPES = {'timestamp': np.int64, 'symbol': 'S16'}
+
+
+class ExportSource:
+    """
+    내보낼 데이터 하나 (이름, 열 이름, 전체 행 수, 청크 생성 함수)
+    chunks() 는 {열 이름: 배열} 을 chunk_rows 행씩 만들어 냄
+    """
+
+    def __init__(self, name, columns, total, chunks):
+        self.name = name
+        self.columns = columns
+        self.total = total
+        self.chunks = chunks
+
+
+def candle_source(name, spill_path, live_rows, chunk_rows=CHUNK_ROWS):
+    """
+    디스크로 내보낸 봉 파일 + 메모리의 최근 봉
+    Args:
+        spill_path: CandleRingBuffer 가 내보낸 봉 파일 (없으면 None), 지금 크기까지만 읽음
+        live_rows: 메모리에 남아 있는 최근 봉 (N, 6) 복사본
+    """
+    row_bytes = len(CANDLE_COLUMNS) * 8
+    spilled = os.path.getsize(spill_path) // row_bytes if spill_path and os.path.exists(spill_path) else 0
+    live_rows = np.asarray(live_rows, dtype=np.float64).reshape(-1, len(CANDLE_COLUMNS))
+
+    if spilled:
+        # 마지막으로 내보낸 봉 이후만 메모리에서 가져옴 (겹치는 봉 제거)
+        with open(spill_path, 'rb') as f:
+            f.seek((spilled - 1) * row_bytes)
+            last_spilled = np.frombuffer(f.read(row_bytes), dtype=np.float64)[0]
+        live_rows = live_rows[live_rows[:, 0] > last_spilled]
+
+    def chunks():
+        if spilled:
+            # 파일 전체를 읽지 않고 청크씩 (지금 크기까지만, 이후에 추가된 봉은 메모리 쪽에 있음)
+            with open(spill_path, 'rb') as f:
+                for begin in range(0, spilled, chunk_rows):
+                    count = min(chunk_rows, spilled - begin) * len(CANDLE_COLUMNS)
+                    rows = np.fromfile(f, dtype=np.float64, count=count)
+                    yield candle_columns(rows.reshape(-1, len(CANDLE_COLUMNS)))
+        for begin in range(0, len(live_rows), chunk_rows):
+            yield candle_columns(live_rows[begin:begin + chunk_rows])
+
+    return ExportSource(name, CANDLE_COLUMNS, spilled + len(live_rows), chunks)
+
+
+def candle_columns(rows):
+    columns = {name: rows[:, i] for i, name in enumerate(CANDLE_COLUMNS)}
+    columns['timestamp'] = rows[:, 0].astype(np.int64)
+    return columns
+
+
+def fill_source(fills, chunk_rows=CHUNK_ROWS):
+    """체결 기록 (PositionEngine.fills 목록의 복사본)"""
+    def chunks():
+        for begin in range(0, len(fills), chunk_rows):
+            part = fills[begin:begin + chunk_rows]
+            yield {
+                'timestamp': np.array([fill.timestamp for fill in part], dtype=np.int64),
+                'symbol': np.array([fill.symbol for fill in part], dtype=object),
+                'quantity': np.array([fill.quantity for fill in part], dtype=np.float64),
+                'price': np.array([fill.price for fill in part], dtype=np.float64),
+                'fee': np.array([fill.fee for fill in part], dtype=np.float64),
+                'realized_pnl': np.array([fill.realized_pnl for fill in part], dtype=np.float64),
+            }
+
+    return ExportSource('fills', FILL_COLUMNS, len(fills), chunks)
+
+
+def equity_source(timestamps, equity, chunk_rows=CHUNK_ROWS):
+    """자산 이력 (ReturnsEngine 배열의 복사본)"""
+    def chunks():
+        for begin in range(0, len(timestamps), chunk_rows):
+            yield {'timestamp': timestamps[begin:begin + chunk_rows], 'equity': equity[begin:begin + chunk_rows]}
+
+    return ExportSource('equity', EQUITY_COLUMNS, len(timestamps), chunks)
+
+
+class CsvWriter:
+    """
+    청크를 CSV 파일 끝에 추가 (첫 줄은 열 이름)
+    DataFrame.to_csv 는 청크 하나를 쓰는 동안 GIL 을 놓지 않아 UI 가 멈추므로 행 단위 문자열 포맷 사용
+    (파이썬 코드라 인터프리터가 주기적으로 UI 스레드에 실행을 넘겨줌), 실수는 원래 값 그대로(repr)
+    """
+
+    def __init__(self, path, columns):
+        self.path = path + '.csv'
+        self.columns = columns
+        self.line_format = ','.join({'timestamp': '%d', 'symbol': '%s'}.get(name, '%r') for name in columns) + '\n'
+        self.file = open(self.path, 'w', encoding='utf-8', newline='')
+        self.file.write(','.join(columns) + '\n')
+
+    def write(self, chunk):
+        line_format = self.line_format
+        columns = [np.asarray(chunk[name]) for name in self.columns]
+        for begin in range(0, len(columns[0]), YIELD_ROWS):
+            rows = zip(*(column[begin:begin + YIELD_ROWS].tolist() for column in columns))
+            self.file.writelines(line_format % row for row in rows)
+            time.sleep(YIELD_SECONDS)  # UI 스레드가 GIL 을 기다리지 않도록 잠깐 양보
+
+    def close(self):
+        self.file.close()
+
+
+class ColumnarWriter:
+    """
+    열 형식 내보내기 - 폴더 하나에 열마다 원시 배열 파일 하나 + schema.json
+    np.fromfile / np.memmap 으로 필요한 열만 바로 읽을 수 있음 (history/*.f64 와 같은 방식)
+    """
+
+    def __init__(self, path, columns):
+        self.path = path
+        self.columns = columns
+        self.dtypes = {name: np.dtype(COLUMN_DTYPES.get(name, np.float64)) for name in columns}
+        self.rows = 0
+        os.makedirs(path, exist_ok=True)
+        self.files = {name: open(os.path.join(path, f'{name}.bin'), 'wb') for name in columns}
+
+    def write(self, chunk):
+        for name in self.columns:
+            np.asarray(chunk[name]).astype(self.dtypes[name]).tofile(self.files[name])
+        self.rows += len(chunk[self.columns[0]])
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+        schema = {
+            'rows': self.rows,
+            'byteorder': 'little' if np.little_endian else 'big',
+            'columns': [{'name': name, 'file': f'{name}.bin', 'dtype': self.dtypes[name].str}
+                        for name in self.columns],
+        }
+        with open(os.path.join(self.path, 'schema.json'), 'w', encoding='utf-8') as f:
+            json.dump(schema, f, indent=2)
+
+
+WRITERS = {'csv': CsvWriter, 'columnar': ColumnarWriter}
+
+
+def read_columnar(path):
+    """열 형식으로 내보낸 폴더를 {열 이름: memmap} 으로 읽기 (분석용)"""
+    with open(os.path.join(path, 'schema.json'), encoding='utf-8') as f:
+        schema = json.load(f)
+    if schema['rows'] == 0:
+        return {column['name']: np.empty(0, dtype=column['dtype']) for column in schema['columns']}
+    return {column['name']: np.memmap(os.path.join(path, column['file']), dtype=column['dtype'], mode='r',
+                                      shape=(schema['rows'],))
+            for column in schema['columns']}
+
+
+class ExportThread(QThread):
+    """
+    여러 데이터를 CSV / 열 형식 파일로 내보내는 작업 스레드
+
+    - 청크(CHUNK_ROWS 행) 단위로 읽고 바로 써서 몇 년치 1분봉도 메모리에 한꺼번에 올리지 않음
+    - 청크마다 progress 로 (완료 행, 전체 행) 알림, cancel() 로 중단
+    """
+
+    progress = pyqtSignal(int, int)       # 완료 행 수, 전체 행 수 (형식 수만큼 곱한 값)
+    export_finished = pyqtSignal(str)     # 내보낸 폴더
+    export_failed = pyqtSignal(str)
+
+    def __init__(self, sources, formats=('csv', 'columnar'), directory=EXPORT_DIR, parent=None):
+        super().__init__(parent)
+        self.sources = sources
+        self.formats = formats
+        self.directory = os.path.join(directory, datetime.now().strftime('%Y%m%d_%H%M%S'))
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        total = sum(source.total for source in self.sources) * len(self.formats)
+        done = 0
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for source in self.sources:
+                # 소스 하나를 한 번만 읽으면서 모든 형식에 같이 씀
+                writers = [WRITERS[fmt](os.path.join(self.directory, source.name), source.columns)
+                           for fmt in self.formats]
+                try:
+                    for chunk in source.chunks():
+                        if self.cancelled:
+                            break
+                        with perf_monitor.stage('export_chunk'):
+                            for writer in writers:
+                                writer.write(chunk)
+                        done += len(chunk[source.columns[0]]) * len(writers)
+                        self.progress.emit(done, total)
+                finally:
+                    for writer in writers:
+                        writer.close()
+                if self.cancelled:
+                    self.export_failed.emit('취소됨')
+                    return
+        except (OSError, ValueError) as e:
+            print(f"내보내기 실패: {e}")
+            self.export_failed.emit(str(e))
+            return
+        self.progress.emit(total, total)
+        self.export_finished.emit(self.directory)
@@ -0,0 +1,121 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from utils.perf_monitor import perf_monitor
+
+
+class FetchScheduler(QObject):
+    """
+    여러 차트가 공유하는 OHLCV 가져오기 스케줄러
+
+    - 타이머 하나로 구독 중인 (심볼, 봉 간격)을 주기마다 한 번씩만 요청
+    - 같은 키를 여러 차트가 구독해도 요청은 한 번, 이전 요청이 끝나지 않았으면 이번 주기는 건너뜀
+    - 요청과 변환은 작업 스레드에서 수행하고, 결과는 CandleStore 에 저장한 뒤 updated 시그널로 알림
+    """
+
+    updated = pyqtSignal(str, str)  # 심볼, 봉 간격
+
+    def __init__(self, fetcher, store, interval=1000, max_workers=4, parent=None):
+        """
+        Args:
+            fetcher: DataFetcher 와 같은 인터페이스의 시세 소스
+            store: 결과를 저장할 CandleStore
+            interval: 요청 주기 (ms)
+            max_workers: 동시에 요청할 작업 스레드 수
+        """
+        super().__init__(parent)
+        self.fetcher = fetcher
+        self.store = store
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fetch')
+
+        self.subscriptions = {}  # (심볼, 봉 간격) → [구독 수, 봉 개수, 요청 주기(초), 다음 요청 시각]
+        self.in_flight = set()   # 요청 중인 키
+        self.lock = threading.Lock()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.timer.setInterval(interval)
+
+    def subscribe(self, symbol, timeframe, limit=300, interval=None):
+        """
+        키 구독 (처음 구독하면 바로 한 번 요청)
+        Args:
+            interval: 이 키만 더 느리게 요청할 주기 (초), None 이면 타이머 주기마다
+        """
+        key = (symbol, timeframe)
+        entry = self.subscriptions.get(key)
+        if entry is None:
+            self.subscriptions[key] = [1, limit, interval, 0.0]
+            self.request(key)
+        else:
+            entry[0] += 1
+            entry[1] = max(entry[1], limit)
+            if interval is None or entry[2] is None:
+                entry[2] = None
+            else:
+                entry[2] = min(entry[2], interval)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def unsubscribe(self, symbol, timeframe):
+        """구독 해제 (구독이 모두 없어지면 타이머 정지)"""
+        key = (symbol, timeframe)
+        entry = self.subscriptions.get(key)
+        if entry is None:
+            return
+        entry[0] -= 1
+        if entry[0] <= 0:
+            del self.subscriptions[key]
+        if not self.subscriptions:
+            self.timer.stop()
+
+    def tick(self):
+        """요청 주기가 된 키 요청"""
+        now = time.monotonic()
+        for key, entry in list(self.subscriptions.items()):
+            if entry[2] is None or now >= entry[3]:
+                self.request(key)
+
+    def fetch_once(self, symbol, timeframe, limit=300):
+        """구독 없이 한 번만 요청 (예: 시작할 때 저장된 화면을 거래소 값으로 맞추기)"""
+        key = (symbol, timeframe)
+        with self.lock:
+            if key in self.in_flight:
+                return
+            self.in_flight.add(key)
+        self.executor.submit(self._fetch, key, limit)
+
+    def request(self, key):
+        """요청 중이 아니면 작업 스레드에 요청 등록"""
+        with self.lock:
+            if key in self.in_flight:
+                return
+            self.in_flight.add(key)
+        entry = self.subscriptions[key]
+        if entry[2] is not None:
+            entry[3] = time.monotonic() + entry[2]
+        self.executor.submit(self._fetch, key, entry[1])
+
+    def _fetch(self, key, limit):
+        """작업 스레드: 가져와서 저장소에 반영"""
+        symbol, timeframe = key
+        try:
+            with perf_monitor.stage('scheduler_fetch'):
+                candle_data, df = self.fetcher.fetch_ohlcv(symbol, timeframe, limit=limit)
+            if candle_data is not None:
+                self.store.put(symbol, timeframe, candle_data, df)
+                self.updated.emit(symbol, timeframe)
+        except Exception as e:
+            print(f"{symbol} {timeframe} 데이터 가져오기 실패: {e}")
+        finally:
+            with self.lock:
+                self.in_flight.discard(key)
+
+    def shutdown(self):
+        """타이머 정지, 대기 중인 요청 취소"""
+        self.timer.stop()
+        self.subscriptions.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,234 @@
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from data.data_fetcher import DataFetcher
+from data.order_book_feed import BookSync, create_depth_feed
+from data.shared_ring import SharedRing
+
+# TRADING_INGEST=process 이면 현재가/봉/호가 수집을 별도 프로세스에서 실행
+INGEST_MODE = os.environ.get('TRADING_INGEST', 'thread')
+
+CANDLE_COLUMNS = 6  # [시각(ms), 시가, 고가, 저가, 종가, 거래량]
+TICKER_COLUMNS = 4  # [수신 시각(ms), 현재가, 매수 1호가, 매도 1호가]
+BOOK_COLUMNS = 4    # [매수 가격, 매수 누적 수량, 매도 가격, 매도 누적 수량] (빈 칸은 NaN)
+TICKER_CAPACITY = 256
+
+
+def notify(notify_queue, kind, value=None):
+    """UI 에 작은 알림만 전달 (큐가 가득 차면 버림 - UI 는 어차피 링의 최신 값을 읽음)"""
+    try:
+        notify_queue.put_nowait((kind, value))
+    except queue.Full:
+        pass
+
+
+def book_rows(book, levels):
+    """OrderBook 깊이를 (levels, 4) 배열로 (한쪽이 짧으면 NaN)"""
+    rows = np.full((levels, BOOK_COLUMNS), np.nan)
+    bid_prices, bid_cumulative = book.bids.depth(levels)
+    ask_prices, ask_cumulative = book.asks.depth(levels)
+    rows[:len(bid_prices), 0] = bid_prices
+    rows[:len(bid_prices), 1] = bid_cumulative
+    rows[:len(ask_prices), 2] = ask_prices
+    rows[:len(ask_prices), 3] = ask_cumulative
+    return rows
+
+
+def run_book(ring, book_sync, levels, publish_interval, notify_queue, stop_event):
+    """수집 프로세스의 호가 스레드: 델타 반영 후 publish_hz 번까지만 링에 기록"""
+    last_publish = 0.0
+    published_id = None
+    while not stop_event.is_set():
+        status = book_sync.step(0.02)
+        if status is not None:
+            notify(notify_queue, 'status', status)
+
+        book = book_sync.book
+        now = time.monotonic()
+        if book.synced and book.last_update_id != published_id and now - last_publish >= publish_interval:
+            ring.replace(book_rows(book, levels))
+            notify(notify_queue, 'book', ring.version())
+            published_id = book.last_update_id
+            last_publish = now
+
+
+def ingest_main(ring_names, config, notify_queue, control_queue, stop_event):
+    """
+    수집 프로세스 진입점 - 거래소 응답의 JSON 파싱과 호가 반영을 UI 프로세스의 GIL 밖에서 처리
+    Args:
+        ring_names: {'candles', 'ticker', 'book': 공유 메모리 이름}
+        config: symbol, timeframe, limit, levels, interval(초), publish_hz, base_url
+    """
+    rings = {kind: SharedRing.attach(name) for kind, name in ring_names.items()}
+    symbol = config['symbol']
+    timeframe = config['timeframe']
+    fetcher = DataFetcher(base_url=config['base_url'])
+
+    book_thread = threading.Thread(
+        target=run_book, name='ingest-book', daemon=True,
+        args=(rings['book'], BookSync(create_depth_feed(fetcher, symbol), symbol), config['levels'],
+              1.0 / config['publish_hz'], notify_queue, stop_event))
+    book_thread.start()
+
+    next_ticker = next_klines = 0.0
+    try:
+        while not stop_event.is_set():
+            # UI 요청 (봉 간격 변경)
+            try:
+                while True:
+                    command, value = control_queue.get_nowait()
+                    if command == 'timeframe':
+                        timeframe = value
+                        next_klines = 0.0
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            if now >= next_ticker:
+                next_ticker = now + config['interval']
+                try:
+                    ticker = fetcher.exchange.fetch_ticker(symbol)
+                    rings['ticker'].append([[
+                        ticker.get('timestamp') or time.time() * 1000, ticker.get('last') or np.nan,
+                        ticker.get('bid') or np.nan, ticker.get('ask') or np.nan,
+                    ]])
+                    notify(notify_queue, 'ticker', rings['ticker'].version())
+                except Exception as e:
+                    print(f"현재가 가져오기 실패: {e}")
+
+            if now >= next_klines:
+                next_klines = now + config['interval']
+                try:
+                    ohlcv = fetcher.exchange.fetch_ohlcv(symbol, timeframe, limit=config['limit'])
+                    rings['candles'].replace(np.asarray(ohlcv, dtype=np.float64).reshape(-1, CANDLE_COLUMNS))
+                    notify(notify_queue, 'candles', timeframe)
+                except Exception as e:
+                    print(f"데이터 가져오기 실패: {e}")
+
+            stop_event.wait(max(0.0, min(next_ticker, next_klines) - time.monotonic()))
+    finally:
+        stop_event.set()
+        book_thread.join(2.0)
+        for ring in rings.values():
+            ring.close()
+
+
+class IngestProcess(QThread):
+    """
+    시세 수집 프로세스를 띄우고 알림을 UI 로 전달하는 스레드
+
+    - 현재가/봉/호가는 수집 프로세스가 공유 메모리 링(SharedRing)에 쓰고, UI 는 매핑된 배열에서 바로 읽음
+    - 큐로는 (종류, 부가 정보) 알림만 오고, 밀린 알림은 종류별로 마지막 것만 전달
+    - 공유 메모리는 이 객체가 만들고 stop() 에서 삭제 (수집 프로세스는 연결만 함)
+    """
+
+    updated = pyqtSignal(str, object)  # 'candles'(봉 간격) / 'ticker' / 'book'(버전) / 'status'(상태 문자열)
+
+    def __init__(self, symbol='BTC/USDT', timeframe='1m', limit=300, levels=100, interval=1.0,
+                 publish_hz=10, base_url=None, parent=None):
+        super().__init__(parent)
+        self.rings = {
+            'candles': SharedRing.create(limit, CANDLE_COLUMNS),
+            'ticker': SharedRing.create(TICKER_CAPACITY, TICKER_COLUMNS),
+            'book': SharedRing.create(levels, BOOK_COLUMNS),
+        }
+        # fork 하면 Qt 와 작업 스레드 상태까지 복사되므로 새 인터프리터로 시작
+        context = multiprocessing.get_context('spawn')
+        self.notify_queue = context.Queue(maxsize=256)
+        self.control_queue = context.Queue()
+        self.stop_event = context.Event()
+        config = {'symbol': symbol, 'timeframe': timeframe, 'limit': limit, 'levels': levels,
+                  'interval': interval, 'publish_hz': publish_hz, 'base_url': base_url}
+        self.process = context.Process(
+            target=ingest_main, name='ingest', daemon=True,
+            args=({kind: ring.name for kind, ring in self.rings.items()}, config,
+                  self.notify_queue, self.control_queue, self.stop_event))
+        self.running = False
+
+    @property
+    def nbytes(self):
+        """공유 메모리 크기 합 (바이트)"""
+        return sum(ring.nbytes for ring in self.rings.values())
+
+    def start(self):
+        """수집 프로세스와 알림 스레드 시작"""
+        self.process.start()
+        self.running = True
+        super().start()
+
+    def stop(self):
+        """수집 프로세스 종료 후 공유 메모리 삭제"""
+        self.running = False
+        self.wait(2000)
+        self.stop_event.set()
+        if self.process.is_alive():
+            self.process.join(3.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1.0)
+        for ring in self.rings.values():
+            ring.close()
+
+    def set_timeframe(self, timeframe):
+        self.control_queue.put(('timeframe', timeframe))
+
+    def run(self):
+        while self.running:
+            pending = {}
+            try:
+                kind, value = self.notify_queue.get(timeout=0.2)
+                pending[kind] = value
+                while True:
+                    kind, value = self.notify_queue.get_nowait()
+                    pending[kind] = value
+            except queue.Empty:
+                pass
+            except (EOFError, OSError):
+                break
+            for kind, value in pending.items():
+                self.updated.emit(kind, value)
+
+    # ---- UI 스레드에서 읽기 ----
+
+    def candles(self):
+        """(N, 6) 최근 봉 복사본"""
+        return self.rings['candles'].read()[1]
+
+    def last_ticker(self):
+        """[수신 시각, 현재가, 매수 1호가, 매도 1호가], 아직 없으면 None"""
+        _, rows = self.rings['ticker'].read(1)
+        return rows[0] if len(rows) else None
+
+    def depth(self):
+        """OrderBook.depth() 와 같은 형식의 깊이 스냅샷"""
+        version, rows = self.rings['book'].read()
+        bids = rows[~np.isnan(rows[:, 0]), 0:2]
+        asks = rows[~np.isnan(rows[:, 2]), 2:4]
+        return {
+            'bid_prices': bids[:, 0],
+            'bid_cumulative': bids[:, 1],
+            'ask_prices': asks[:, 0],
+            'ask_cumulative': asks[:, 1],
+            'best_bid': (float(bids[0, 0]), float(bids[0, 1])) if len(bids) else None,
+            'best_ask': (float(asks[0, 0]), float(asks[0, 1])) if len(asks) else None,
+            'update_id': version,
+        }
+
+
+def create_ingest_process(data_fetcher, symbol='BTC/USDT', timeframe='1m', limit=300):
+    """
+    TRADING_INGEST=process 이면 수집 프로세스 생성 (시작은 호출한 쪽에서)
+    재생/기록 모드는 기록 파일을 UI 프로세스가 쓰므로 사용하지 않음 (None)
+    """
+    if INGEST_MODE != 'process':
+        return None
+    if type(data_fetcher) is not DataFetcher or data_fetcher.recorder is not None:
+        print("시세 수집 프로세스는 재생/기록 모드에서 사용하지 않음")
+        return None
+    return IngestProcess(symbol, timeframe, limit, base_url=os.environ.get('TRADING_EXCHANGE_URL'))
@@ -0,0 +1,196 @@
+import bisect
+import gzip
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+from data.data_fetcher import DataFetcher
+
+
+class MarketRecorder:
+    """
+    DataFetcher 가 받은 원본 응답(현재가, OHLCV)과 체결/호가 소스가 받은 체결/호가 스냅샷을 시간 순서대로 파일에 기록
+    FetchScheduler/체결/호가 작업 스레드가 동시에 부르므로 쓰기/닫기는 잠금 하나로 직렬화 (gzip 스트림 보호)
+
+    파일 형식: gzip 으로 압축한 JSON Lines, 한 줄에 한 건
+        {"t": 수신 시각(ms), "k": "ticker" | "ohlcv" | "trades" | "depth", "s": 심볼, "tf": 봉 간격, "p": 원본 응답}
+        trades: 새 체결 목록 [[번호, 시각(ms), 가격, 수량, 'buy' | 'sell'], ...]
+        depth: 호가 스냅샷 {"nonce": 업데이트 번호, "bids": [[가격, 수량], ...], "asks": [...]}
+    """
+
+    def __init__(self, path, flush_every=50):
+        """
+        Args:
+            path: 기록 파일 경로 (예: recordings/session.jsonl.gz)
+            flush_every: 몇 건마다 디스크에 반영할지
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.file = gzip.open(path, 'at', encoding='utf-8')
+        self.flush_every = flush_every
+        self.pending = 0
+        self.lock = threading.Lock()
+
+    def record(self, kind, symbol, payload, timeframe=None, timestamp=None):
+        """
+        응답 한 건 기록
+        Args:
+            kind: 'ticker', 'ohlcv', 'trades', 'depth'
+            symbol: 심볼 (예: BTC/USDT)
+            payload: 거래소 원본 응답
+            timeframe: OHLCV 봉 간격
+            timestamp: 수신 시각(ms), 생략하면 현재 시각
+        """
+        if self.file is None:
+            return
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        entry = {'t': int(timestamp), 'k': kind, 's': symbol, 'p': payload}
+        if timeframe is not None:
+            entry['tf'] = timeframe
+        # JSON 직렬화는 잠금 밖에서 (잠금 안에서는 한 줄 쓰기만)
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+        with self.lock:
+            if self.file is None:
+                return
+            try:
+                self.file.write(line)
+                self.pending += 1
+                if self.pending >= self.flush_every:
+                    self.file.flush()
+                    self.pending = 0
+            except Exception as e:
+                print(f"시세 기록 실패: {e}")
+
+    def close(self):
+        """남은 기록을 쓰고 파일 닫기"""
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+def load_recording(path):
+    """기록 파일 전체를 읽어 수신 시각 순으로 정렬된 리스트로 반환"""
+    entries = []
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entries.append(json.loads(line))
+    entries.sort(key=lambda entry: entry['t'])
+    return entries
+
+
+class ReplayDataFetcher:
+    """
+    기록 파일을 DataFetcher 와 같은 인터페이스로 재생
+
+    - 재생 시각 = 기록 시작 시각 + 경과 시간 × speed (1배, 10배, 100배 등)
+    - 요청 시점의 재생 시각 이전에 받은 가장 최근 응답을 돌려줌
+    - clock 을 지정하면 벽시계 대신 그 함수의 반환값(초)을 경과 시간 계산에 사용
+    """
+
+    def __init__(self, path, speed=1.0, loop=True, clock=None):
+        """
+        Args:
+            path: MarketRecorder 로 만든 기록 파일
+            speed: 재생 배속
+            loop: 기록 끝에 도달하면 처음부터 다시 재생할지
+            clock: 경과 시간 측정 함수 (기본값: time.monotonic)
+        """
+        self.speed = float(speed)
+        self.loop = loop
+        self.clock = clock or time.monotonic
+
+        # (종류, 심볼, 봉 간격)별 수신 시각과 응답 목록
+        self.streams = {}
+        entries = load_recording(path)
+        for entry in entries:
+            key = (entry['k'], entry['s'], entry.get('tf'))
+            times, payloads = self.streams.setdefault(key, ([], []))
+            times.append(entry['t'])
+            payloads.append(entry['p'])
+
+        self.first_time = entries[0]['t'] if entries else 0
+        self.duration = entries[-1]['t'] - self.first_time if entries else 0
+        self.start = self.clock()
+
+    def replay_time(self):
+        """현재 재생 시각 (기록 기준 ms)"""
+        elapsed = (self.clock() - self.start) * 1000 * self.speed
+        if self.loop and self.duration > 0:
+            elapsed %= self.duration + 1
+        return self.first_time + elapsed
+
+    def seek(self, replay_ms):
+        """재생 위치를 기록 기준 시각(ms)으로 이동"""
+        self.start = self.clock() - (replay_ms - self.first_time) / 1000 / self.speed
+
+    def stream(self, kind, symbol, timeframe=None):
+        """(수신 시각 목록, 응답 목록), 기록에 없으면 None"""
+        return self.streams.get((kind, symbol, timeframe))
+
+    def _latest(self, kind, symbol, timeframe=None):
+        """재생 시각 이전의 가장 최근 응답"""
+        stream = self.streams.get((kind, symbol, timeframe))
+        if stream is None:
+            return None
+        times, payloads = stream
+        index = bisect.bisect_right(times, self.replay_time()) - 1
+        if index < 0:
+            return None
+        return payloads[index]
+
+    def fetch_ohlcv(self, symbol='BTC/USDT', timeframe='1m', limit=300):
+        """기록된 OHLCV 응답을 DataFetcher.fetch_ohlcv 와 같은 형식으로 반환"""
+        ohlcv = self._latest('ohlcv', symbol, timeframe)
+        if ohlcv is None:
+            return None, None
+        return DataFetcher.parse_ohlcv(ohlcv[-limit:])
+
+    def get_current_price(self, symbol='BTC/USDT'):
+        """기록된 현재가 응답의 최근 거래가 반환"""
+        ticker = self._latest('ticker', symbol)
+        if ticker is None:
+            return None
+        return ticker['last']
+
+
+def history_dir_for(directory, data_fetcher):
+    """
+    시세 소스별 내보낸 봉 폴더 - 실제 거래소는 directory 그대로, 다른 소스는 하위 폴더
+    가짜 거래소/재생 봉이 실시간 세션이 이어 쓰고 내보내기/백테스트가 읽는 파일에 섞이지 않게 함
+        재생 모드: <directory>/replay
+        TRADING_EXCHANGE_URL: <directory>/<호스트_포트> (예: history/127.0.0.1_8765)
+    """
+    if isinstance(data_fetcher, ReplayDataFetcher):
+        return os.path.join(directory, 'replay')
+    base_url = getattr(data_fetcher, 'base_url', None)
+    if base_url:
+        location = urlparse(base_url).netloc or base_url
+        return os.path.join(directory, re.sub(r'[^A-Za-z0-9.-]+', '_', location))
+    return directory
+
+
+def create_data_fetcher():
+    """
+    환경 변수에 따라 시세 소스 생성
+        TRADING_REPLAY=<파일>        기록 파일 재생 (네트워크 사용 안 함)
+        TRADING_REPLAY_SPEED=<배속>  재생 배속 (기본값 1)
+        TRADING_RECORD=<파일>        실시간 시세를 받으면서 파일에 기록
+        TRADING_EXCHANGE_URL=<주소>  Binance 대신 접속할 거래소 주소 (로컬 가짜 거래소 등)
+    """
+    replay_path = os.environ.get('TRADING_REPLAY')
+    if replay_path:
+        speed = float(os.environ.get('TRADING_REPLAY_SPEED', '1'))
+        print(f"시세 재생 모드: {replay_path} ({speed:g}배속)")
+        return ReplayDataFetcher(replay_path, speed=speed)
+
+    record_path = os.environ.get('TRADING_RECORD')
+    recorder = MarketRecorder(record_path) if record_path else None
+    return DataFetcher(recorder=recorder, base_url=os.environ.get('TRADING_EXCHANGE_URL'))
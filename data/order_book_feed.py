@@ -0,0 +1,267 @@
+import bisect
+import os
+import time
+
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from data.market_recorder import ReplayDataFetcher
+from engine.order_book import OrderBook, SequenceGapError
+from utils.perf_monitor import perf_monitor
+
+
+class RestDepthFeed:
+    """
+    REST 로 호가 스냅샷을 주기적으로 받는 소스 (웹소켓 없이 사용)
+    poll() 은 interval 마다 새 스냅샷 이벤트 한 건을 반환
+    interval 은 주기(초) 또는 주기를 돌려주는 함수 (AdaptivePoller.seconds) - 요청마다 다시 읽음
+    """
+
+    def __init__(self, exchange, symbol='BTC/USDT', limit=100, interval=1.0, recorder=None):
+        self.exchange = exchange
+        self.recorder = recorder  # 받은 스냅샷을 기록할 MarketRecorder (재생 모드에서 다시 보여 줌)
+        self.symbol = symbol
+        self.limit = limit
+        self.interval = interval
+        self.last_time = None
+
+    def snapshot(self):
+        """(업데이트 번호, 매수 호가, 매도 호가)"""
+        order_book = self.exchange.fetch_order_book(self.symbol, limit=self.limit)
+        if self.recorder is not None:
+            self.recorder.record('depth', self.symbol, {'nonce': order_book['nonce'], 'bids': order_book['bids'],
+                                                        'asks': order_book['asks']})
+        return order_book['nonce'], order_book['bids'], order_book['asks']
+
+    def poll(self, timeout):
+        """다음 스냅샷 시각이 되면 스냅샷 이벤트 반환, 아니면 timeout 만큼 대기 후 빈 목록"""
+        now = time.monotonic()
+        interval = (self.interval() if callable(self.interval) else self.interval) or 1.0
+        if self.last_time is not None and now < self.last_time + interval:
+            time.sleep(min(timeout, self.last_time + interval - now))
+            return []
+        self.last_time = now
+        return [{'snapshot': self.snapshot()}]
+
+
+class ReplayDepthFeed:
+    """
+    기록 파일의 호가 스냅샷을 재생 시각에 맞춰 내보내는 소스 (ReplayDataFetcher 와 같은 시계)
+    재생 시각 이전의 가장 최근 스냅샷이 바뀔 때마다 스냅샷 이벤트 한 건
+    """
+
+    def __init__(self, fetcher, symbol='BTC/USDT'):
+        self.fetcher = fetcher
+        self.times, self.payloads = fetcher.stream('depth', symbol)
+        self.index = None
+
+    def current(self):
+        """재생 시각 이전의 가장 최근 스냅샷 위치 (아직 없으면 첫 스냅샷)"""
+        return max(bisect.bisect_right(self.times, self.fetcher.replay_time()) - 1, 0)
+
+    def snapshot(self):
+        """(업데이트 번호, 매수 호가, 매도 호가)"""
+        self.index = self.current()
+        book = self.payloads[self.index]
+        return book['nonce'], book['bids'], book['asks']
+
+    def poll(self, timeout):
+        time.sleep(timeout)
+        if self.current() == self.index:
+            return []
+        return [{'snapshot': self.snapshot()}]
+
+
+class SyntheticDepthFeed:
+    """
+    가짜 호가 델타 스트림 (Binance 깊이 스트림 형식)
+
+    - 초당 rate 건의 델타 이벤트 {'U': 첫 번호, 'u': 마지막 번호, 'b': 매수 변경, 'a': 매도 변경}
+    - gap_rate 확률로 이벤트 하나를 빠뜨려 재동기화 경로를 시험
+    """
+
+    def __init__(self, mid_price=60000.0, tick=0.1, levels=400, rate=300, gap_rate=0.0, seed=0):
+        self.rng = np.random.default_rng(seed)
+        self.tick = tick
+        self.levels = levels
+        self.rate = rate
+        self.gap_rate = gap_rate
+        self.mid_ticks = int(round(mid_price / tick))
+        self.update_id = 1
+        self.last_time = time.monotonic()
+
+        # 틱 단위 정수 가격 → 수량
+        self.bids = {self.mid_ticks - i: self._quantity() for i in range(1, levels + 1)}
+        self.asks = {self.mid_ticks + i: self._quantity() for i in range(1, levels + 1)}
+
+    def _quantity(self):
+        return float(np.round(self.rng.gamma(1.5, 0.4), 4))
+
+    def snapshot(self):
+        """(업데이트 번호, 매수 호가, 매도 호가)"""
+        bids = [[p * self.tick, q] for p, q in sorted(self.bids.items(), reverse=True)]
+        asks = [[p * self.tick, q] for p, q in sorted(self.asks.items())]
+        return self.update_id, bids, asks
+
+    def _next_event(self):
+        """호가 변경 한 건 생성 후 내부 호가에 반영"""
+        bid_changes, ask_changes = {}, {}
+
+        # 가끔 중간 가격 이동 → 반대편으로 넘어간 레벨 삭제
+        if self.rng.random() < 0.05:
+            self.mid_ticks += int(self.rng.choice((-2, -1, 1, 2)))
+            for price in [p for p in self.bids if p >= self.mid_ticks]:
+                bid_changes[price] = 0.0
+            for price in [p for p in self.asks if p <= self.mid_ticks]:
+                ask_changes[price] = 0.0
+
+        # 중간 가격 근처 레벨 몇 개의 수량 변경 (10% 는 삭제)
+        for changes, side in ((bid_changes, -1), (ask_changes, 1)):
+            offsets = self.rng.geometric(0.05, self.rng.integers(1, 4))
+            for offset in np.minimum(offsets, self.levels):
+                price = self.mid_ticks + side * int(offset)
+                changes[price] = 0.0 if self.rng.random() < 0.1 else self._quantity()
+
+        for book, changes in ((self.bids, bid_changes), (self.asks, ask_changes)):
+            for price, quantity in changes.items():
+                if quantity == 0:
+                    book.pop(price, None)
+                else:
+                    book[price] = quantity
+
+        first_id = self.update_id + 1
+        self.update_id += int(self.rng.integers(1, 4))
+        return {
+            'U': first_id,
+            'u': self.update_id,
+            'b': [[p * self.tick, q] for p, q in bid_changes.items()],
+            'a': [[p * self.tick, q] for p, q in ask_changes.items()],
+        }
+
+    def poll(self, timeout):
+        """지난 호출 이후 rate 에 맞는 개수의 이벤트 반환"""
+        time.sleep(timeout)
+        now = time.monotonic()
+        count = min(int((now - self.last_time) * self.rate), self.rate)
+        self.last_time += count / self.rate if count < self.rate else now - self.last_time
+        events = []
+        for _ in range(count):
+            event = self._next_event()
+            if self.gap_rate and self.rng.random() < self.gap_rate:
+                continue  # 전송 중 유실
+            events.append(event)
+        return events
+
+
+def create_depth_feed(data_fetcher, symbol='BTC/USDT', interval=1.0):
+    """
+    호가 소스 생성
+        TRADING_DEPTH_FEED=synthetic 이면 가짜 델타 스트림
+        재생 모드: 기록된 호가 스냅샷 재생 (기록에 호가가 없으면 None - 가짜 호가를 기록된 봉 옆에 보여 주지 않음)
+        그 외에는 REST 스냅샷 (interval: 주기(초) 또는 주기를 돌려주는 함수, 기록 모드면 받은 스냅샷도 기록)
+    """
+    if os.environ.get('TRADING_DEPTH_FEED') == 'synthetic':
+        return SyntheticDepthFeed()
+    if isinstance(data_fetcher, ReplayDataFetcher):
+        if data_fetcher.stream('depth', symbol) is None:
+            return None
+        return ReplayDepthFeed(data_fetcher, symbol)
+    # 작업 스레드에서 쓸 전용 거래소 객체 (ccxt 클라이언트는 스레드끼리 같이 쓰면 안 됨)
+    create_exchange = getattr(data_fetcher, 'create_exchange', None)
+    if create_exchange is None:
+        return SyntheticDepthFeed()
+    return RestDepthFeed(create_exchange(), symbol, interval=interval, recorder=getattr(data_fetcher, 'recorder', None))
+
+
+class BookSync:
+    """
+    호가 소스를 읽어 OrderBook 에 반영 (작업 스레드와 수집 프로세스에서 같이 사용)
+    스냅샷 → 델타 순서로 반영하고, 업데이트 번호가 끊기면 스냅샷부터 다시 받음
+    """
+
+    def __init__(self, feed, symbol='BTC/USDT'):
+        self.feed = feed
+        self.book = OrderBook(symbol)
+        self.resync_count = 0
+
+    def resync(self):
+        """스냅샷 다시 받기, 성공하면 'synced'"""
+        try:
+            with perf_monitor.stage('book_snapshot'):
+                self.book.apply_snapshot(*self.feed.snapshot())
+            return 'synced'
+        except Exception as e:
+            print(f"호가 스냅샷 가져오기 실패: {e}")
+            time.sleep(1.0)
+            return None
+
+    def step(self, timeout):
+        """
+        소스를 한 번 읽어서 반영 (동기화 전이면 스냅샷부터)
+        Returns:
+            상태 변화 ('synced', 'resync: ...'), 없으면 None
+        """
+        if not self.book.synced:
+            return self.resync()
+
+        try:
+            events = self.feed.poll(timeout)
+        except Exception as e:
+            print(f"호가 가져오기 실패: {e}")
+            time.sleep(1.0)
+            return None
+
+        with perf_monitor.stage('book_apply'):
+            for event in events:
+                if 'snapshot' in event:
+                    self.book.apply_snapshot(*event['snapshot'])
+                    continue
+                try:
+                    self.book.apply_delta(event['U'], event['u'], event['b'], event['a'])
+                except SequenceGapError as e:
+                    self.resync_count += 1
+                    return f'resync: {e}'
+        return None
+
+
+class OrderBookThread(QThread):
+    """
+    호가 소스를 읽어 OrderBook 을 갱신하는 작업 스레드
+
+    - 스냅샷 → 델타 순서로 반영하고, 업데이트 번호가 끊기면 스냅샷부터 다시 받음 (BookSync)
+    - 초당 수백 건의 델타를 받아도 UI 로는 publish_hz 번까지만 깊이 스냅샷을 보냄
+    """
+
+    depth_updated = pyqtSignal(object)  # OrderBook.depth() 결과
+    status_changed = pyqtSignal(str)
+
+    def __init__(self, feed, symbol='BTC/USDT', levels=100, publish_hz=10, parent=None):
+        super().__init__(parent)
+        self.sync = BookSync(feed, symbol)
+        self.book = self.sync.book
+        self.levels = levels
+        self.publish_interval = 1.0 / publish_hz
+        self.running = False
+
+    def stop(self):
+        """스레드 종료 요청 후 대기"""
+        self.running = False
+        self.wait(2000)
+
+    def run(self):
+        self.running = True
+        last_publish = 0.0
+        published_id = None
+        while self.running:
+            status = self.sync.step(0.02)
+            if status is not None:
+                self.status_changed.emit(status)
+
+            now = time.monotonic()
+            if self.book.synced and self.book.last_update_id != published_id \
+                    and now - last_publish >= self.publish_interval:
+                depth = self.book.depth(self.levels)
+                depth['resyncs'] = self.sync.resync_count
+                self.depth_updated.emit(depth)
+                published_id = self.book.last_update_id
+                last_publish = now
@@ -0,0 +1,75 @@
+import json
+import os
+
+import numpy as np
+
+# 종료할 때 저장하고 다음 시작 때 바로 그리는 세션 스냅샷 파일
+SNAPSHOT_PATH = os.environ.get('TRADING_SNAPSHOT', os.path.join('session', 'snapshot.npz'))
+SNAPSHOT_VERSION = 1
+
+
+def thin_marks(timestamps, equity, bucket_ms=60 * 1000):
+    """
+    자산 이력을 bucket_ms 구간마다 첫 값만 남겨 줄임 (마지막 값은 항상 유지)
+    일/주/월 기간 경계는 구간 경계와 겹치므로 기간 시작 자산은 그대로 보존됨
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    if len(timestamps) == 0:
+        return timestamps, np.asarray(equity, dtype=np.float64)
+    buckets = timestamps // bucket_ms
+    keep = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+    if keep[-1] != len(timestamps) - 1:
+        keep = np.append(keep, len(timestamps) - 1)
+    return timestamps[keep], np.asarray(equity, dtype=np.float64)[keep]
+
+
+def save_snapshot(path, candles, equity_timestamps, equity, meta):
+    """
+    세션 스냅샷 저장 - 임시 파일에 쓴 뒤 교체 (저장 중에 꺼져도 이전 스냅샷이 남음)
+    Args:
+        candles: (N, 6) [시각(ms), 시가, 고가, 저가, 종가, 거래량]
+        equity_timestamps, equity: 자산 이력 (thin_marks 로 줄여서 저장)
+        meta: JSON 으로 저장할 나머지 값 (현재가, 포지션, 화면 범위 등)
+    """
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        equity_timestamps, equity = thin_marks(equity_timestamps, equity)
+        meta = dict(meta, version=SNAPSHOT_VERSION)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                candles=np.asarray(candles, dtype=np.float64).reshape(-1, 6),
+                equity_timestamps=equity_timestamps,
+                equity=equity,
+                meta=np.array(json.dumps(meta, ensure_ascii=False)),
+            )
+        os.replace(temp_path, path)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        print(f"세션 스냅샷 저장 실패: {e}")
+        return False
+
+
+def load_snapshot(path):
+    """
+    세션 스냅샷 읽기
+    Returns:
+        {'candles', 'equity_timestamps', 'equity', **meta}, 없거나 읽을 수 없으면 None
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            snapshot = json.loads(str(data['meta']))
+            if snapshot.get('version') != SNAPSHOT_VERSION:
+                return None
+            snapshot['candles'] = data['candles']
+            snapshot['equity_timestamps'] = data['equity_timestamps']
+            snapshot['equity'] = data['equity']
+        return snapshot
+    except (OSError, KeyError, ValueError) as e:
+        print(f"세션 스냅샷 읽기 실패: {e}")
+        return None
@@ -0,0 +1,136 @@
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# 헤더 (int64 8칸): [seqlock 번호, 버전, 시작 위치, 봉/행 개수, 최대 행 수, 열 수, 예비, 예비]
+SEQ, VERSION, START, SIZE, CAPACITY, COLUMNS = range(6)
+HEADER_SLOTS = 8
+
+
+class SeqlockTimeout(RuntimeError):
+    """쓰는 쪽이 계속 쓰는 중이라 일관된 값을 읽지 못함"""
+
+
+class SharedRing:
+    """
+    프로세스 사이에 공유하는 행 링 버퍼 (multiprocessing.shared_memory, float64)
+
+    - 쓰는 프로세스 하나, 읽는 프로세스 여럿 (seqlock)
+        * 쓰기: 번호를 홀수로 올림 → 행/헤더 기록 → 번호를 짝수로 올림
+        * 읽기: 번호 확인(홀수면 다시) → 필요한 행만 복사 → 번호가 그대로면 성공, 바뀌었으면 다시
+    - 읽는 쪽은 공유 메모리를 numpy 배열로 바로 매핑 (직렬화/pickle 없음, 필요한 구간만 한 번 복사)
+    - CandleRingBuffer 처럼 각 행을 [i] 와 [i + capacity] 두 곳에 써서 어떤 구간이든 연속된 배열
+    - x86 은 저장 순서가 보장되므로 별도 메모리 배리어 없이 번호 → 데이터 → 번호 순서가 유지됨
+    """
+
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        self.header = np.ndarray((HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        self.capacity = int(self.header[CAPACITY])
+        self.columns = int(self.header[COLUMNS])
+        self.data = np.ndarray((self.capacity * 2, self.columns), dtype=np.float64,
+                               buffer=shm.buf, offset=HEADER_SLOTS * 8)
+
+    @classmethod
+    def create(cls, capacity, columns):
+        """새 공유 메모리 생성 (만든 프로세스가 close() 할 때 삭제)"""
+        size = HEADER_SLOTS * 8 + capacity * 2 * columns * 8
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        header = np.ndarray((HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[CAPACITY] = capacity
+        header[COLUMNS] = columns
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        다른 프로세스가 만든 공유 메모리 연결
+        spawn 으로 띄운 자식 프로세스는 부모의 resource_tracker 를 같이 쓰므로 등록은 그대로 둠
+        (자식이 등록을 해제하면 부모의 등록까지 지워져서 삭제할 때 추적기가 오류를 냄)
+        """
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def nbytes(self):
+        return self.shm.size
+
+    def version(self):
+        """쓸 때마다 1 씩 오르는 번호 (새 값이 있는지 복사 없이 확인)"""
+        return int(self.header[VERSION])
+
+    # ---- 쓰는 쪽 (프로세스 하나) ----
+
+    def _begin(self):
+        self.header[SEQ] += 1  # 홀수 = 쓰는 중
+
+    def _end(self):
+        self.header[VERSION] += 1
+        self.header[SEQ] += 1
+
+    def append(self, rows):
+        """행 여러 개를 끝에 추가, 넘치면 가장 오래된 행부터 덮어씀"""
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, self.columns)[-self.capacity:]
+        n = len(rows)
+        if n == 0:
+            return
+        self._begin()
+        start, size = int(self.header[START]), int(self.header[SIZE])
+        positions = (start + size + np.arange(n)) % self.capacity
+        self.data[positions] = rows
+        self.data[positions + self.capacity] = rows
+        overflow = max(0, size + n - self.capacity)
+        self.header[START] = (start + overflow) % self.capacity
+        self.header[SIZE] = size + n - overflow
+        self._end()
+
+    def replace(self, rows):
+        """내용 전체를 rows 로 교체 (최근 capacity 개)"""
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, self.columns)[-self.capacity:]
+        n = len(rows)
+        self._begin()
+        self.data[:n] = rows
+        self.data[self.capacity:self.capacity + n] = rows
+        self.header[START] = 0
+        self.header[SIZE] = n
+        self._end()
+
+    # ---- 읽는 쪽 ----
+
+    def read(self, count=None, retries=1000):
+        """
+        최근 count 개 행의 일관된 복사본
+        Returns:
+            (버전, (N, 열 수) 배열)
+        """
+        for attempt in range(retries):
+            seq = int(self.header[SEQ])
+            if seq % 2 == 0:
+                version = int(self.header[VERSION])
+                start, size = int(self.header[START]), int(self.header[SIZE])
+                n = size if count is None else min(count, size)
+                begin = start + size - n
+                rows = self.data[begin:begin + n].copy()
+                if int(self.header[SEQ]) == seq:
+                    return version, rows
+            if attempt % 100 == 99:
+                time.sleep(0)  # 쓰는 프로세스에 양보
+        raise SeqlockTimeout(f"공유 메모리 {self.name} 읽기 실패")
+
+    def close(self):
+        """매핑 해제 (만든 쪽이면 공유 메모리 삭제)"""
+        self.header = None
+        self.data = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
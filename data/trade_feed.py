@@ -0,0 +1,230 @@
+import bisect
+import os
+import time
+
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from data.market_recorder import ReplayDataFetcher
+from engine.trade_tape import BUY, SELL
+
+
+def empty_batch():
+    return {
+        'timestamps': np.empty(0, dtype=np.int64),
+        'prices': np.empty(0),
+        'sizes': np.empty(0),
+        'sides': np.empty(0, dtype=np.int8),
+    }
+
+
+def concat_batches(batches):
+    """체결 묶음 여러 개를 하나로 합침"""
+    if not batches:
+        return empty_batch()
+    return {key: np.concatenate([batch[key] for batch in batches]) for key in empty_batch()}
+
+
+def rows_to_batch(rows):
+    """[[번호, 시각(ms), 가격, 수량, 'buy' | 'sell'], ...] → 체결 묶음"""
+    if not rows:
+        return empty_batch()
+    return {
+        'timestamps': np.array([row[1] for row in rows], dtype=np.int64),
+        'prices': np.array([row[2] for row in rows], dtype=np.float64),
+        'sizes': np.array([row[3] for row in rows], dtype=np.float64),
+        'sides': np.array([BUY if row[4] == 'buy' else SELL for row in rows], dtype=np.int8),
+    }
+
+
+class RestTradeFeed:
+    """
+    REST 로 최근 체결을 주기적으로 받는 소스
+    이미 받은 체결 번호 이하는 버려서 겹치는 구간을 제거
+    interval 은 주기(초) 또는 주기를 돌려주는 함수 (AdaptivePoller.seconds) - 요청마다 다시 읽음
+
+    한 주기 사이에 limit 건보다 많이 체결되면 받은 체결의 첫 번호가 last_id + 1 보다 커짐
+    → fromId 로 빠진 구간을 최대 backfill_pages 번 (번마다 1000건) 다시 받아서 채움
+    그래도 다 못 채우면 missed 에 빠진 건수를 더함 (TradeFeedThread 가 gap_detected 로 알림)
+    """
+
+    BACKFILL_LIMIT = 1000
+
+    def __init__(self, exchange, symbol='BTC/USDT', limit=500, interval=1.0, backfill_pages=3, recorder=None):
+        self.exchange = exchange
+        self.recorder = recorder  # 받은 체결을 기록할 MarketRecorder (재생 모드에서 다시 보여 줌)
+        self.symbol = symbol
+        self.limit = limit
+        self.interval = interval
+        self.backfill_pages = backfill_pages
+        self.last_time = None
+        self.last_id = None
+        self.missed = 0  # 채우지 못하고 건너뛴 체결 수 (읽으면 0 으로)
+
+    def poll(self, timeout):
+        """새 체결 묶음 반환 (없으면 빈 묶음)"""
+        now = time.monotonic()
+        interval = (self.interval() if callable(self.interval) else self.interval) or 1.0
+        if self.last_time is not None and now < self.last_time + interval:
+            time.sleep(min(timeout, self.last_time + interval - now))
+            return empty_batch()
+        self.last_time = now
+
+        trades = self.exchange.fetch_trades(self.symbol, limit=self.limit)
+        if self.last_id is not None:
+            trades = [t for t in trades if int(t['id']) > self.last_id]
+            if trades and int(trades[0]['id']) > self.last_id + 1:
+                trades = self.backfill(int(trades[0]['id'])) + trades
+        if not trades:
+            return empty_batch()
+        self.last_id = int(trades[-1]['id'])
+        rows = [[int(t['id']), t['timestamp'], t['price'], t['amount'], t['side']] for t in trades]
+        if self.recorder is not None:
+            self.recorder.record('trades', self.symbol, rows)
+        return rows_to_batch(rows)
+
+
+    def backfill(self, first_id):
+        """
+        last_id 다음부터 first_id 앞까지 빠진 체결을 fromId 로 다시 받음
+        Returns:
+            받은 체결 목록 (번호 순), 다 못 받은 건수는 missed 에 더함
+        """
+        backfilled = []
+        next_id = self.last_id + 1
+        for _ in range(self.backfill_pages):
+            page = self.exchange.fetch_trades(self.symbol, limit=self.BACKFILL_LIMIT,
+                                              params={'fromId': next_id})
+            page = [t for t in page if next_id <= int(t['id']) < first_id]
+            if not page:
+                break
+            backfilled.extend(page)
+            next_id = int(page[-1]['id']) + 1
+            if next_id >= first_id:
+                break
+        self.missed += first_id - next_id
+        return backfilled
+
+
+class SyntheticTradeFeed:
+    """
+    가짜 체결 스트림
+    평소에는 초당 rate 건, burst_every 초마다 burst_rate 건으로 몰려 들어옴
+    """
+
+    def __init__(self, price=60000.0, rate=5, burst_rate=400, burst_every=20.0, seed=0):
+        self.rng = np.random.default_rng(seed)
+        self.price = price
+        self.rate = rate
+        self.burst_rate = burst_rate
+        self.burst_every = burst_every
+        self.start = time.monotonic()
+        self.last_time = self.start
+
+    def poll(self, timeout):
+        time.sleep(timeout)
+        now = time.monotonic()
+        elapsed = now - self.last_time
+        in_burst = (now - self.start) % self.burst_every < 3.0
+        count = self.rng.poisson((self.burst_rate if in_burst else self.rate) * elapsed)
+        self.last_time = now
+        if count == 0:
+            return empty_batch()
+
+        now_ms = int(time.time() * 1000)
+        offsets = np.sort(self.rng.uniform(-elapsed * 1000, 0, count)).astype(np.int64)
+        prices = self.price + np.cumsum(self.rng.normal(0, 0.5, count))
+        self.price = float(prices[-1])
+        return {
+            'timestamps': now_ms + offsets,
+            'prices': np.round(prices, 1),
+            'sizes': np.round(self.rng.gamma(1.2, 0.02, count), 5),
+            'sides': np.where(self.rng.random(count) < 0.5, BUY, SELL).astype(np.int8),
+        }
+
+
+class ReplayTradeFeed:
+    """
+    기록 파일의 체결을 재생 시각에 맞춰 내보내는 소스 (ReplayDataFetcher 와 같은 시계)
+    기록 끝에서 처음으로 돌아가면 남은 체결과 처음 체결을 이어서 내보냄
+    """
+
+    def __init__(self, fetcher, symbol='BTC/USDT'):
+        self.fetcher = fetcher
+        self.times, self.payloads = fetcher.stream('trades', symbol)
+        self.cursor = bisect.bisect_right(self.times, fetcher.replay_time())
+
+    def poll(self, timeout):
+        time.sleep(timeout)
+        index = bisect.bisect_right(self.times, self.fetcher.replay_time())
+        if index < self.cursor:
+            payloads = self.payloads[self.cursor:] + self.payloads[:index]
+        else:
+            payloads = self.payloads[self.cursor:index]
+        self.cursor = index
+        return rows_to_batch([row for rows in payloads for row in rows])
+
+
+def create_trade_feed(data_fetcher, symbol='BTC/USDT', interval=1.0):
+    """
+    체결 소스 생성
+        TRADING_TRADE_FEED=synthetic 이면 가짜 체결 스트림
+        재생 모드: 기록된 체결 재생 (기록에 체결이 없으면 None - 가짜 체결을 기록된 봉 옆에 보여 주지 않음)
+        그 외에는 REST 최근 체결 (interval: 주기(초) 또는 주기를 돌려주는 함수, 기록 모드면 받은 체결도 기록)
+    """
+    if os.environ.get('TRADING_TRADE_FEED') == 'synthetic':
+        return SyntheticTradeFeed()
+    if isinstance(data_fetcher, ReplayDataFetcher):
+        if data_fetcher.stream('trades', symbol) is None:
+            return None
+        return ReplayTradeFeed(data_fetcher, symbol)
+    # 작업 스레드에서 쓸 전용 거래소 객체 (ccxt 클라이언트는 스레드끼리 같이 쓰면 안 됨)
+    create_exchange = getattr(data_fetcher, 'create_exchange', None)
+    if create_exchange is None:
+        return SyntheticTradeFeed()
+    return RestTradeFeed(create_exchange(), symbol, interval=interval, recorder=getattr(data_fetcher, 'recorder', None))
+
+
+class TradeFeedThread(QThread):
+    """
+    체결 소스를 읽는 작업 스레드
+    받은 체결을 모아서 UI 로는 publish_hz 번까지만 한 묶음으로 전달
+    """
+
+    trades_received = pyqtSignal(object)  # {'timestamps', 'prices', 'sizes', 'sides'}
+    gap_detected = pyqtSignal(int)        # 다시 받지 못하고 건너뛴 체결 수
+
+    def __init__(self, feed, publish_hz=10, parent=None):
+        super().__init__(parent)
+        self.feed = feed
+        self.publish_interval = 1.0 / publish_hz
+        self.running = False
+
+    def stop(self):
+        """스레드 종료 요청 후 대기"""
+        self.running = False
+        self.wait(2000)
+
+    def run(self):
+        self.running = True
+        pending = []
+        last_publish = 0.0
+        while self.running:
+            try:
+                batch = self.feed.poll(0.02)
+            except Exception as e:
+                print(f"체결 내역 가져오기 실패: {e}")
+                time.sleep(1.0)
+                continue
+            if len(batch['timestamps']):
+                pending.append(batch)
+            missed = getattr(self.feed, 'missed', 0)
+            if missed:
+                self.feed.missed = 0
+                self.gap_detected.emit(missed)
+
+            now = time.monotonic()
+            if pending and now - last_publish >= self.publish_interval:
+                self.trades_received.emit(concat_batches(pending))
+                pending = []
+                last_publish = now
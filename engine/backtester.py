@@ -0,0 +1,171 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from engine.indicator_engine import ema_batch
+from engine.position_engine import Fill
+
+# 기본 비용 - 테이커 수수료 0.04%, 슬리피지 1bp
+FEE_RATE = 0.0004
+SLIPPAGE_BPS = 1.0
+
+
+def rolling_mean(values, period):
+    """길이 period 단순 이동평균 (앞부분 period - 1 개는 NaN)"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        cs = np.cumsum(np.insert(values, 0, 0.0))
+        out[period - 1:] = (cs[period:] - cs[:-period]) / period
+    return out
+
+
+def forward_fill(values):
+    """NaN 을 직전 값으로 채움 (처음부터 NaN 이면 0)"""
+    valid = ~np.isnan(values)
+    index = np.maximum.accumulate(np.where(valid, np.arange(len(values)), 0))
+    out = values[index]
+    out[~valid[index]] = 0.0
+    return out
+
+
+# ----------------------------------------------------------------------
+# 전략 - OHLCV 배열 → 봉마다 목표 포지션 (+1 롱, -1 숏, 0 무포지션), i 번째 값은 i 번째 봉 종가까지만 사용
+# ----------------------------------------------------------------------
+
+def sma_cross(open_, high, low, close, fast=20, slow=60):
+    """빠른 이동평균이 느린 이동평균 위면 롱, 아래면 숏"""
+    fast_ma, slow_ma = rolling_mean(close, fast), rolling_mean(close, slow)
+    return np.nan_to_num(np.sign(fast_ma - slow_ma))
+
+
+def rsi_reversion(open_, high, low, close, period=14, lower=30.0, upper=70.0):
+    """RSI 가 lower 아래면 롱, upper 위면 숏 진입, 50 을 지나면 청산"""
+    change = np.diff(close, prepend=close[0])
+    alpha = 1.0 / period  # Wilder 평활
+    avg_gain = ema_batch(np.maximum(change, 0.0), alpha)
+    avg_loss = ema_batch(np.maximum(-change, 0.0), alpha)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+
+    # 진입/청산 조건이 생긴 봉에만 값을 두고 나머지는 직전 상태 유지
+    events = np.full(len(close), np.nan)
+    above = rsi >= 50.0
+    crossed = np.flatnonzero(above[1:] != above[:-1]) + 1
+    events[crossed] = 0.0
+    events[rsi < lower] = 1.0
+    events[rsi > upper] = -1.0
+    events[:period] = 0.0
+    return forward_fill(events)
+
+
+def breakout(open_, high, low, close, window=60):
+    """직전 window 개 봉의 최고가를 넘으면 롱, 최저가를 깨면 숏 (반대 신호까지 유지)"""
+    events = np.full(len(close), np.nan)
+    if len(close) > window:
+        upper = sliding_window_view(high, window)[:-1].max(axis=1)
+        lower = sliding_window_view(low, window)[:-1].min(axis=1)
+        tail = close[window:]
+        events[window:][tail > upper] = 1.0
+        events[window:][tail < lower] = -1.0
+    return forward_fill(events)
+
+
+STRATEGIES = {
+    'SMA Cross': sma_cross,
+    'RSI Reversion': rsi_reversion,
+    'Breakout': breakout,
+}
+
+
+class BacktestResult:
+    """
+    백테스트 결과
+        mark_times, equity: 봉 종가 시점의 자산 (ReturnsEngine.load_history 에 그대로 사용)
+        fills: 체결 목록 (Fill), trade_times / trade_prices / trade_kinds: 차트 마커용
+        stats: 전체 수익률, 최대 낙폭, 체결 수, 수수료 합, 승률
+    """
+
+    def __init__(self, mark_times, equity, fills, trade_times, trade_prices, trade_kinds, stats):
+        self.mark_times = mark_times
+        self.equity = equity
+        self.fills = fills
+        self.trade_times = trade_times
+        self.trade_prices = trade_prices
+        self.trade_kinds = trade_kinds
+        self.stats = stats
+
+
+def run_backtest(timestamps, open_, high, low, close, signal, initial_balance=10000.0, leverage=1.0,
+                 fee_rate=FEE_RATE, slippage_bps=SLIPPAGE_BPS, symbol='BTC'):
+    """
+    목표 포지션 신호로 백테스트 (봉 단위 반복문 없이 벡터 연산)
+
+    - i 번째 봉 종가까지 보고 정한 신호를 i+1 번째 봉 시가에 체결 (미래 정보 사용 없음)
+    - 체결가 = 시가 × (1 ± 슬리피지), 사는 쪽은 비싸게/파는 쪽은 싸게, 수수료 = 체결 금액 × fee_rate
+    - 포지션이 바뀔 때마다 그때 자산 × leverage 만큼 진입하고 다음 변경까지 수량 유지
+      → 구간 k 의 시작 자산 E_k = E_{k-1} × f_k 이므로 구간별 배율 f 의 누적곱으로 계산
+      → 구간 안의 봉은 E_k + 수량 × (종가 - 진입가)
+    Args:
+        timestamps: 봉 시작 시각 (ms)
+        signal: 봉마다 목표 포지션 (부호만 사용)
+    """
+    n = len(close)
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    exposure = np.zeros(n)
+    exposure[1:] = np.sign(np.asarray(signal, dtype=np.float64)[:-1]) * leverage
+
+    # 포지션 구간 (첫 구간은 항상 무포지션, 이후 구간 시작 = 체결)
+    starts = np.flatnonzero(np.diff(exposure, prepend=np.nan))
+    segment_exposure = exposure[starts]
+    previous_exposure = np.concatenate(([0.0], segment_exposure[:-1]))
+    direction = np.sign(segment_exposure - previous_exposure)
+    prices = open_[starts] * (1.0 + direction * slippage_bps / 1e4)
+    prices[0] = open_[0]
+
+    # 구간 배율: 직전 포지션 평가 후 체결 금액만큼 수수료 차감 (자산 대비 비율)
+    move = np.ones(len(starts))
+    move[1:] = prices[1:] / prices[:-1]
+    marked = 1.0 + previous_exposure * (move - 1.0)
+    traded = np.abs(segment_exposure * marked - previous_exposure * move)
+    factor = marked - fee_rate * traded
+    segment_equity = initial_balance * np.cumprod(factor)
+    quantity = segment_exposure * segment_equity / prices
+
+    # 봉별 자산 (종가 평가)
+    segment = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    equity = segment_equity[segment] + quantity[segment] * (close - prices[segment])
+    bar_ms = int(np.median(np.diff(timestamps))) if n > 1 else 60000
+    mark_times = timestamps + bar_ms
+
+    # 체결 (첫 구간 제외)
+    trades = np.arange(1, len(starts))
+    before = np.concatenate(([initial_balance], segment_equity[:-1]))
+    fees = before * fee_rate * traded
+    realized = quantity[trades - 1] * (prices[trades] - prices[trades - 1])
+    trade_times = timestamps[starts[trades]]
+    fills = [Fill(int(t), symbol, float(q), float(p), float(f), float(r)) for t, q, p, f, r in zip(
+        trade_times, np.diff(quantity), prices[trades], fees[trades], realized)]
+
+    # 마커: 청산 후 진입 순서 (반대 포지션으로 바뀌면 두 개)
+    kinds, times, marker_prices = [], [], []
+    for t, p, old, new in zip(trade_times.tolist(), prices[trades].tolist(),
+                              previous_exposure[trades].tolist(), segment_exposure[trades].tolist()):
+        if old:
+            kinds.append('LONG_CLOSE' if old > 0 else 'SHORT_CLOSE')
+            times.append(t)
+            marker_prices.append(p)
+        if new:
+            kinds.append('LONG_OPEN' if new > 0 else 'SHORT_OPEN')
+            times.append(t)
+            marker_prices.append(p)
+
+    peak = np.maximum.accumulate(equity) if n else equity
+    closing = realized[previous_exposure[trades] != 0]
+    stats = {
+        'total_return': float((equity[-1] / initial_balance - 1.0) * 100.0) if n else 0.0,
+        'max_drawdown': float(((equity / peak) - 1.0).min() * 100.0) if n else 0.0,
+        'trades': len(fills),
+        'fees': float(fees[trades].sum()),
+        'win_rate': float((closing > 0).mean() * 100.0) if len(closing) else 0.0,
+    }
+    return BacktestResult(mark_times, equity, fills, np.asarray(times, dtype=np.int64),
+                          np.asarray(marker_prices), kinds, stats)
@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+
+from engine.candle_buffer import CandleRingBuffer, retention_for, spill_path_for
+
+# 봉 간격 단위 → 밀리초
+UNIT_MS = {'s': 1000, 'm': 60 * 1000, 'h': 60 * 60 * 1000, 'd': 24 * 60 * 60 * 1000}
+
+
+def timeframe_to_ms(timeframe):
+    """'5s', '1m', '4h' 같은 봉 간격 문자열 → 밀리초"""
+    return int(timeframe[:-1]) * UNIT_MS[timeframe[-1]]
+
+
+def resample_ohlcv(ohlcv, timeframe_ms):
+    """
+    작은 간격의 OHLCV 를 timeframe_ms 간격으로 묶음 (예: 1초봉 → 5초봉)
+    Args:
+        ohlcv: (N, 6) [시각(ms), 시가, 고가, 저가, 종가, 거래량], 시간 순서
+    """
+    ohlcv = np.asarray(ohlcv, dtype=np.float64)
+    if len(ohlcv) == 0:
+        return ohlcv.reshape(0, 6)
+    buckets = ohlcv[:, 0].astype(np.int64) // timeframe_ms
+    starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+    ends = np.append(starts[1:], len(ohlcv)) - 1
+    return np.column_stack((
+        buckets[starts] * timeframe_ms,
+        ohlcv[starts, 1],
+        np.maximum.reduceat(ohlcv[:, 2], starts),
+        np.minimum.reduceat(ohlcv[:, 3], starts),
+        ohlcv[ends, 4],
+        np.add.reduceat(ohlcv[:, 5], starts),
+    ))
+
+
+class BarAggregator:
+    """
+    체결을 받아 원하는 간격의 OHLCV 봉을 직접 만드는 집계기
+
+    - 체결 한 건마다 진행 중인 봉의 고가/저가/종가/거래량만 갱신 (O(1))
+    - 체결이 없던 구간은 직전 종가로 거래량 0 인 봉을 채움 (거래소 klines 와 동일)
+    - reconcile() 로 거래소 klines 를 받아 확정된 봉을 거래소 값으로 맞춤
+    - 봉은 CandleRingBuffer 에 보관 (봉 간격별 보관 개수만큼, 넘치는 봉은 spill_dir 로 내보냄)
+    """
+
+    FIELDS = ('open', 'high', 'low', 'close', 'volume')
+    TIME, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
+
+    def __init__(self, timeframe='1m', capacity=None, symbol='BTC/USDT', spill_dir=None):
+        """
+        Args:
+            capacity: 보관할 봉 개수 (None 이면 봉 간격별 기본값, retention_for 참고)
+            spill_dir: 보관 개수를 넘긴 봉을 기록할 폴더 (None 이면 버림)
+        """
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.timeframe_ms = timeframe_to_ms(timeframe)
+        self.capacity = capacity or retention_for(timeframe)
+        spill_path = spill_path_for(spill_dir, symbol, timeframe) if spill_dir else None
+        self.bars = CandleRingBuffer(self.capacity, spill_path)
+        self.version = 0  # 봉이 바뀔 때마다 증가
+
+    def __len__(self):
+        return len(self.bars)
+
+    @property
+    def nbytes(self):
+        """봉 보관에 쓰는 메모리 (바이트)"""
+        return self.bars.nbytes
+
+    def _append_bars(self, open_time, count, price, volume=0.0):
+        """open_time 부터 count 개의 봉(시가=고가=저가=종가=price) 추가"""
+        if count > self.capacity:
+            # 보관할 수 있는 마지막 capacity 개만 추가
+            open_time += (count - self.capacity) * self.timeframe_ms
+            count = self.capacity
+        rows = np.empty((count, 6))
+        rows[:, self.TIME] = open_time + np.arange(count, dtype=np.int64) * self.timeframe_ms
+        rows[:, self.OPEN:self.VOLUME] = price
+        rows[:, self.VOLUME] = 0.0
+        rows[-1, self.VOLUME] = volume
+        self.bars.append(rows)
+
+    def add_trade(self, timestamp, price, size):
+        """
+        체결 한 건 반영
+        Returns:
+            'tick' (진행 중인 봉 갱신), 'append' (새 봉 시작), 'late' (지난 봉 보정), 'drop' (보관 범위 밖)
+        """
+        bars = self.bars
+        bar_time = int(timestamp) // self.timeframe_ms * self.timeframe_ms
+        last_time = int(bars.get(-1, self.TIME)) if len(bars) else None
+
+        if last_time is None or bar_time > last_time:
+            if last_time is not None:
+                # 체결 없던 구간은 직전 종가로 채우고 새 봉 시작
+                missing = (bar_time - last_time) // self.timeframe_ms - 1
+                if missing > 0:
+                    self._append_bars(bar_time - missing * self.timeframe_ms, missing,
+                                      bars.get(-1, self.CLOSE))
+            self._append_bars(bar_time, 1, price, size)
+            self.version += 1
+            return 'append'
+
+        if bar_time == last_time:
+            index = -1
+            kind = 'tick'
+            bars.set(index, self.CLOSE, price)
+        else:
+            # 늦게 도착한 체결 - 종가는 그대로 두고 고가/저가/거래량만 보정
+            times = bars.times()
+            index = int(np.searchsorted(times, bar_time))
+            if index >= len(times) or times[index] != bar_time:
+                return 'drop'
+            kind = 'late'
+
+        if price > bars.get(index, self.HIGH):
+            bars.set(index, self.HIGH, price)
+        if price < bars.get(index, self.LOW):
+            bars.set(index, self.LOW, price)
+        bars.set(index, self.VOLUME, bars.get(index, self.VOLUME) + size)
+        self.version += 1
+        return kind
+
+    def add_trades(self, timestamps, prices, sizes):
+        """체결 여러 건 반영 (시간 순서)"""
+        for timestamp, price, size in zip(timestamps.tolist(), prices.tolist(), sizes.tolist()):
+            self.add_trade(timestamp, price, size)
+
+    def reconcile(self, ohlcv):
+        """
+        거래소 klines 로 보정
+        - 겹치는 확정 봉은 거래소 값으로 교체
+        - 진행 중인 봉은 고가/저가는 넓은 쪽, 거래량은 큰 쪽을 사용
+        - 보관 중인 봉보다 오래된 klines 는 앞쪽에 채움 (시작 시 과거 봉 채우기)
+        Args:
+            ohlcv: (N, 6) [시각(ms), 시가, 고가, 저가, 종가, 거래량], 간격은 이 집계기와 같아야 함
+        """
+        ohlcv = np.asarray(ohlcv, dtype=np.float64)
+        if len(ohlcv) == 0:
+            return
+        own = self.bars.window()
+        live = own[-1].copy() if len(own) else None
+
+        # 거래소 값과 현재 봉을 시각 기준으로 합침 (같은 시각은 거래소 값 우선)
+        merged_times = np.union1d(own[:, self.TIME], ohlcv[:, self.TIME])
+        merged = np.zeros((len(merged_times), 6))
+        merged[np.searchsorted(merged_times, own[:, self.TIME])] = own
+        merged[np.searchsorted(merged_times, ohlcv[:, self.TIME])] = ohlcv
+
+        # 진행 중인 봉은 직접 만든 값과 합침
+        if live is not None and live[self.TIME] in ohlcv[:, self.TIME]:
+            i = int(np.searchsorted(merged_times, live[self.TIME]))
+            merged[i, self.HIGH] = max(merged[i, self.HIGH], live[self.HIGH])
+            merged[i, self.LOW] = min(merged[i, self.LOW], live[self.LOW])
+            merged[i, self.VOLUME] = max(merged[i, self.VOLUME], live[self.VOLUME])
+
+        self.bars.replace(merged)
+        self.version += 1
+
+    def window(self, limit=None):
+        """최근 limit 개 봉의 (N, 6) 뷰 - 복사 없이 링 버퍼를 그대로 가리킴"""
+        return self.bars.window(limit)
+
+    def ohlcv(self, limit=None):
+        """최근 limit 개 봉의 (N, 6) 배열 (복사본)"""
+        return self.bars.window(limit).copy()
+
+    def frame(self, limit=300):
+        """
+        최근 limit 개 봉을 DataFetcher.fetch_ohlcv 와 같은 (캔들 배열, 데이터프레임) 형식으로 반환
+        """
+        bars = self.bars.window(limit)
+        columns = {name: bars[:, column].copy() for column, name in enumerate(self.FIELDS, start=1)}
+        df = pd.DataFrame({'timestamp': pd.to_datetime(bars[:, self.TIME].astype(np.int64), unit='ms'),
+                           **columns})
+        candle_data = np.column_stack((
+            np.arange(len(bars)), columns['open'], columns['high'], columns['low'], columns['close']
+        ))
+        return candle_data, df
+
+    def close(self):
+        """디스크로 내보낼 봉이 남아 있으면 기록"""
+        self.bars.flush()
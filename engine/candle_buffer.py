@@ -0,0 +1,177 @@
+import os
+
+import numpy as np
+
+# 행 구성: [시각(ms), 시가, 고가, 저가, 종가, 거래량]
+COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+# 봉 간격별 메모리에 보관할 봉 개수 (넘치는 봉은 디스크로 내보냄)
+RETENTION = {
+    '1s': 3600,    # 1시간
+    '5s': 2880,    # 4시간
+    '15s': 2880,   # 12시간
+    '1m': 1440,    # 1일
+    '5m': 2016,    # 1주
+    '15m': 2016,   # 3주
+}
+DEFAULT_RETENTION = 1000
+
+
+def retention_for(timeframe):
+    """
+    봉 간격의 보관 개수
+    TRADING_RETENTION="1s=7200,1m=2880" 처럼 환경 변수로 간격별로 바꿀 수 있음
+    """
+    overrides = {}
+    for item in os.environ.get('TRADING_RETENTION', '').split(','):
+        if '=' in item:
+            key, value = item.split('=', 1)
+            overrides[key.strip()] = int(value)
+    return overrides.get(timeframe, RETENTION.get(timeframe, DEFAULT_RETENTION))
+
+
+def spill_path_for(directory, symbol, timeframe):
+    """디스크로 내보낸 봉 파일 경로 (예: history/BTC-USDT_1m.f64)"""
+    return os.path.join(directory, f"{symbol.replace('/', '-')}_{timeframe}.f64")
+
+
+def load_spilled(path, max_rows=None):
+    """
+    디스크로 내보낸 봉 읽기 (N, 6), 파일이 없으면 빈 배열
+    max_rows 를 주면 파일 끝의 최근 max_rows 봉만 읽음 (몇 년치 파일도 필요한 만큼만 메모리에 올림)
+    """
+    if not os.path.exists(path):
+        return np.empty((0, len(COLUMNS)))
+    row_bytes = len(COLUMNS) * 8
+    rows = os.path.getsize(path) // row_bytes
+    skip = max(rows - max_rows, 0) if max_rows is not None else 0
+    return np.fromfile(path, dtype=np.float64, count=(rows - skip) * len(COLUMNS),
+                       offset=skip * row_bytes).reshape(-1, len(COLUMNS))
+
+
+class CandleRingBuffer:
+    """
+    봉 개수가 정해진 링 버퍼 (시간 순서, 0 번이 가장 오래된 봉)
+
+    - 배열을 처음에 한 번만 잡고 가득 차면 가장 오래된 봉부터 덮어씀 → 세션 길이와 무관하게 메모리 일정
+    - 각 봉을 [i] 와 [i + capacity] 두 곳에 써 두어서 어떤 구간이든 연속된 배열이 됨
+      → window() 는 복사 없이 버퍼의 뷰를 반환
+    - 덮어쓰이는 봉은 spill_path 파일 끝에 모아서 추가 (spill_every 개마다 한 번 쓰기)
+    """
+
+    def __init__(self, capacity, spill_path=None, spill_every=64):
+        self.capacity = capacity
+        self.data = np.zeros((capacity * 2, len(COLUMNS)))
+        self.start = 0   # 가장 오래된 봉의 위치
+        self.size = 0
+        self.spill_path = spill_path
+        self.spill_every = spill_every
+        self.pending_spill = []
+        self.spilled_until = -np.inf  # 디스크로 내보낸 마지막 봉 시각
+        self.spilled_count = 0
+
+        # 이전 세션에서 내보낸 봉이 있으면 그 뒤부터 이어서 기록
+        row_bytes = len(COLUMNS) * 8
+        if spill_path is not None and os.path.exists(spill_path) and os.path.getsize(spill_path) >= row_bytes:
+            with open(spill_path, 'rb') as f:
+                f.seek(-row_bytes, os.SEEK_END)
+                self.spilled_until = float(np.frombuffer(f.read(row_bytes), dtype=np.float64)[0])
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        """버퍼가 차지하는 메모리 (바이트)"""
+        return self.data.nbytes
+
+    def _position(self, index):
+        """논리 인덱스(0 = 가장 오래된 봉, 음수는 뒤에서부터) → 버퍼 위치"""
+        if index < 0:
+            index += self.size
+        return (self.start + index) % self.capacity
+
+    def set(self, index, column, value):
+        """index 번째 봉의 한 값만 교체 (column: 0~5)"""
+        position = self._position(index)
+        self.data[position, column] = value
+        self.data[position + self.capacity, column] = value
+
+    def get(self, index, column):
+        return self.data[self._position(index), column]
+
+    def append(self, rows):
+        """
+        봉 여러 개를 끝에 추가, 넘치는 만큼 가장 오래된 봉을 내보냄
+        Args:
+            rows: (N, 6) 배열
+        """
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, len(COLUMNS))
+        if len(rows) > self.capacity:
+            self._spill(rows[:-self.capacity])
+            rows = rows[-self.capacity:]
+        n = len(rows)
+        if n == 0:
+            return
+
+        overflow = self.size + n - self.capacity
+        if overflow > 0:
+            self._spill(self.window()[:overflow])
+            self.start = (self.start + overflow) % self.capacity
+            self.size -= overflow
+
+        positions = (self.start + self.size + np.arange(n)) % self.capacity
+        self.data[positions] = rows
+        self.data[positions + self.capacity] = rows
+        self.size += n
+
+    def replace(self, rows):
+        """
+        내용 전체를 rows 로 교체 (최근 capacity 개 보관)
+        지금 보관 중인 봉 중 rows 보다 오래된 봉은 디스크로 내보냄
+        """
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, len(COLUMNS))
+        if self.size and len(rows):
+            current = self.window()
+            self._spill(current[current[:, 0] < rows[0, 0]])
+        self.start = 0
+        self.size = 0
+        self.append(rows)
+
+    def window(self, count=None):
+        """최근 count 개 봉의 (N, 6) 뷰 (복사 없음, 버퍼가 바뀌면 같이 바뀜)"""
+        count = self.size if count is None else min(count, self.size)
+        begin = self.start + self.size - count
+        return self.data[begin:begin + count]
+
+    def times(self):
+        """보관 중인 봉 시각 뷰 (정렬되어 있으므로 searchsorted 가능)"""
+        return self.window()[:, 0]
+
+    def _spill(self, rows):
+        """덮어쓰일 봉을 디스크 쓰기 대기열에 추가"""
+        if self.spill_path is None or len(rows) == 0:
+            return
+        rows = rows[rows[:, 0] > self.spilled_until]
+        if len(rows) == 0:
+            return
+        self.pending_spill.append(rows.copy())
+        self.spilled_until = rows[-1, 0]
+        if sum(len(chunk) for chunk in self.pending_spill) >= self.spill_every:
+            self.flush()
+
+    def flush(self):
+        """대기 중인 봉을 파일 끝에 기록"""
+        if not self.pending_spill:
+            return
+        chunk = np.concatenate(self.pending_spill)
+        self.pending_spill = []
+        try:
+            directory = os.path.dirname(self.spill_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.spill_path, 'ab') as f:
+                chunk.tofile(f)
+            self.spilled_count += len(chunk)
+        except OSError as e:
+            print(f"봉 기록 파일 쓰기 실패: {e}")
@@ -0,0 +1,354 @@
+import numpy as np
+
+# 하루 길이 (밀리초) - VWAP 세션 구분용
+DAY_MS = 24 * 60 * 60 * 1000
+
+
+def ema_batch(values, alpha, initial=None):
+    """
+    지수이동평균을 벡터 연산으로 계산 (pandas ewm(adjust=False)와 동일)
+
+    ema[t] = (1 - alpha)^t * ema[0] + alpha * Σ (1 - alpha)^(t-k) * x[k] 를
+    블록 단위로 나누어 계산하여 거듭제곱이 넘치지 않게 함
+    Args:
+        values: 입력 배열
+        alpha: 평활 계수 (0 < alpha <= 1)
+        initial: 첫 값 이전의 EMA (없으면 첫 값으로 시작)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.empty(len(values))
+    if len(values) == 0:
+        return out
+
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[:] = values
+        return out
+
+    # (1 - alpha)^-block 이 1e8 을 넘지 않는 블록 크기
+    block = max(1, int(18.0 / -np.log(decay)))
+    carry = values[0] if initial is None else decay * initial + alpha * values[0]
+    out[0] = carry
+
+    start = 1
+    while start < len(values):
+        end = min(start + block, len(values))
+        k = np.arange(1, end - start + 1)
+        powers = decay ** k
+        # 블록 시작 이전 값(carry)의 기여 + 블록 내부 입력의 누적 기여
+        weighted = np.cumsum(values[start:end] * alpha / powers)
+        out[start:end] = powers * (carry + weighted)
+        carry = out[end - 1]
+        start = end
+    return out
+
+
+class IndicatorEngine:
+    """
+    캔들 버퍼와 같은 인덱스로 보조지표를 유지하는 스트리밍 엔진
+
+    - 이력 전체는 벡터 연산으로 한 번에 초기화
+    - 진행 중인 봉이 갱신되면 마지막 인덱스 한 점만 다시 계산 (O(1))
+    - 새 봉이 생기면 직전 봉을 확정하고 새 봉 한 점만 추가 계산
+    - 각 지표의 중간 상태(EMA, 평균 상승/하락폭, 구간 합 등)도 봉마다 배열에 저장하므로
+      i 번째 값은 i-1 번째 상태와 i 번째 캔들만으로 계산됨
+    """
+
+    OUTPUTS = (
+        'sma', 'ema', 'bb_upper', 'bb_middle', 'bb_lower',
+        'rsi', 'macd', 'macd_signal', 'macd_hist', 'vwap'
+    )
+    STATES = (
+        'win_sum', 'win_sq', 'ema_fast', 'ema_slow',
+        'avg_gain', 'avg_loss', 'vwap_pv', 'vwap_v'
+    )
+    RAW = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, sma_period=20, ema_period=50, bb_period=20, bb_width=2.0,
+                 rsi_period=14, macd_fast=12, macd_slow=26, macd_signal=9, capacity=1024,
+                 max_bars=4096):
+        self.sma_period = sma_period
+        self.ema_period = ema_period
+        self.bb_period = bb_period
+        self.bb_width = bb_width
+        self.rsi_period = rsi_period
+        self.macd_fast = macd_fast
+        self.macd_slow = macd_slow
+        self.macd_signal_period = macd_signal
+
+        # SMA 와 볼린저 밴드는 같은 구간 합을 공유 (구간 길이가 다르면 볼린저 기준)
+        self.window = bb_period
+        self.shift = 0.0  # 구간 제곱합의 자릿수 손실을 줄이기 위한 기준 가격
+
+        self.size = 0
+        self.max_bars = max_bars  # 봉이 계속 추가돼도 최근 max_bars 개까지만 보관
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.arrays = {}
+        for name in self.RAW + self.OUTPUTS + self.STATES:
+            self.arrays[name] = np.full(capacity, np.nan)
+
+    # ------------------------------------------------------------------
+    # 버퍼 관리
+    # ------------------------------------------------------------------
+    def _ensure_capacity(self, needed):
+        """배열 용량이 부족하면 2배씩 늘림"""
+        capacity = len(self.timestamps)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        timestamps = np.empty(capacity, dtype=np.int64)
+        timestamps[:self.size] = self.timestamps[:self.size]
+        self.timestamps = timestamps
+        for name, old in self.arrays.items():
+            new = np.full(capacity, np.nan)
+            new[:self.size] = old[:self.size]
+            self.arrays[name] = new
+
+    def _drop_oldest(self, count):
+        """가장 오래된 count 개 봉을 버리고 앞으로 당김 (i 번째 값은 i-1 번째 상태만 쓰므로 그대로 유효)"""
+        keep = self.size - count
+        self.timestamps[:keep] = self.timestamps[count:self.size]
+        for values in self.arrays.values():
+            values[:keep] = values[count:self.size]
+        self.size = keep
+
+    @property
+    def nbytes(self):
+        """지표 배열이 차지하는 메모리 (바이트)"""
+        return self.timestamps.nbytes + sum(values.nbytes for values in self.arrays.values())
+
+    def reset(self):
+        """저장된 봉을 비워 다음 update() 에서 전체를 다시 계산"""
+        self.size = 0
+
+    def __getitem__(self, name):
+        """지표 배열 전체 (유효 구간) 반환"""
+        return self.arrays[name][:self.size]
+
+    def window_view(self, name, length):
+        """캔들 버퍼와 같은 인덱스의 최근 length 개 값 (복사 없는 view)"""
+        start = max(0, self.size - length)
+        return self.arrays[name][start:self.size]
+
+    # ------------------------------------------------------------------
+    # 갱신 진입점
+    # ------------------------------------------------------------------
+    def update(self, timestamps, open_, high, low, close, volume):
+        """
+        캔들 버퍼로 지표 갱신 - 필요한 만큼만 다시 계산
+        Args:
+            timestamps: 밀리초 타임스탬프 배열 (마지막 봉은 진행 중인 봉)
+            open_, high, low, close, volume: 캔들 배열
+        Returns:
+            str: 'init' (전체 초기화), 'tick' (마지막 봉만 갱신), 'append' (새 봉 추가)
+        """
+        n = len(timestamps)
+        if n == 0:
+            return 'init'
+
+        last_ts = int(timestamps[-1])
+        if self.size > 0:
+            stored_last = int(self.timestamps[self.size - 1])
+            if last_ts == stored_last:
+                self._set_raw(self.size - 1, open_[-1], high[-1], low[-1], close[-1], volume[-1])
+                self._compute_point(self.size - 1)
+                return 'tick'
+            if n >= 2 and int(timestamps[-2]) == stored_last:
+                # 진행 중이던 봉을 확정값으로 다시 계산한 뒤 새 봉 추가
+                self._set_raw(self.size - 1, open_[-2], high[-2], low[-2], close[-2], volume[-2])
+                self._compute_point(self.size - 1)
+                self.append(last_ts, open_[-1], high[-1], low[-1], close[-1], volume[-1])
+                return 'append'
+
+        self.initialize(timestamps, open_, high, low, close, volume)
+        return 'init'
+
+    def append(self, timestamp, open_, high, low, close, volume):
+        """새 봉 한 개 추가 후 해당 점만 계산"""
+        if self.max_bars and self.size >= self.max_bars:
+            self._drop_oldest(self.size - self.max_bars // 2)
+        index = self.size
+        self._ensure_capacity(index + 1)
+        self.timestamps[index] = timestamp
+        self.size = index + 1
+        self._set_raw(index, open_, high, low, close, volume)
+        self._compute_point(index)
+
+    def _set_raw(self, i, open_, high, low, close, volume):
+        arrays = self.arrays
+        arrays['open'][i] = open_
+        arrays['high'][i] = high
+        arrays['low'][i] = low
+        arrays['close'][i] = close
+        arrays['volume'][i] = volume
+
+    # ------------------------------------------------------------------
+    # 전체 초기화 (벡터 연산)
+    # ------------------------------------------------------------------
+    def initialize(self, timestamps, open_, high, low, close, volume):
+        """이력 전체로 모든 지표를 한 번에 계산"""
+        n = len(timestamps)
+        self.size = 0
+        self._ensure_capacity(max(n, 1))
+        self.size = n
+        self.timestamps[:n] = timestamps
+
+        a = self.arrays
+        for name, values in zip(self.RAW, (open_, high, low, close, volume)):
+            a[name][:n] = values
+        c = a['close'][:n]
+        h = a['high'][:n]
+        l = a['low'][:n]
+        v = a['volume'][:n]
+
+        # 구간 합 / 제곱합 → SMA, 볼린저 밴드
+        self.shift = float(c[0])
+        d = c - self.shift
+        a['win_sum'][:n] = self._rolling_sum(d, self.window)
+        a['win_sq'][:n] = self._rolling_sum(d * d, self.window)
+        if self.sma_period == self.window:
+            a['sma'][:n] = a['win_sum'][:n] / self.window + self.shift
+        else:
+            a['sma'][:n] = self._rolling_sum(d, self.sma_period) / self.sma_period + self.shift
+        a['sma'][:min(n, self.sma_period - 1)] = np.nan
+        self._bollinger(slice(0, n))
+
+        # EMA
+        a['ema'][:n] = ema_batch(c, 2.0 / (self.ema_period + 1))
+        a['ema'][:min(n, self.ema_period - 1)] = np.nan
+
+        # MACD
+        a['ema_fast'][:n] = ema_batch(c, 2.0 / (self.macd_fast + 1))
+        a['ema_slow'][:n] = ema_batch(c, 2.0 / (self.macd_slow + 1))
+        macd = a['ema_fast'][:n] - a['ema_slow'][:n]
+        a['macd'][:n] = macd
+        a['macd_signal'][:n] = ema_batch(macd, 2.0 / (self.macd_signal_period + 1))
+        a['macd_hist'][:n] = macd - a['macd_signal'][:n]
+
+        # RSI (Wilder 평활: alpha = 1 / 기간)
+        change = np.diff(c, prepend=c[0])
+        alpha = 1.0 / self.rsi_period
+        a['avg_gain'][:n] = ema_batch(np.maximum(change, 0.0), alpha)
+        a['avg_loss'][:n] = ema_batch(np.maximum(-change, 0.0), alpha)
+        a['rsi'][:n] = self._rsi(a['avg_gain'][:n], a['avg_loss'][:n])
+        a['rsi'][:min(n, self.rsi_period)] = np.nan
+
+        # VWAP (UTC 일 단위 세션)
+        pv = (h + l + c) / 3.0 * v
+        session = timestamps // DAY_MS
+        starts = np.flatnonzero(np.diff(session, prepend=session[0] - 1))
+        markers = np.zeros(n, dtype=np.int64)
+        markers[starts] = starts
+        start_of = np.maximum.accumulate(markers)  # 각 봉이 속한 세션의 시작 인덱스
+        pv_cum = np.cumsum(pv)
+        v_cum = np.cumsum(v)
+        offset_pv = np.where(start_of > 0, pv_cum[start_of - 1], 0.0)
+        offset_v = np.where(start_of > 0, v_cum[start_of - 1], 0.0)
+        a['vwap_pv'][:n] = pv_cum - offset_pv
+        a['vwap_v'][:n] = v_cum - offset_v
+        a['vwap'][:n] = self._vwap(a['vwap_pv'][:n], a['vwap_v'][:n], c)
+
+    @staticmethod
+    def _rolling_sum(values, period):
+        """길이 period 구간 합 (앞부분은 가능한 만큼의 부분합)"""
+        cs = np.cumsum(values)
+        out = cs.copy()
+        out[period:] = cs[period:] - cs[:-period]
+        return out
+
+    def _bollinger(self, index):
+        a = self.arrays
+        mean = a['win_sum'][index] / self.window
+        var = np.maximum(a['win_sq'][index] / self.window - mean * mean, 0.0)
+        std = np.sqrt(var)
+        a['bb_middle'][index] = mean + self.shift
+        a['bb_upper'][index] = a['bb_middle'][index] + self.bb_width * std
+        a['bb_lower'][index] = a['bb_middle'][index] - self.bb_width * std
+        if isinstance(index, slice):
+            warmup = slice(0, min(index.stop, self.window - 1))
+            for name in ('bb_middle', 'bb_upper', 'bb_lower'):
+                a[name][warmup] = np.nan
+        elif index < self.window - 1:
+            for name in ('bb_middle', 'bb_upper', 'bb_lower'):
+                a[name][index] = np.nan
+
+    @staticmethod
+    def _rsi(avg_gain, avg_loss):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = avg_gain / avg_loss
+            return np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + rs))
+
+    @staticmethod
+    def _vwap(pv, v, close):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(v > 0, pv / v, close)
+
+    # ------------------------------------------------------------------
+    # 한 점 계산 (O(1))
+    # ------------------------------------------------------------------
+    def _compute_point(self, i):
+        """i 번째 봉의 지표를 i-1 번째 상태로부터 계산"""
+        a = self.arrays
+        c = a['close'][i]
+        if i == 0:
+            # 첫 봉은 전체 초기화와 같은 결과
+            self.initialize(self.timestamps[:1].copy(), a['open'][:1].copy(), a['high'][:1].copy(),
+                            a['low'][:1].copy(), a['close'][:1].copy(), a['volume'][:1].copy())
+            return
+
+        prev = i - 1
+        d = c - self.shift
+
+        # 구간 합 (빠지는 값은 window 만큼 이전 봉)
+        out_index = i - self.window
+        d_out = a['close'][out_index] - self.shift if out_index >= 0 else 0.0
+        a['win_sum'][i] = a['win_sum'][prev] + d - d_out
+        a['win_sq'][i] = a['win_sq'][prev] + d * d - d_out * d_out
+        if i >= self.sma_period - 1:
+            if self.sma_period == self.window:
+                a['sma'][i] = a['win_sum'][i] / self.window + self.shift
+            else:
+                a['sma'][i] = a['close'][i - self.sma_period + 1:i + 1].mean()
+        else:
+            a['sma'][i] = np.nan
+        self._bollinger(i)
+
+        # EMA (직전 값이 워밍업 구간이면 내부 상태 대신 단순 재귀)
+        alpha = 2.0 / (self.ema_period + 1)
+        prev_ema = a['ema'][prev]
+        if np.isnan(prev_ema):
+            prev_ema = ema_batch(a['close'][:i], alpha)[-1]
+        a['ema'][i] = alpha * c + (1.0 - alpha) * prev_ema if i >= self.ema_period - 1 else np.nan
+
+        # MACD
+        fast_alpha = 2.0 / (self.macd_fast + 1)
+        slow_alpha = 2.0 / (self.macd_slow + 1)
+        signal_alpha = 2.0 / (self.macd_signal_period + 1)
+        a['ema_fast'][i] = fast_alpha * c + (1.0 - fast_alpha) * a['ema_fast'][prev]
+        a['ema_slow'][i] = slow_alpha * c + (1.0 - slow_alpha) * a['ema_slow'][prev]
+        macd = a['ema_fast'][i] - a['ema_slow'][i]
+        a['macd'][i] = macd
+        a['macd_signal'][i] = signal_alpha * macd + (1.0 - signal_alpha) * a['macd_signal'][prev]
+        a['macd_hist'][i] = macd - a['macd_signal'][i]
+
+        # RSI
+        change = c - a['close'][prev]
+        rsi_alpha = 1.0 / self.rsi_period
+        a['avg_gain'][i] = rsi_alpha * max(change, 0.0) + (1.0 - rsi_alpha) * a['avg_gain'][prev]
+        a['avg_loss'][i] = rsi_alpha * max(-change, 0.0) + (1.0 - rsi_alpha) * a['avg_loss'][prev]
+        if i >= self.rsi_period:
+            avg_loss = a['avg_loss'][i]
+            a['rsi'][i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + a['avg_gain'][i] / avg_loss)
+        else:
+            a['rsi'][i] = np.nan
+
+        # VWAP (날짜가 바뀌면 누적값 초기화)
+        pv = (a['high'][i] + a['low'][i] + c) / 3.0 * a['volume'][i]
+        if self.timestamps[i] // DAY_MS != self.timestamps[prev] // DAY_MS:
+            a['vwap_pv'][i] = pv
+            a['vwap_v'][i] = a['volume'][i]
+        else:
+            a['vwap_pv'][i] = a['vwap_pv'][prev] + pv
+            a['vwap_v'][i] = a['vwap_v'][prev] + a['volume'][i]
+        a['vwap'][i] = a['vwap_pv'][i] / a['vwap_v'][i] if a['vwap_v'][i] > 0 else c
@@ -0,0 +1,185 @@
+import numpy as np
+
+# 거래소 단계별 유지증거금 표 (바이낸스 USDT-M 선물 기준)
+# [(명목가치 상한, 유지증거금률)] - 누적 공제액은 표에서 자동 계산
+MAINTENANCE_TIERS = {
+    "BTC": [
+        (50_000, 0.004),
+        (500_000, 0.005),
+        (8_000_000, 0.01),
+        (50_000_000, 0.025),
+        (80_000_000, 0.05),
+        (100_000_000, 0.1),
+        (120_000_000, 0.125),
+        (200_000_000, 0.15),
+        (300_000_000, 0.25),
+        (500_000_000, 0.5),
+    ],
+    "ETH": [
+        (50_000, 0.005),
+        (500_000, 0.0065),
+        (8_000_000, 0.01),
+        (50_000_000, 0.02),
+        (80_000_000, 0.05),
+        (100_000_000, 0.1),
+        (150_000_000, 0.125),
+        (300_000_000, 0.15),
+        (500_000_000, 0.25),
+    ],
+    # 표가 없는 코인에 사용하는 기본값
+    "DEFAULT": [
+        (5_000, 0.01),
+        (25_000, 0.025),
+        (100_000, 0.05),
+        (250_000, 0.1),
+        (1_000_000, 0.125),
+        (np.inf, 0.5),
+    ],
+}
+
+
+class MarginEngine:
+    """
+    보유 포지션 전체의 청산가/증거금 비율을 한 번의 numpy 연산으로 계산하는 엔진 (격리 마진 기준)
+
+    - 단계별 유지증거금 표를 (표 개수 × 최대 단계 수) 2차원 배열로 미리 펼쳐둠
+    - 포지션마다 명목가치로 단계를 찾고 청산가, 증거금 비율, 청산까지 거리를 계산
+    """
+
+    def __init__(self, tiers=None, risk_margin_ratio=0.8, risk_distance=5.0):
+        """
+        Args:
+            tiers: {코인명: [(명목가치 상한, 유지증거금률)]} 단계별 유지증거금 표
+            risk_margin_ratio: 위험으로 표시할 증거금 비율 (유지증거금 / 증거금 잔고)
+            risk_distance: 위험으로 표시할 청산가까지 거리(%)
+        """
+        self.risk_margin_ratio = risk_margin_ratio
+        self.risk_distance = risk_distance
+        self.set_tiers(tiers or MAINTENANCE_TIERS)
+
+        # 마지막 계산 결과 (포지션 엔진의 슬롯 순서)
+        self.liq_price = np.zeros(0)
+        self.margin_ratio = np.zeros(0)
+        self.liq_distance = np.zeros(0)
+        self.at_risk = np.zeros(0, dtype=bool)
+        self.tables = np.zeros(0, dtype=np.int64)  # 슬롯별 유지증거금 표 인덱스 캐시
+
+    def set_tiers(self, tiers):
+        """단계별 유지증거금 표를 2차원 배열로 변환"""
+        self.table_index = {}
+        max_tiers = max(len(rows) for rows in tiers.values())
+        count = len(tiers)
+
+        # 남는 칸은 상한을 무한대로 채워 마지막 단계가 그대로 적용되게 함
+        self.tier_caps = np.full((count, max_tiers), np.inf)
+        self.tier_rates = np.zeros((count, max_tiers))
+        self.tier_cums = np.zeros((count, max_tiers))
+
+        for t, (symbol, rows) in enumerate(tiers.items()):
+            self.table_index[symbol] = t
+            caps = np.array([cap for cap, _ in rows], dtype=np.float64)
+            rates = np.array([rate for _, rate in rows], dtype=np.float64)
+            # 누적 공제액: cum[k] = cum[k-1] + cap[k-1] * (rate[k] - rate[k-1])
+            cums = np.concatenate(([0.0], np.cumsum(caps[:-1] * np.diff(rates))))
+
+            self.tier_caps[t, :len(rows)] = caps
+            self.tier_rates[t, :len(rows)] = rates
+            self.tier_rates[t, len(rows):] = rates[-1]
+            self.tier_cums[t, :len(rows)] = cums
+            self.tier_cums[t, len(rows):] = cums[-1]
+
+        self.default_table = self.table_index.get("DEFAULT", 0)
+
+    def compute(self, tables, quantity, entry_price, mark_price, leverage):
+        """
+        포지션 배열 전체에 대해 청산가와 증거금 지표 계산
+        Args:
+            tables: 각 포지션의 유지증거금 표 인덱스 배열
+            quantity: 보유 수량 (롱 +, 숏 -)
+            entry_price: 평균 진입가
+            mark_price: 평가 가격
+            leverage: 레버리지
+        Returns:
+            (청산가, 증거금 비율, 청산가까지 거리(%), 위험 여부) 배열 튜플
+        """
+        side = np.sign(quantity)
+        size = np.abs(quantity)
+        notional = size * mark_price
+
+        # 명목가치가 상한 이하인 첫 단계 찾기
+        n = len(tables)
+        caps = self.tier_caps[tables]
+        tier = np.minimum((notional[:, None] > caps).sum(axis=1), caps.shape[1] - 1)
+        rate = self.tier_rates[tables, tier]
+        cum = self.tier_cums[tables, tier]
+
+        # 격리 증거금 = 진입 명목가치 / 레버리지
+        wallet = size * entry_price / np.maximum(leverage, 1.0)
+
+        # 바이낸스 격리 마진 청산가 공식
+        # LP = (WB + cum - side * size * EP) / (size * MMR - side * size)
+        denominator = size * rate - side * size
+        liq_price = np.divide(
+            wallet + cum - side * size * entry_price, denominator,
+            out=np.zeros(n), where=denominator != 0
+        )
+        liq_price = np.maximum(liq_price, 0.0)
+
+        # 증거금 비율 = 유지증거금 / (격리 증거금 + 미실현 손익)
+        maintenance = notional * rate - cum
+        balance = wallet + quantity * (mark_price - entry_price)
+        margin_ratio = np.divide(
+            maintenance, balance,
+            out=np.full(n, np.inf), where=balance > 0
+        )
+
+        # 청산가까지 남은 거리(%) - 불리한 방향으로 움직여야 하는 비율
+        liq_distance = np.divide(
+            side * (mark_price - liq_price) * 100.0, mark_price,
+            out=np.zeros(n), where=(mark_price > 0) & (liq_price > 0)
+        )
+        liq_distance[(liq_price == 0) & (size > 0)] = 100.0
+
+        at_risk = (size > 0) & (
+            (margin_ratio >= self.risk_margin_ratio) | (liq_distance <= self.risk_distance)
+        )
+        return liq_price, margin_ratio, liq_distance, at_risk
+
+    def update(self, position_engine):
+        """
+        포지션 엔진의 모든 슬롯을 재계산하고 청산가를 포지션 엔진에 기록
+        Args:
+            position_engine: PositionEngine 인스턴스
+        """
+        n = len(position_engine.symbols)
+        if len(self.tables) != n:
+            # 새 코인이 추가된 경우에만 표 인덱스 다시 계산
+            self.tables = np.array(
+                [self.table_index.get(symbol, self.default_table) for symbol in position_engine.symbols],
+                dtype=np.int64
+            )
+        self.liq_price, self.margin_ratio, self.liq_distance, self.at_risk = self.compute(
+            self.tables,
+            position_engine.quantity[:n],
+            position_engine.avg_price[:n],
+            position_engine.mark_price[:n],
+            position_engine.leverage[:n],
+        )
+        position_engine.liq_price[:n] = self.liq_price
+
+    def annotate_positions(self, positions, slot_index):
+        """
+        포지션 딕셔너리에 증거금 지표 추가 (TradeHistoryTable 강조 표시용)
+        Args:
+            positions: PositionEngine.open_positions() 결과
+            slot_index: 코인명 → 슬롯 인덱스
+        """
+        for symbol, position in positions.items():
+            i = slot_index[symbol]
+            if i >= len(self.liq_price):
+                continue
+            position["liq_price"] = float(self.liq_price[i])
+            position["margin_ratio"] = float(self.margin_ratio[i])
+            position["liq_distance"] = float(self.liq_distance[i])
+            position["at_risk"] = bool(self.at_risk[i])
+        return positions
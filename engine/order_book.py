@@ -0,0 +1,188 @@
+import numpy as np
+
+
+class SequenceGapError(Exception):
+    """델타의 업데이트 번호가 이어지지 않아 스냅샷부터 다시 받아야 하는 경우"""
+
+
+def as_levels(levels):
+    """[[가격, 수량, ...], ...] → (N, 2) 실수 배열"""
+    levels = np.asarray(levels, dtype=np.float64)
+    if levels.size == 0:
+        return np.empty((0, 2))
+    return levels.reshape(len(levels), -1)[:, :2]
+
+
+class BookSide:
+    """
+    호가 한쪽(매수 또는 매도)의 가격 레벨 배열
+
+    - 가격을 정렬 키로 보관 (매도: 가격 오름차순, 매수: -가격 오름차순 = 가격 내림차순)
+    - 0번 인덱스가 항상 최우선 호가
+    - 변경 후 누적 수량을 미리 계산하여 깊이 차트가 그대로 사용
+    """
+
+    def __init__(self, descending):
+        self.sign = -1.0 if descending else 1.0
+        self.keys = np.empty(0)        # 정렬 키 (sign × 가격)
+        self.quantity = np.empty(0)    # 레벨별 수량
+        self.cumulative = np.empty(0)  # 최우선 호가부터 누적 수량
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def prices(self):
+        return self.keys * self.sign
+
+    def replace(self, levels):
+        """스냅샷으로 전체 교체"""
+        levels = as_levels(levels)
+        levels = levels[levels[:, 1] > 0]
+        keys = levels[:, 0] * self.sign
+        order = np.argsort(keys, kind='stable')
+        self.keys = keys[order]
+        self.quantity = levels[order, 1]
+        self.cumulative = np.cumsum(self.quantity)
+
+    def apply(self, levels):
+        """
+        변경된 레벨 반영 (수량 0 = 삭제)
+        한 번의 델타에 들어온 레벨을 모아서 벡터 연산으로 병합
+        """
+        levels = as_levels(levels)
+        if len(levels) == 0:
+            return
+        keys = levels[:, 0] * self.sign
+        quantity = levels[:, 1]
+
+        # 같은 가격이 여러 번 오면 마지막 값만 사용
+        _, last = np.unique(keys[::-1], return_index=True)
+        last = len(keys) - 1 - last
+        keys, quantity = keys[last], quantity[last]
+
+        index = np.searchsorted(self.keys, keys)
+        clipped = np.minimum(index, len(self.keys) - 1)
+        exists = (index < len(self.keys)) & (self.keys[clipped] == keys) if len(self.keys) \
+            else np.zeros(len(keys), dtype=bool)
+
+        # 기존 레벨 수량 변경 (삭제는 0 으로 표시 후 한 번에 제거)
+        self.quantity = self.quantity.copy()
+        self.quantity[index[exists]] = quantity[exists]
+
+        # 새 레벨 삽입
+        insert = ~exists & (quantity > 0)
+        if insert.any():
+            self.keys = np.insert(self.keys, index[insert], keys[insert])
+            self.quantity = np.insert(self.quantity, index[insert], quantity[insert])
+
+        if (quantity[exists] == 0).any():
+            keep = self.quantity > 0
+            self.keys = self.keys[keep]
+            self.quantity = self.quantity[keep]
+
+        self.cumulative = np.cumsum(self.quantity)
+
+    def best(self):
+        """최우선 호가 (가격, 수량), 없으면 None"""
+        if len(self.keys) == 0:
+            return None
+        return float(self.keys[0] * self.sign), float(self.quantity[0])
+
+    def depth(self, levels=None):
+        """최우선 호가부터 levels 개의 (가격, 누적 수량) 복사본"""
+        end = len(self.keys) if levels is None else min(levels, len(self.keys))
+        return self.keys[:end] * self.sign, self.cumulative[:end].copy()
+
+
+class OrderBook:
+    """
+    L2 호가창 (스냅샷 + 델타 방식, Binance 깊이 스트림 규칙)
+
+    - apply_snapshot: 전체 호가와 lastUpdateId 로 초기화
+    - apply_delta: 업데이트 번호 [first_id, final_id] 구간의 변경 반영
+        * final_id <= 현재 번호: 이미 반영된 이벤트이므로 무시
+        * first_id > 현재 번호 + 1: 중간 이벤트 누락 → SequenceGapError (스냅샷부터 다시)
+    - 최우선 매수/매도 호가와 스프레드는 배열 0번 값으로 O(1) 조회
+    """
+
+    def __init__(self, symbol='BTC/USDT'):
+        self.symbol = symbol
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.last_update_id = None  # None = 스냅샷 대기 중
+        self.update_count = 0
+
+    @property
+    def synced(self):
+        return self.last_update_id is not None
+
+    def reset(self):
+        """스냅샷을 다시 받아야 하는 상태로 전환"""
+        self.last_update_id = None
+
+    def apply_snapshot(self, last_update_id, bids, asks):
+        """
+        전체 호가로 초기화
+        Args:
+            last_update_id: 스냅샷 시점의 업데이트 번호
+            bids, asks: [[가격, 수량], ...]
+        """
+        self.bids.replace(bids)
+        self.asks.replace(asks)
+        self.last_update_id = int(last_update_id)
+        self.update_count += 1
+
+    def apply_delta(self, first_id, final_id, bids, asks):
+        """
+        델타 한 건 반영
+        Returns:
+            반영했으면 True, 이미 반영된 이벤트라 무시했으면 False
+        Raises:
+            SequenceGapError: 스냅샷 전이거나 업데이트 번호가 끊긴 경우
+        """
+        if self.last_update_id is None:
+            raise SequenceGapError(f'{self.symbol} 스냅샷 없음')
+        if final_id <= self.last_update_id:
+            return False
+        if first_id > self.last_update_id + 1:
+            missing = f'{self.last_update_id + 1}~{first_id - 1}'
+            self.reset()
+            raise SequenceGapError(f'{self.symbol} 업데이트 누락: {missing}')
+        self.bids.apply(bids)
+        self.asks.apply(asks)
+        self.last_update_id = int(final_id)
+        self.update_count += 1
+        return True
+
+    def best_bid(self):
+        return self.bids.best()
+
+    def best_ask(self):
+        return self.asks.best()
+
+    def spread(self):
+        """(스프레드, 중간 가격), 한쪽이라도 비어있으면 None"""
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0], (ask[0] + bid[0]) / 2
+
+    def depth(self, levels=100):
+        """
+        깊이 차트용 스냅샷 (다른 스레드로 넘길 수 있는 복사본)
+        Returns:
+            {'bid_prices', 'bid_cumulative', 'ask_prices', 'ask_cumulative',
+             'best_bid', 'best_ask', 'update_id'}
+        """
+        bid_prices, bid_cumulative = self.bids.depth(levels)
+        ask_prices, ask_cumulative = self.asks.depth(levels)
+        return {
+            'bid_prices': bid_prices,
+            'bid_cumulative': bid_cumulative,
+            'ask_prices': ask_prices,
+            'ask_cumulative': ask_cumulative,
+            'best_bid': self.bids.best(),
+            'best_ask': self.asks.best(),
+            'update_id': self.last_update_id,
+        }
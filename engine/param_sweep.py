@@ -0,0 +1,88 @@
+import itertools
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from engine.backtester import STRATEGIES, run_backtest
+
+# 전략별 기본 파라미터 격자 (앞의 두 파라미터가 히트맵의 세로/가로 축)
+SWEEP_GRIDS = {
+    'SMA Cross': {'fast': list(range(5, 55, 5)), 'slow': list(range(20, 220, 20))},
+    'RSI Reversion': {'period': [7, 10, 14, 21, 28], 'lower': [15.0, 20.0, 25.0, 30.0, 35.0, 40.0]},
+    'Breakout': {'window': list(range(10, 250, 10))},
+}
+# 의미 없는 조합 제외 (빠른 이동평균이 느린 이동평균보다 길면 같은 신호를 반대로 낼 뿐)
+SWEEP_FILTERS = {
+    'SMA Cross': lambda params: params['fast'] < params['slow'],
+}
+# 작업 프로세스 수 (기본: CPU 코어 수)
+SWEEP_WORKERS = int(os.environ.get('TRADING_SWEEP_WORKERS', 0)) or os.cpu_count() or 1
+OHLCV_FILE = 'ohlcv.npy'
+
+# 작업 프로세스마다 한 번 연결하는 OHLCV 배열 (memmap, 5 × N: 시각, 시가, 고가, 저가, 종가)
+_bars = None
+
+
+def parameter_grid(grid, valid=None):
+    """{이름: 값 목록} → 모든 조합의 {이름: 값} 목록 (valid 가 있으면 통과한 조합만)"""
+    names = list(grid)
+    combinations = [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+    return [params for params in combinations if valid is None or valid(params)]
+
+
+def write_bars(directory, bars):
+    """
+    (N, 6) 봉 배열에서 시각/시가/고가/저가/종가를 열 단위(5 × N)로 저장
+    열마다 연속된 메모리라 작업 프로세스가 memmap 으로 열어도 전략 계산이 느려지지 않음
+    """
+    path = os.path.join(directory, OHLCV_FILE)
+    np.save(path, np.ascontiguousarray(np.asarray(bars, dtype=np.float64)[:, :5].T))
+    return path
+
+
+def init_worker(path):
+    """작업 프로세스 초기화 - 봉 파일을 읽기 전용 memmap 으로 연결 (모든 프로세스가 같은 페이지 캐시를 공유)"""
+    global _bars
+    _bars = np.load(path, mmap_mode='r')
+
+
+def run_task(strategy, params, backtest_kwargs):
+    """작업 프로세스에서 파라미터 조합 하나 백테스트 → (params, stats) 만 돌려줌 (결과 배열은 보내지 않음)"""
+    timestamps, open_, high, low, close = _bars
+    signal = STRATEGIES[strategy](open_, high, low, close, **params)
+    result = run_backtest(timestamps, open_, high, low, close, signal, **backtest_kwargs)
+    return params, result.stats
+
+
+def run_sweep(bars, strategy, grid=None, workers=SWEEP_WORKERS, **backtest_kwargs):
+    """
+    파라미터 격자를 프로세스 풀로 나눠 백테스트하고, 끝나는 순서대로 (params, stats) 를 내보내는 제너레이터
+
+    - 봉 배열은 임시 폴더에 한 번만 저장하고 작업 프로세스는 memmap 으로 연결
+      (작업마다 수십 MB 배열을 pickle 로 보내지 않으므로 조합 수/코어 수에 비례해 처리량이 늘어남)
+    - 작업에는 전략 이름과 파라미터만, 결과로는 통계 dict 만 오감
+    - 제너레이터를 중간에 닫으면 아직 시작하지 않은 작업은 취소하고 임시 폴더를 지움
+    Args:
+        bars: (N, 6) 봉 배열 [시각(ms), 시가, 고가, 저가, 종가, 거래량]
+        grid: {파라미터 이름: 값 목록} (기본: SWEEP_GRIDS[strategy], SWEEP_FILTERS 에 걸리는 조합은 제외)
+        backtest_kwargs: run_backtest 인자 (initial_balance, fee_rate 등)
+    """
+    combinations = parameter_grid(grid or SWEEP_GRIDS[strategy], SWEEP_FILTERS.get(strategy))
+    directory = tempfile.mkdtemp(prefix='sweep_')
+    executor = None
+    try:
+        # fork 하면 Qt 와 작업 스레드 상태까지 복사되므로 새 인터프리터로 시작
+        executor = ProcessPoolExecutor(max_workers=max(1, min(workers, len(combinations))),
+                                       mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=init_worker, initargs=(write_bars(directory, bars),))
+        futures = [executor.submit(run_task, strategy, params, backtest_kwargs) for params in combinations]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(directory, ignore_errors=True)
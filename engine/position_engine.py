@@ -0,0 +1,185 @@
+import numpy as np
+
+# 반대 방향 체결 후 남은 수량이 이 비율(체결/보유 수량 대비)보다 작으면 부동소수점 오차로 보고 0 으로 처리
+# (예: 0.1 + 0.2 - 0.3 = 5.55e-17)
+QUANTITY_TOLERANCE = 1e-9
+
+
+class Fill:
+    """체결 기록 한 건 (__slots__ 로 메모리 최소화)"""
+    __slots__ = ('timestamp', 'symbol', 'quantity', 'price', 'fee', 'realized_pnl')
+
+    def __init__(self, timestamp, symbol, quantity, price, fee, realized_pnl):
+        self.timestamp = timestamp        # 밀리초 타임스탬프
+        self.symbol = symbol              # 코인명 (예: "BTC")
+        self.quantity = quantity          # 체결 수량 (매수 +, 매도 -)
+        self.price = price                # 체결 가격
+        self.fee = fee                    # 수수료
+        self.realized_pnl = realized_pnl  # 이 체결로 확정된 손익 (수수료 제외)
+
+
+class PositionEngine:
+    """
+    체결을 누적하여 포지션과 손익을 계산하는 엔진
+
+    - 코인별 포지션은 고정 슬롯의 numpy 배열(수량, 평균가, 실현 손익 등)에 저장
+    - 체결 반영은 해당 슬롯 하나만 갱신하므로 체결 이력 길이와 무관하게 O(1)
+    - 시세 갱신 시 모든 포지션의 미실현 손익을 한 번의 벡터 연산으로 재계산
+    """
+
+    def __init__(self, initial_balance=0.0, capacity=16):
+        """
+        Args:
+            initial_balance: 초기 자산 (입금액)
+            capacity: 처음 할당할 포지션 슬롯 수
+        """
+        self.initial_balance = float(initial_balance)
+        self.symbols = []          # 슬롯 순서대로의 코인명
+        self.slot_index = {}       # 코인명 → 슬롯 인덱스
+        self.fills = []            # 체결 기록 (Fill 리스트)
+        self.total_fees = 0.0
+
+        self.quantity = np.zeros(capacity)        # 보유 수량 (롱 +, 숏 -)
+        self.avg_price = np.zeros(capacity)       # 평균 진입가
+        self.realized_pnl = np.zeros(capacity)    # 누적 실현 손익 (수수료 차감)
+        self.fees = np.zeros(capacity)            # 누적 수수료
+        self.mark_price = np.zeros(capacity)      # 최근 평가 가격
+        self.unrealized_pnl = np.zeros(capacity)  # 미실현 손익
+        self.unrealized_rate = np.zeros(capacity) # 미실현 수익률(%)
+        self.liq_price = np.zeros(capacity)       # 청산 가격
+        self.leverage = np.ones(capacity)         # 레버리지
+
+    def _grow(self):
+        """슬롯 배열 크기를 2배로 늘림"""
+        for name in ('quantity', 'avg_price', 'realized_pnl', 'fees', 'mark_price',
+                     'unrealized_pnl', 'unrealized_rate', 'liq_price', 'leverage'):
+            old = getattr(self, name)
+            new = np.ones(len(old) * 2) if name == 'leverage' else np.zeros(len(old) * 2)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _slot(self, symbol):
+        """코인명에 해당하는 슬롯 인덱스 반환 (없으면 새로 할당)"""
+        index = self.slot_index.get(symbol)
+        if index is None:
+            index = len(self.symbols)
+            if index >= len(self.quantity):
+                self._grow()
+            self.symbols.append(symbol)
+            self.slot_index[symbol] = index
+        return index
+
+    def set_leverage(self, symbol, leverage):
+        """코인별 레버리지 설정"""
+        self.leverage[self._slot(symbol)] = leverage
+
+    def apply_fill(self, symbol, quantity, price, fee=0.0, timestamp=None):
+        """
+        체결 한 건을 포지션에 반영
+        Args:
+            symbol: 코인명 (예: "BTC")
+            quantity: 체결 수량 (매수는 양수, 매도는 음수)
+            price: 체결 가격
+            fee: 수수료
+            timestamp: 밀리초 타임스탬프
+        Returns:
+            Fill: 확정 손익이 기록된 체결 객체
+        """
+        i = self._slot(symbol)
+        position = self.quantity[i]
+        realized = 0.0
+
+        if position == 0 or np.sign(position) == np.sign(quantity):
+            # 신규 진입 또는 같은 방향 추가 → 평균가 갱신
+            new_position = position + quantity
+            self.avg_price[i] = (
+                (abs(position) * self.avg_price[i] + abs(quantity) * price) / abs(new_position)
+            )
+        else:
+            # 반대 방향 체결 → 줄어드는 수량만큼 손익 확정
+            closed = min(abs(quantity), abs(position))
+            realized = closed * (price - self.avg_price[i]) * np.sign(position)
+            new_position = position + quantity
+            if abs(new_position) <= QUANTITY_TOLERANCE * max(abs(position), abs(quantity)):
+                new_position = 0.0
+                self.avg_price[i] = 0.0
+            elif np.sign(new_position) != np.sign(position):
+                # 포지션이 뒤집히면 남은 수량은 체결가로 새로 진입
+                self.avg_price[i] = price
+
+        self.quantity[i] = new_position
+        self.realized_pnl[i] += realized - fee
+        self.fees[i] += fee
+        self.total_fees += fee
+
+        # 체결가가 가장 최근 시세이므로 체결마다 평가 가격 갱신 (다음 mark() 까지 미실현 손익이 낡지 않게)
+        self.mark_price[i] = price
+        self._mark_slot(i)
+
+        fill = Fill(timestamp, symbol, quantity, price, fee, float(realized))
+        self.fills.append(fill)
+        return fill
+
+    def _mark_slot(self, i):
+        """슬롯 하나의 미실현 손익 재계산"""
+        cost = abs(self.quantity[i]) * self.avg_price[i]
+        self.unrealized_pnl[i] = self.quantity[i] * (self.mark_price[i] - self.avg_price[i])
+        self.unrealized_rate[i] = self.unrealized_pnl[i] / cost * 100.0 if cost else 0.0
+
+    def mark(self, prices):
+        """
+        새 시세로 모든 포지션을 한 번에 재평가
+        Args:
+            prices: {코인명: 가격} 딕셔너리 또는 슬롯 순서의 가격 배열
+        """
+        n = len(self.symbols)
+        if n == 0:
+            return
+
+        if isinstance(prices, dict):
+            for symbol, price in prices.items():
+                i = self.slot_index.get(symbol)
+                if i is not None:
+                    self.mark_price[i] = price
+        else:
+            self.mark_price[:n] = prices
+
+        quantity = self.quantity[:n]
+        avg_price = self.avg_price[:n]
+        cost = np.abs(quantity) * avg_price
+        self.unrealized_pnl[:n] = quantity * (self.mark_price[:n] - avg_price)
+        self.unrealized_rate[:n] = np.divide(
+            self.unrealized_pnl[:n] * 100.0, cost,
+            out=np.zeros(n), where=cost != 0
+        )
+
+    def equity(self):
+        """초기 자산 + 실현 손익 + 미실현 손익"""
+        n = len(self.symbols)
+        return float(
+            self.initial_balance
+            + self.realized_pnl[:n].sum()
+            + self.unrealized_pnl[:n].sum()
+        )
+
+    def open_positions(self):
+        """
+        보유 중인 포지션 목록 (TradeHistoryTable.update_trade_history 형식)
+        Returns:
+            {코인명: 포지션 딕셔너리}
+        """
+        n = len(self.symbols)
+        positions = {}
+        for i in np.flatnonzero(self.quantity[:n]):
+            symbol = self.symbols[i]
+            positions[symbol] = {
+                "coin": symbol,
+                "quantity": float(self.quantity[i]),
+                "avg_price": float(self.avg_price[i]),
+                "mark_price": float(self.mark_price[i]),
+                "leverage": float(self.leverage[i]),
+                "liq_price": float(self.liq_price[i]),
+                "unrealized_pl": float(self.unrealized_rate[i]),
+                "realized_pl": float(self.realized_pnl[i]),
+            }
+        return positions
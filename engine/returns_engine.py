@@ -0,0 +1,181 @@
+import numpy as np
+from datetime import datetime, timedelta, timezone
+
+# 하루 길이 (밀리초)
+DAY_MS = 24 * 60 * 60 * 1000
+
+
+class ReturnsEngine:
+    """
+    자산(equity) 이력으로 기간별 수익률을 계산하는 엔진
+
+    - 이력은 미리 할당된 numpy 배열에 저장 (용량이 모자라면 2배로 확장)
+    - 일/주/월/연 경계 인덱스를 미리 계산해두고 새 값이 들어올 때만 갱신
+    - 수익률 조회는 경계 인덱스로 바로 접근하므로 이력 길이와 무관하게 O(1)
+    """
+
+    PERIODS = ('daily', 'weekly', 'monthly', 'yearly')
+
+    def __init__(self, tz_offset_hours=9, capacity=1024):
+        """
+        Args:
+            tz_offset_hours: 기간 경계를 나눌 시간대 (기본값: 한국 시간 UTC+9)
+            capacity: 처음 할당할 배열 크기
+        """
+        self.tz_offset_ms = int(tz_offset_hours * 60 * 60 * 1000)
+        self.timestamps = np.empty(capacity, dtype=np.int64)  # 밀리초 타임스탬프
+        self.equity = np.empty(capacity, dtype=np.float64)    # 자산 평가액
+        self.size = 0
+
+        # 기간별 현재 기간 키와 그 기간이 시작된 인덱스
+        self.period_keys = {period: None for period in self.PERIODS}
+        self.period_start_index = {period: 0 for period in self.PERIODS}
+
+        # 일별 시작 인덱스 (수익률 차트용)
+        self.day_start_indices = []
+
+    def _period_keys(self, timestamps):
+        """타임스탬프(배열 또는 스칼라)를 기간별 키로 변환"""
+        local_ms = np.asarray(timestamps, dtype=np.int64) + self.tz_offset_ms
+        days = local_ms // DAY_MS
+        months = local_ms.astype('datetime64[ms]').astype('datetime64[M]').astype(np.int64)
+        return {
+            'daily': days,
+            'weekly': (days + 3) // 7,  # 1970-01-01은 목요일 → 월요일 시작 주
+            'monthly': months,
+            'yearly': months // 12,
+        }
+
+    def _ensure_capacity(self, needed):
+        """배열 용량이 부족하면 2배씩 늘림"""
+        capacity = len(self.timestamps)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        timestamps = np.empty(capacity, dtype=np.int64)
+        equity = np.empty(capacity, dtype=np.float64)
+        timestamps[:self.size] = self.timestamps[:self.size]
+        equity[:self.size] = self.equity[:self.size]
+        self.timestamps = timestamps
+        self.equity = equity
+
+    def load_history(self, timestamps, equity):
+        """
+        자산 이력 전체를 한 번에 로드 (벡터 연산으로 기간 경계 계산)
+        Args:
+            timestamps: 밀리초 타임스탬프 배열 (오름차순)
+            equity: 각 시점의 자산 평가액 배열
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        equity = np.asarray(equity, dtype=np.float64)
+        n = len(timestamps)
+
+        self.size = 0
+        self._ensure_capacity(max(n, 1))
+        self.timestamps[:n] = timestamps
+        self.equity[:n] = equity
+        self.size = n
+
+        if n == 0:
+            self.period_keys = {period: None for period in self.PERIODS}
+            self.period_start_index = {period: 0 for period in self.PERIODS}
+            self.day_start_indices = []
+            return
+
+        keys = self._period_keys(timestamps)
+        for period in self.PERIODS:
+            period_key = keys[period]
+            # 키가 바뀌는 위치가 곧 기간의 시작 인덱스
+            starts = np.flatnonzero(np.diff(period_key)) + 1
+            self.period_keys[period] = int(period_key[-1])
+            self.period_start_index[period] = int(starts[-1]) if len(starts) else 0
+            if period == 'daily':
+                self.day_start_indices = [0] + starts.tolist()
+
+    def add_mark(self, timestamp, equity):
+        """
+        새 자산 평가액 추가 (시세 갱신마다 호출)
+        Args:
+            timestamp: 밀리초 타임스탬프 (직전 값보다 같거나 커야 함)
+            equity: 자산 평가액
+        """
+        index = self.size
+        self._ensure_capacity(index + 1)
+        self.timestamps[index] = timestamp
+        self.equity[index] = equity
+        self.size = index + 1
+
+        keys = self._period_keys(timestamp)
+        for period in self.PERIODS:
+            period_key = int(keys[period])
+            if period_key != self.period_keys[period]:
+                # 새 기간 시작
+                self.period_keys[period] = period_key
+                self.period_start_index[period] = index
+                if period == 'daily':
+                    self.day_start_indices.append(index)
+
+    def add_fill(self, timestamp, realized_pnl, fee=0.0):
+        """
+        체결로 확정된 손익을 자산에 반영
+        Args:
+            timestamp: 밀리초 타임스탬프
+            realized_pnl: 실현 손익
+            fee: 수수료
+        """
+        self.add_mark(timestamp, self.last_equity() + realized_pnl - fee)
+
+    def last_equity(self):
+        """가장 최근 자산 평가액"""
+        if self.size == 0:
+            return 0.0
+        return float(self.equity[self.size - 1])
+
+    def _rate(self, base, current):
+        """기준 자산 대비 수익률(%)"""
+        if base == 0:
+            return 0.0
+        return float((current / base - 1.0) * 100.0)
+
+    def get_profit_rates(self):
+        """
+        기간별 수익률 반환 (ProfitRateTable.update_profit_rates 형식)
+        각 기간의 수익률은 직전 기간 마지막 자산 대비 현재 자산으로 계산
+        """
+        if self.size == 0:
+            return {period: 0.0 for period in self.PERIODS + ('total',)}
+
+        current = self.equity[self.size - 1]
+        rates = {}
+        for period in self.PERIODS:
+            start = self.period_start_index[period]
+            base = self.equity[start - 1] if start > 0 else self.equity[0]
+            rates[period] = self._rate(base, current)
+        rates['total'] = self._rate(self.equity[0], current)
+        return rates
+
+    def daily_total_profits(self, days=7):
+        """
+        최근 며칠간 일별 전체 수익률 (TotalProfitChart.daily_total_profits 형식)
+        Returns:
+            [(날짜 'MM/DD', 수익률)] 리스트
+        """
+        if self.size == 0:
+            return []
+
+        starts = np.asarray(self.day_start_indices[-days:], dtype=np.int64)
+        # 각 날의 마지막 인덱스 = 다음 날 시작 - 1 (오늘은 현재까지)
+        ends = np.append(starts[1:] - 1, self.size - 1)
+        base = self.equity[0]
+        if base == 0:
+            profits = np.zeros(len(ends))
+        else:
+            profits = (self.equity[ends] / base - 1.0) * 100.0
+
+        tz = timezone(timedelta(milliseconds=self.tz_offset_ms))
+        dates = [
+            datetime.fromtimestamp(ts / 1000, tz).strftime('%m/%d')
+            for ts in self.timestamps[starts]
+        ]
+        return list(zip(dates, np.round(profits, 2).tolist()))
@@ -0,0 +1,103 @@
+import numpy as np
+
+# 체결 방향
+BUY = 1
+SELL = -1
+
+
+class TradeTape:
+    """
+    최근 체결 내역 링 버퍼 (시각, 가격, 수량, 방향)
+
+    - capacity 개의 배열을 미리 만들어 두고 오래된 체결부터 덮어씀 → 세션 길이와 무관하게 메모리 일정
+    - 행 번호 0 이 가장 최근 체결, 행 하나 조회는 O(1)
+    - aggregate() 로 시간 구간별 매수/매도 수량 합계 계산
+    """
+
+    def __init__(self, capacity=10000):
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.int64)  # 체결 시각 (ms)
+        self.prices = np.zeros(capacity)
+        self.sizes = np.zeros(capacity)
+        self.sides = np.zeros(capacity, dtype=np.int8)        # BUY / SELL
+        self.head = 0        # 다음에 쓸 위치
+        self.count = 0       # 보관 중인 체결 수
+        self.total = 0       # 지금까지 받은 체결 수
+
+    def __len__(self):
+        return self.count
+
+    def extend(self, timestamps, prices, sizes, sides):
+        """체결 여러 건을 시간 순서대로 추가"""
+        n = len(timestamps)
+        if n == 0:
+            return 0
+        if n > self.capacity:
+            # 버퍼보다 많이 들어오면 최근 capacity 건만 보관
+            skip = n - self.capacity
+            timestamps, prices, sizes, sides = (timestamps[skip:], prices[skip:],
+                                                sizes[skip:], sides[skip:])
+            self.head = (self.head + skip) % self.capacity
+            self.total += skip
+            n = self.capacity
+
+        positions = (self.head + np.arange(n)) % self.capacity
+        self.timestamps[positions] = timestamps
+        self.prices[positions] = prices
+        self.sizes[positions] = sizes
+        self.sides[positions] = sides
+        self.head = (self.head + n) % self.capacity
+        self.count = min(self.count + n, self.capacity)
+        self.total += n
+        return n
+
+    def position(self, row):
+        """행 번호(0 = 최신) → 버퍼 위치"""
+        return (self.head - 1 - row) % self.capacity
+
+    def row(self, row):
+        """(시각, 가격, 수량, 방향)"""
+        i = self.position(row)
+        return int(self.timestamps[i]), float(self.prices[i]), float(self.sizes[i]), int(self.sides[i])
+
+    def chronological(self):
+        """오래된 순서로 정렬된 보관 중인 체결 배열 (시각, 가격, 수량, 방향)"""
+        start = (self.head - self.count) % self.capacity
+        order = (start + np.arange(self.count)) % self.capacity
+        return self.timestamps[order], self.prices[order], self.sizes[order], self.sides[order]
+
+    def rate(self, window_ms=1000):
+        """최근 window_ms 동안 초당 체결 수"""
+        if self.count == 0:
+            return 0.0
+        latest = self.timestamps[self.position(0)]
+        start = (self.head - self.count) % self.capacity
+        order = (start + np.arange(self.count)) % self.capacity
+        recent = self.count - np.searchsorted(self.timestamps[order], latest - window_ms, side='right')
+        return recent * 1000.0 / window_ms
+
+    def aggregate(self, slice_ms):
+        """
+        시간 구간별 집계 (최신 구간이 0 번)
+        Returns:
+            {'timestamps': 구간 시작 시각, 'vwap': 거래량 가중 평균가,
+             'buy': 매수 수량, 'sell': 매도 수량, 'count': 체결 수}
+        """
+        timestamps, prices, sizes, sides = self.chronological()
+        if len(timestamps) == 0:
+            empty = np.empty(0)
+            return {'timestamps': np.empty(0, dtype=np.int64), 'vwap': empty,
+                    'buy': empty, 'sell': empty, 'count': np.empty(0, dtype=np.int64)}
+        buckets = timestamps // slice_ms
+        starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+        notional = np.add.reduceat(prices * sizes, starts)
+        volume = np.add.reduceat(sizes, starts)
+        buy = np.add.reduceat(np.where(sides == BUY, sizes, 0.0), starts)
+        count = np.diff(np.append(starts, len(timestamps)))
+        return {
+            'timestamps': (buckets[starts] * slice_ms)[::-1],
+            'vwap': (notional / np.where(volume > 0, volume, 1.0))[::-1],
+            'buy': buy[::-1],
+            'sell': (volume - buy)[::-1],
+            'count': count[::-1],
+        }
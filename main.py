@@ -1,15 +1,15 @@
 import sys
 from PyQt5.QtWidgets import QApplication
 from ui.exchange_selector import ExchangeSelector
-from modern_ui import apply_unified_style
+from ui.theme import apply_theme
 
 def main():
     # PyQt 애플리케이션 생성
     app = QApplication(sys.argv)
     
-    # 전체 앱에 통일된 스타일 적용
+    # 전체 앱에 테마 스타일시트 한 번 적용 (이후 창들은 다시 적용하지 않음)
     
-    apply_unified_style(app)
+    apply_theme(app)
     
     # 거래소 선택 창 표시
     selector = ExchangeSelector()
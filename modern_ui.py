@@ -1,6 +1,7 @@
 import os
+import time
 from PyQt5.QtWidgets import QFrame, QGraphicsDropShadowEffect, QVBoxLayout,QComboBox , QPushButton, QGraphicsOpacityEffect
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSize, QTimer, QSequentialAnimationGroup, QParallelAnimationGroup, QAbstractAnimation
+from PyQt5.QtCore import Qt, QObject, QEvent, pyqtSignal, QPropertyAnimation, QEasingCurve, QSize, QTimer, QSequentialAnimationGroup, QParallelAnimationGroup, QAbstractAnimation
 from PyQt5.QtGui import QColor, QPainter, QPainterPath, QLinearGradient, QPalette
 
 # 둥근 모서리를 가진 프레임 클래스
@@ -233,98 +234,107 @@ def apply_modern_table_style(table, header_color="#1e222d", row_color="#1e222d",
     table.setShowGrid(False)  # 그리드 라인 제거
 
 # 전체 앱에 통일된 스타일 적용
-def apply_unified_style(app, app_font_name='NanumSquare'):
+def parse_price(text):
+    """'BTC/USDT: 60,123.4' 같은 레이블 글자에서 마지막 숫자 추출 (없으면 None)"""
+    try:
+        return float(text.rsplit(' ', 1)[-1].replace(',', ''))
+    except ValueError:
+        return None
+
+
+class PriceFlashController(QObject):
     """
-    앱 전체에 통일된 현대적 스타일을 적용합니다.
+    가격 레이블 깜빡임 효과 (레이블마다 하나)
+
+    - 투명도 효과와 애니메이션을 한 번만 만들어 두고 가격이 바뀔 때마다 재시작
+    - 깜빡이지 않는 동안에는 효과를 꺼 두어 레이블을 오프스크린으로 그리지 않음
+    - min_interval 안에 다시 바뀌면 글자와 색만 바꾸고 진행 중인 애니메이션은 그대로 둠
+    - 상승/하락 색은 동적 속성 flash="up"/"down" 으로 앱 테마 스타일시트에서 지정 (방향이 바뀔 때만 다시 polish)
+    - 글자가 그대로면 아무것도 하지 않음
     """
-    app.setStyleSheet(f"""
-        QMainWindow, QDialog {{
-            background-color: #1a1d2d;
-            color: #e6e9ef;
-        }}
-        
-        QWidget {{
-            color: #e6e9ef;
-            font-family: '{app_font_name}', Arial;
-        }}
-        
-        QLabel {{
-            color: #e6e9ef;
-            font-size: 8px;
-        }}
-        
-        QLabel#program_name {{
-            font-size: 18px;
-            font-weight: bold;
-            color: white;
-        }}
-        
-        QComboBox {{
-            background-color: #2a3447;
-            color: white;
-            padding: 6px 10px;
-            border: none;
-            border-radius: 4px;
-        }}
-        
-        QComboBox:hover {{
-            background-color: #3d4760;
-        }}
-        
-        QComboBox::drop-down {{
-            subcontrol-origin: padding;
-            subcontrol-position: center right;
-            width: 20px;
-            border: none;
-        }}
-        
-        QComboBox QAbstractItemView {{
-            background-color: #2a3447;
-            color: white;
-            selection-background-color: #3d4760;
-            selection-color: white;
-            border: none;
-            outline: none;
-        }}
-    """)
 
-def add_price_update_effect(label):
-    """가격 레이블에 값이 변경될 때 강조 효과 추가"""
-    def animate_color():
-        # 가격 변화를 표시하는 애니메이션 시퀀스
-        effect = QGraphicsOpacityEffect(label)
-        label.setGraphicsEffect(effect)
-        
-        # 깜빡이는 효과를 위한 애니메이션
-        anim = QPropertyAnimation(effect, b"opacity")
-        anim.setDuration(300)
-        anim.setStartValue(1.0)
-        anim.setEndValue(0.5)
-        anim.setEasingCurve(QEasingCurve.OutQuad)
-        
-        anim2 = QPropertyAnimation(effect, b"opacity")
-        anim2.setDuration(300)
-        anim2.setStartValue(0.5)
-        anim2.setEndValue(1.0)
-        anim2.setEasingCurve(QEasingCurve.InQuad)
-        
-        # 애니메이션 그룹 생성
-        group = QSequentialAnimationGroup()
-        group.addAnimation(anim)
-        group.addAnimation(anim2)
-        group.start(QAbstractAnimation.DeleteWhenStopped)
-    
-    # 기존 setText 메서드 저장
-    original_setText = label.setText
-    
-    # setText 오버라이드하여 값 변경 시 애니메이션 효과 적용
-    def custom_setText(text):
-        if label.text() != text:  # 텍스트가 변경된 경우에만
-            original_setText(text)
-            animate_color()
-    
-    # 메서드 변경
-    label.setText = custom_setText
+    def __init__(self, label, duration=600, min_interval=250, governor=None):
+        """
+        Args:
+            label: 가격 QLabel
+            duration: 한 번 깜빡이는 시간 (ms)
+            min_interval: 깜빡임을 다시 시작하기 전 최소 간격 (ms)
+            governor: AnimationGovernor (창이 안 보이는 동안에는 글자만 바꾸고 깜빡이지 않음)
+        """
+        super().__init__(label)
+        self.label = label
+        self.original_set_text = label.setText
+        self.min_interval = min_interval / 1000.0
+        self.last_flash = 0.0
+        self.price = parse_price(label.text())
+        self.direction = ''
+
+        self.effect = QGraphicsOpacityEffect(label)
+        self.effect.setEnabled(False)
+        label.setGraphicsEffect(self.effect)
+
+        self.animation = QPropertyAnimation(self.effect, b"opacity", self)
+        self.animation.setDuration(duration)
+        self.animation.setKeyValueAt(0.0, 1.0)
+        self.animation.setKeyValueAt(0.5, 0.5)
+        self.animation.setKeyValueAt(1.0, 1.0)
+        self.animation.setEasingCurve(QEasingCurve.InOutQuad)
+        self.animation.finished.connect(self.finish)
+
+        self.governor = governor
+        if governor is not None:
+            governor.active_changed.connect(self.on_governor_changed)
+
+    def set_text(self, text):
+        """label.setText 대신 호출 - 가격이 바뀌었으면 방향에 맞춰 깜빡임"""
+        if text == self.label.text():
+            return
+        self.original_set_text(text)
+        price = parse_price(text)
+        previous, self.price = self.price, price
+        if price is None or previous is None or price == previous:
+            return
+        self.flash('up' if price > previous else 'down')
+
+    def flash(self, direction):
+        """상승('up')/하락('down') 깜빡임 시작"""
+        if self.governor is not None and not self.governor.active:
+            return
+        self.set_direction(direction)
+        now = time.monotonic()
+        if now - self.last_flash < self.min_interval:
+            return
+        self.last_flash = now
+        self.effect.setEnabled(True)
+        self.animation.stop()
+        self.animation.start()
+
+    def set_direction(self, direction):
+        """동적 속성 변경 후 스타일 다시 적용 (같은 방향이면 생략)"""
+        if direction == self.direction:
+            return
+        self.direction = direction
+        self.label.setProperty('flash', direction)
+        style = self.label.style()
+        style.unpolish(self.label)
+        style.polish(self.label)
+
+    def on_governor_changed(self, active):
+        """창이 안 보이게 되면 진행 중인 깜빡임을 바로 끝냄"""
+        if not active and self.animation.state() == QAbstractAnimation.Running:
+            self.animation.stop()
+            self.finish()
+
+    def finish(self):
+        """깜빡임이 끝나면 효과를 끄고 기본 색으로 복귀"""
+        self.effect.setEnabled(False)
+        self.set_direction('')
+
+
+def add_price_update_effect(label, governor=None):
+    """가격 레이블에 값이 변경될 때 강조 효과 추가 (label.price_flash 로 컨트롤러 접근)"""
+    label.price_flash = PriceFlashController(label, governor=governor)
+    label.setText = label.price_flash.set_text
     return label
 
 def add_smooth_chart_updates(chart_widget):
@@ -369,54 +379,97 @@ def add_smooth_chart_updates(chart_widget):
         # 메서드 교체
         chart_widget.candlestick_item.set_data = animated_set_data
 
-def add_animated_background(widget):
-    """배경에 미묘한 그라데이션 애니메이션 효과 추가"""
-    # 그라데이션 객체 생성
-    gradient = QLinearGradient(0, 0, widget.width(), widget.height())
-    gradient.setColorAt(0, QColor("#1a1d2d"))
-    gradient.setColorAt(1, QColor("#2a3041"))
-    
-    # 팔레트에 그라데이션 설정
-    palette = widget.palette()
-    palette.setBrush(QPalette.Window, gradient)
-    widget.setPalette(palette)
-    widget.setAutoFillBackground(True)
-    
-    # 그라데이션 애니메이션
-    def animate_gradient():
-        animation = QPropertyAnimation()
-        animation.setDuration(10000)  # 10초
-        animation.setLoopCount(-1)    # 무한 반복
-        
-        def update_gradient(value):
-            new_gradient = QLinearGradient(0, 0, widget.width(), widget.height())
-            
-            # 값에 따라 색상 약간 변경
-            color1 = QColor("#1a1d2d")
-            color2 = QColor("#2a3041")
-            
-            # 미묘한 색상 변화
-            h1, s1, v1, _ = color1.getHsv()
-            h2, s2, v2, _ = color2.getHsv()
-            
-            # 색조와 채도 약간 변경 (값의 5% 정도)
-            mod_value = value * 0.05
-            color1.setHsv(h1, max(0, min(255, s1 + int(mod_value))), v1)
-            color2.setHsv(h2, max(0, min(255, s2 - int(mod_value))), v2)
-            
-            new_gradient.setColorAt(0, color1)
-            new_gradient.setColorAt(1, color2)
-            
-            palette = widget.palette()
-            palette.setBrush(QPalette.Window, new_gradient)
-            widget.setPalette(palette)
-        
-        animation.valueChanged.connect(update_gradient)
-        animation.start(QAbstractAnimation.DeleteWhenStopped)
-    
-    # 애니메이션 시작
-    QTimer.singleShot(500, animate_gradient)
-    
+class AnimationGovernor(QObject):
+    """
+    장식용 애니메이션 조절기 (창마다 하나)
+
+    - 등록된 애니메이션을 타이머 하나로 각자의 fps 까지만 호출
+    - 창이 숨겨지거나 최소화되거나 다른 창에 완전히 가려지면(노출되지 않으면) 타이머를 멈춤
+      → 멈춘 동안에는 마지막 프레임이 그대로 남고 CPU 를 쓰지 않음
+    - active_changed 시그널로 다른 효과(가격 깜빡임, 폴링 주기)도 멈춤/재개를 따라갈 수 있음
+      (등록된 애니메이션이 없어도 창 표시 여부는 계속 알려 줌, 타이머만 돌지 않음)
+    """
+
+    active_changed = pyqtSignal(bool)
+
+    def __init__(self, window, max_fps=30):
+        """
+        Args:
+            window: 상태를 지켜볼 최상위 창
+            max_fps: 타이머 최대 주기 (초당 호출 수)
+        """
+        super().__init__(window)
+        self.window = window
+        self.max_fps = max_fps
+        self.animations = []  # [콜백, 최소 호출 간격(초), 마지막 호출 시각]
+        self.phase = 0.0      # 실제로 움직인 시간 누적 (초) - 멈춘 동안은 늘지 않음
+        self.last_tick = None
+        self.active = False
+        self.watched_handle = None
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        window.installEventFilter(self)
+
+    def add(self, callback, fps):
+        """
+        애니메이션 등록
+        Args:
+            callback: callback(phase) - phase 는 움직인 시간 (초)
+            fps: 이 애니메이션의 최대 초당 호출 수
+        """
+        fps = min(fps, self.max_fps)
+        self.animations.append([callback, 1.0 / fps, -1.0])
+        interval = int(1000 / max(1.0 / entry[1] for entry in self.animations))
+        self.timer.setInterval(interval)
+        if self.active and not self.timer.isActive():
+            self.last_tick = time.monotonic()
+            self.timer.start()
+        self.update_state()
+
+    def is_visible(self):
+        """창이 화면에 실제로 보이는지 (숨김/최소화/가려짐이면 False)"""
+        window = self.window
+        if not window.isVisible() or window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange, QEvent.Expose):
+            if self.watched_handle is None and self.window.windowHandle() is not None:
+                # 가려짐 여부는 네이티브 창(QWindow)의 Expose 이벤트로 전달됨
+                self.watched_handle = self.window.windowHandle()
+                self.watched_handle.installEventFilter(self)
+            # 이벤트 처리가 끝난 뒤의 상태로 판단
+            QTimer.singleShot(0, self.update_state)
+        return False
+
+    def update_state(self):
+        """창 상태에 맞춰 타이머 시작/정지"""
+        active = self.is_visible()
+        if active == self.active:
+            return
+        self.active = active
+        if active and self.animations:
+            self.last_tick = time.monotonic()
+            self.timer.start()
+        else:
+            self.timer.stop()
+        self.active_changed.emit(active)
+
+    def tick(self):
+        """주기가 된 애니메이션만 호출"""
+        now = time.monotonic()
+        self.phase += now - self.last_tick
+        self.last_tick = now
+        for entry in self.animations:
+            callback, interval, last = entry
+            if self.phase - last >= interval:
+                entry[2] = self.phase
+                callback(self.phase)
+
+
 def add_table_row_animation(table):
     """테이블에 새 행이 추가될 때 애니메이션 효과"""
     # 원래 insertRow 메서드 저장
@@ -0,0 +1,161 @@
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtWidgets import QWidget, QFrame, QLabel, QVBoxLayout, QGridLayout, QScrollArea
+from PyQt5.QtCore import QTimer
+
+from chart.candlestick import CandlestickItem
+from chart.time_axis import kst_time_ticks, tick_step_for
+from ui.theme import palette
+from utils.perf_monitor import perf_monitor
+
+
+class ChartPanel(QFrame):
+    """
+    멀티 차트 그리드의 차트 한 칸 (심볼/봉 간격 하나)
+    데이터는 CandleStore 에서 읽고, 버전이 바뀌었을 때만 다시 그림
+    """
+
+    def __init__(self, symbol, timeframe, store, parent=None):
+        super().__init__(parent)
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.store = store
+        self.rendered_version = 0  # 마지막으로 그린 데이터 버전
+        self.setObjectName("chart_panel")
+        self.setMinimumSize(260, 200)
+
+        self.title_label = QLabel(f'{symbol}  {timeframe}')
+
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setBackground(palette()['chart_bg'])
+        self.plot_widget.showGrid(x=True, y=True, alpha=0.15)
+        self.plot_widget.hideButtons()
+        self.candlestick_item = CandlestickItem()
+        self.plot_widget.addItem(self.candlestick_item)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(2, 2, 2, 2)
+        layout.setSpacing(0)
+        layout.addWidget(self.title_label)
+        layout.addWidget(self.plot_widget)
+
+    def apply_theme_colors(self):
+        """테마 전환 - 차트 배경을 지금 테마 색으로"""
+        self.plot_widget.setBackground(palette()['chart_bg'])
+
+    def is_on_screen(self):
+        """창에 실제로 보이는지 (숨김/최소화/스크롤 밖이면 False)"""
+        return self.isVisible() and not self.visibleRegion().isEmpty()
+
+    def needs_render(self):
+        """새 데이터가 있고 화면에 보이는 경우에만 True"""
+        return self.store.version(self.symbol, self.timeframe) != self.rendered_version \
+            and self.is_on_screen()
+
+    def render(self):
+        """저장소의 최신 데이터로 다시 그리기"""
+        version, candle_data, df = self.store.get(self.symbol, self.timeframe)
+        if candle_data is None:
+            return
+        self.candlestick_item.set_data(candle_data)
+        timestamps_ms = df['timestamp'].to_numpy().astype('datetime64[ms]').astype(np.int64)
+        step = tick_step_for(timestamps_ms, max_labels=4)
+        fmt = '%m/%d' if step >= 1440 else '%H:%M'
+        self.plot_widget.getAxis('bottom').setTicks([kst_time_ticks(timestamps_ms, step, fmt)])
+        self.title_label.setText(f'{self.symbol}  {self.timeframe}  {candle_data[-1, 4]:,.2f}')
+        self.rendered_version = version
+
+
+class ChartGrid(QWidget):
+    """
+    여러 심볼/봉 간격 차트를 격자로 배치하는 창
+
+    - 모든 차트가 FetchScheduler 하나와 CandleStore 하나를 공유 (같은 키는 한 번만 요청)
+    - 그리기 타이머 하나로 새 데이터가 있고 화면에 보이는 차트만 다시 그림
+    - 숨겨지거나 스크롤 밖에 있던 차트는 다시 보일 때 최신 데이터로 한 번만 따라잡음
+    """
+
+    def __init__(self, scheduler, store, charts=(), columns=4, fps=10, parent=None):
+        """
+        Args:
+            scheduler: 공유 FetchScheduler
+            store: 공유 CandleStore
+            charts: [(심볼, 봉 간격), ...]
+            columns: 한 줄에 놓을 차트 수
+            fps: 초당 최대 그리기 횟수
+        """
+        super().__init__(parent)
+        self.setWindowTitle('Multi Chart')
+        self.setObjectName("chart_grid")  # 테마 스타일시트 선택자 (자식 위젯보다 먼저 지정)
+        self.scheduler = scheduler
+        self.store = store
+        self.columns = columns
+        self.panels = []
+
+        self.container = QWidget()
+        self.grid_layout = QGridLayout(self.container)
+        self.grid_layout.setContentsMargins(4, 4, 4, 4)
+        self.grid_layout.setSpacing(4)
+
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setWidget(self.container)
+        # 스크롤하면 새로 보이게 된 차트를 바로 그림
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self.render_tick)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.scroll_area)
+
+
+        self.render_timer = QTimer(self)
+        self.render_timer.timeout.connect(self.render_tick)
+        self.render_timer.setInterval(int(1000 / fps))
+
+        for symbol, timeframe in charts:
+            self.add_chart(symbol, timeframe)
+
+    def add_chart(self, symbol, timeframe):
+        """차트 추가 후 데이터 구독"""
+        panel = ChartPanel(symbol, timeframe, self.store)
+        index = len(self.panels)
+        self.grid_layout.addWidget(panel, index // self.columns, index % self.columns)
+        self.panels.append(panel)
+        self.scheduler.subscribe(symbol, timeframe)
+        return panel
+
+    def apply_theme_colors(self):
+        """테마 전환 - 모든 차트 배경을 지금 테마 색으로 (창 스타일은 앱 스타일시트가 바꿈)"""
+        for panel in self.panels:
+            panel.apply_theme_colors()
+
+    def remove_chart(self, panel):
+        """차트 제거 후 구독 해제"""
+        self.panels.remove(panel)
+        self.scheduler.unsubscribe(panel.symbol, panel.timeframe)
+        self.grid_layout.removeWidget(panel)
+        panel.deleteLater()
+
+    def render_tick(self):
+        """새 데이터가 있고 보이는 차트만 다시 그림"""
+        if self.isMinimized():
+            return
+        with perf_monitor.stage('grid_render'):
+            for panel in self.panels:
+                if panel.needs_render():
+                    panel.render()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.render_timer.start()
+
+    def hideEvent(self, event):
+        # 창이 숨겨지거나 최소화되면 그리기 중단
+        self.render_timer.stop()
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        """창을 닫으면 모든 구독 해제"""
+        for panel in list(self.panels):
+            self.remove_chart(panel)
+        super().closeEvent(event)
@@ -0,0 +1,61 @@
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import Qt, QTimer
+
+from utils.perf_monitor import perf_monitor
+
+
+class PerfHud(QLabel):
+    """
+    차트 위에 겹쳐서 단계별 지연 시간(p50/p95/p99)을 보여주는 오버레이
+    보이는 동안에만 주기적으로 갱신
+    """
+
+    def __init__(self, parent, monitor=None, interval=500, memory_usage=None):
+        """
+        Args:
+            parent: 오버레이를 띄울 위젯 (예: 캔들 차트)
+            monitor: PerfMonitor 인스턴스 (기본값: 전역 perf_monitor)
+            interval: 갱신 주기 (ms)
+            memory_usage: {이름: 바이트} 를 돌려주는 함수 (있으면 메모리 사용량도 표시)
+        """
+        super().__init__(parent)
+        self.monitor = monitor or perf_monitor
+        self.memory_usage = memory_usage
+        self.setObjectName("perf_hud")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.PlainText)
+        self.move(60, 10)
+        self.hide()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.setInterval(interval)
+
+    def toggle(self):
+        """HUD 표시/숨김 전환"""
+        if self.isVisible():
+            self.refresh_timer.stop()
+            self.hide()
+        else:
+            self.refresh()
+            self.show()
+            self.raise_()
+            self.refresh_timer.start()
+
+    def refresh(self):
+        """측정 요약을 텍스트로 표시 (단위: ms)"""
+        lines = [f"{'stage':<18}{'p50':>8}{'p95':>8}{'p99':>8}{'n':>7}"]
+        for name, stats in self.monitor.summary().items():
+            lines.append(
+                f"{name:<18}{stats['p50'] * 1e3:>8.2f}{stats['p95'] * 1e3:>8.2f}"
+                f"{stats['p99'] * 1e3:>8.2f}{stats['count']:>7}"
+            )
+        if self.memory_usage is not None:
+            usage = self.memory_usage()
+            lines.append('')
+            lines.append(f"{'memory':<26}{'KB':>23}")
+            for name, size in usage.items():
+                lines.append(f"{name:<26}{size / 1024:>23,.1f}")
+            lines.append(f"{'total':<26}{sum(usage.values()) / 1024:>23,.1f}")
+        self.setText('\n'.join(lines))
+        self.adjustSize()
@@ -1,7 +1,8 @@
 from PyQt5.QtWidgets import QTableWidget, QHeaderView, QGraphicsDropShadowEffect, QTableWidgetItem
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QFontDatabase
-import os
+from PyQt5.QtGui import QColor
+
+from ui.theme import load_app_font
 
 class ProfitRateTable(QTableWidget):
     def __init__(self):
@@ -11,17 +12,8 @@ class ProfitRateTable(QTableWidget):
         self.apply_modern_style()
     
     def load_custom_fonts(self):
-        """NanumSquareOTF_acR 폰트 로드"""
-        fonts_dir = os.path.join('assets', 'fonts')
-        font_path = os.path.join(fonts_dir, "NanumSquareOTF_acR.otf")
-        self.app_font_name = "NanumSquareOTF_acR"  # 기본값
-        
-        if os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            if font_id != -1:
-                font_families = QFontDatabase.applicationFontFamilies(font_id)
-                if font_families:
-                    self.app_font_name = font_families[0]
+        """앱 글꼴 이름 (등록은 theme.load_app_font 에서 한 번만)"""
+        self.app_font_name = load_app_font()
     
     def setup_table(self):
         """테이블 기본 설정"""
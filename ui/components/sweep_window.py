@@ -0,0 +1,284 @@
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtWidgets import (QWidget, QLabel, QComboBox, QPushButton, QHBoxLayout, QVBoxLayout, QSplitter,
+                             QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+
+from engine.param_sweep import SWEEP_FILTERS, SWEEP_GRIDS, SWEEP_WORKERS, parameter_grid, run_sweep
+from ui.theme import palette
+from utils.perf_monitor import perf_monitor
+
+# 결과 표/히트맵에 쓰는 통계 (키, 표 머리글, 표시 형식)
+METRICS = [
+    ('total_return', '수익률 %', '{:+.2f}'),
+    ('max_drawdown', '최대 낙폭 %', '{:.2f}'),
+    ('win_rate', '승률 %', '{:.1f}'),
+    ('trades', '체결', '{:,}'),
+    ('fees', '수수료', '{:,.2f}'),
+]
+
+
+class NumericItem(QTableWidgetItem):
+    """숫자 값으로 정렬되는 표 칸 (문자열 정렬이면 -10 < -2 < 3 순서가 깨짐)"""
+
+    def __init__(self, value, fmt):
+        super().__init__(fmt.format(value))
+        self.value = value
+        self.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+
+    def __lt__(self, other):
+        if isinstance(other, NumericItem):
+            return self.value < other.value
+        return super().__lt__(other)
+
+
+class SweepThread(QThread):
+    """파라미터 스윕을 돌리고 조합 하나가 끝날 때마다 결과를 UI 로 보내는 작업 스레드"""
+
+    result = pyqtSignal(object, object)  # params, stats
+    progress = pyqtSignal(int, int)      # 끝난 조합 수, 전체 조합 수
+    sweep_finished = pyqtSignal(float)   # 걸린 시간 (초)
+    sweep_failed = pyqtSignal(str)
+
+    def __init__(self, bars, strategy, grid, backtest_kwargs=None, workers=SWEEP_WORKERS, parent=None):
+        super().__init__(parent)
+        self.bars = bars
+        self.strategy = strategy
+        self.grid = grid
+        self.backtest_kwargs = backtest_kwargs or {}
+        self.workers = workers
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        total = len(parameter_grid(self.grid, SWEEP_FILTERS.get(self.strategy)))
+        started = time.perf_counter()
+        results = run_sweep(self.bars, self.strategy, self.grid, self.workers, **self.backtest_kwargs)
+        try:
+            for done, (params, stats) in enumerate(results, 1):
+                if self.cancelled:
+                    break
+                self.result.emit(params, stats)
+                self.progress.emit(done, total)
+        except (BrokenProcessPool, OSError, ValueError) as e:
+            print(f"파라미터 스윕 실패: {e}")
+            self.sweep_failed.emit(str(e))
+            return
+        finally:
+            # 남은 작업 취소, 작업 프로세스 종료, 임시 봉 파일 삭제
+            results.close()
+        if self.cancelled:
+            self.sweep_failed.emit('취소됨')
+            return
+        self.sweep_finished.emit(time.perf_counter() - started)
+
+
+class SweepWindow(QWidget):
+    """
+    전략 파라미터 스윕 창 - 정렬 가능한 결과 표 + 2차원 히트맵
+
+    - Run 을 누르면 bars_source() 의 봉으로 SWEEP_GRIDS 격자를 프로세스 풀에서 백테스트
+    - 결과는 끝나는 순서대로 들어오고, 표/히트맵은 타이머로 모아서 갱신 (조합마다 다시 그리지 않음)
+    - 히트맵은 격자의 앞 두 파라미터를 세로/가로 축으로, 선택한 통계를 색으로 표시
+    """
+
+    def __init__(self, bars_source, strategy='SMA Cross', backtest_kwargs=None, fps=5, parent=None):
+        """
+        Args:
+            bars_source: (N, 6) 봉 배열을 돌려주는 함수 (Run 을 누를 때마다 호출)
+            strategy: 처음 선택할 전략
+            backtest_kwargs: run_backtest 인자 (initial_balance 등)
+            fps: 스윕 중 표/히트맵 초당 최대 갱신 횟수
+        """
+        super().__init__(parent)
+        self.setWindowTitle('Parameter Sweep')
+        self.setObjectName("sweep_window")  # 테마 스타일시트 선택자 (자식 위젯보다 먼저 지정)
+        self.bars_source = bars_source
+        self.backtest_kwargs = backtest_kwargs or {}
+        self.sweep_thread = None
+        self.grid = {}
+        self.results = []       # [(params, stats)] 들어온 순서
+        self.pending_rows = []  # 아직 표에 넣지 않은 결과
+        self.heat_index = ({}, {})  # 파라미터 값 → 히트맵 (세로, 가로) 칸 번호
+        self.heat_values = {}       # 통계 키 → (가로 칸 수, 세로 칸 수) 배열
+        self.heat_dirty = False
+        self.best_text = ''
+
+        self.strategy_combo = QComboBox()
+        self.strategy_combo.addItems(list(SWEEP_GRIDS))
+        self.strategy_combo.setCurrentText(strategy if strategy in SWEEP_GRIDS else 'SMA Cross')
+
+        self.metric_combo = QComboBox()
+        for key, label, _ in METRICS:
+            self.metric_combo.addItem(label, key)
+        self.metric_combo.currentIndexChanged.connect(self.render_heatmap)
+
+        self.run_button = QPushButton('Run')
+        self.run_button.setMaximumWidth(80)
+        self.run_button.clicked.connect(self.toggle_sweep)
+
+        self.status_label = QLabel()
+        self.status_label.setObjectName("sweep_status")
+
+        controls = QHBoxLayout()
+        controls.addWidget(self.strategy_combo)
+        controls.addWidget(self.metric_combo)
+        controls.addWidget(self.run_button)
+        controls.addWidget(self.status_label, 1)
+
+        self.table = QTableWidget(0, 0)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        self.heat_plot = pg.PlotWidget()
+        self.heat_plot.setBackground(palette()['chart_bg'])
+        self.heat_plot.hideButtons()
+        self.heat_plot.setMouseEnabled(x=False, y=False)
+        self.heat_image = pg.ImageItem()
+        self.heat_image.setColorMap(pg.colormap.get('viridis'))
+        self.heat_plot.addItem(self.heat_image)
+
+        splitter = QSplitter(Qt.Horizontal)
+        splitter.addWidget(self.table)
+        splitter.addWidget(self.heat_plot)
+        splitter.setSizes([520, 480])
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 6)
+        layout.addLayout(controls)
+        layout.addWidget(splitter)
+
+        self.render_timer = QTimer(self)
+        self.render_timer.timeout.connect(self.render_tick)
+        self.render_timer.setInterval(int(1000 / fps))
+
+    def toggle_sweep(self):
+        """스윕 시작, 진행 중이면 취소"""
+        if self.sweep_thread is not None and self.sweep_thread.isRunning():
+            self.sweep_thread.cancel()
+            return
+
+        bars = self.bars_source()
+        if len(bars) < 2:
+            self.status_label.setText('백테스트할 봉이 없음')
+            return
+        strategy = self.strategy_combo.currentText()
+        self.grid = SWEEP_GRIDS[strategy]
+        self.reset_views()
+
+        self.sweep_thread = SweepThread(bars, strategy, self.grid, self.backtest_kwargs, parent=self)
+        self.sweep_thread.result.connect(self.on_result)
+        self.sweep_thread.progress.connect(self.on_progress)
+        self.sweep_thread.sweep_finished.connect(self.on_finished)
+        self.sweep_thread.sweep_failed.connect(self.on_failed)
+        self.sweep_thread.start()
+        self.render_timer.start()
+        self.run_button.setText('Cancel')
+        self.status_label.setText(f'{strategy} · {len(bars):,}봉 · 작업 프로세스 {SWEEP_WORKERS}개 시작 중')
+
+    def reset_views(self):
+        """새 격자에 맞게 표 열과 히트맵 축 초기화"""
+        self.results = []
+        self.pending_rows = []
+        names = list(self.grid)
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(0)
+        self.table.setColumnCount(len(names) + len(METRICS))
+        self.table.setHorizontalHeaderLabels(names + [label for _, label, _ in METRICS])
+
+        # 파라미터가 하나면 세로 한 줄짜리 히트맵
+        y_values = self.grid[names[0]]
+        x_values = self.grid[names[1]] if len(names) > 1 else [None]
+        self.heat_index = ({value: i for i, value in enumerate(y_values)},
+                           {value: i for i, value in enumerate(x_values)})
+        self.heat_values = {key: np.full((len(x_values), len(y_values)), np.nan) for key, _, _ in METRICS}
+        self.heat_image.clear()
+        self.heat_plot.getAxis('left').setTicks([[(i + 0.5, str(v)) for i, v in enumerate(y_values)]])
+        self.heat_plot.getAxis('bottom').setTicks([[(i + 0.5, '' if v is None else str(v))
+                                                     for i, v in enumerate(x_values)]])
+        self.heat_plot.setLabel('left', names[0])
+        self.heat_plot.setLabel('bottom', names[1] if len(names) > 1 else '')
+        self.heat_plot.setRange(xRange=(0, len(x_values)), yRange=(0, len(y_values)), padding=0)
+
+    def on_result(self, params, stats):
+        names = list(self.grid)
+        y = self.heat_index[0][params[names[0]]]
+        x = self.heat_index[1][params[names[1]] if len(names) > 1 else None]
+        for key, _, _ in METRICS:
+            self.heat_values[key][x, y] = stats[key]
+        self.results.append((params, stats))
+        self.pending_rows.append((params, stats))
+        self.heat_dirty = True
+
+    def on_progress(self, done, total):
+        params, stats = max(self.results, key=lambda result: result[1]['total_return'])
+        self.best_text = (f'최고 수익률 {stats["total_return"]:+.2f}% '
+                          f'({", ".join(f"{name}={value}" for name, value in params.items())})')
+        self.status_label.setText(f'{done}/{total} · {self.best_text}')
+
+    def on_finished(self, elapsed):
+        self.render_tick()
+        self.render_timer.stop()
+        self.run_button.setText('Run')
+        total = len(self.results)
+        self.status_label.setText(f'{total}개 조합 {elapsed:.1f}초 ({total / elapsed:.1f}개/초) · {self.best_text}')
+        print(f"파라미터 스윕 완료: {self.status_label.text()}")
+
+    def on_failed(self, message):
+        self.render_tick()
+        self.render_timer.stop()
+        self.run_button.setText('Run')
+        self.status_label.setText(f'스윕 중단: {message}')
+
+    def render_tick(self):
+        """쌓인 결과를 표에 추가하고 히트맵 다시 그리기"""
+        if self.pending_rows:
+            with perf_monitor.stage('sweep_table'):
+                self.append_rows(self.pending_rows)
+            self.pending_rows = []
+        if self.heat_dirty:
+            self.render_heatmap()
+
+    def append_rows(self, rows):
+        names = list(self.grid)
+        # 정렬을 켠 채로 넣으면 칸마다 다시 정렬되므로 잠시 끔
+        self.table.setSortingEnabled(False)
+        start = self.table.rowCount()
+        self.table.setRowCount(start + len(rows))
+        for row, (params, stats) in enumerate(rows, start):
+            for column, name in enumerate(names):
+                self.table.setItem(row, column, NumericItem(params[name], '{}'))
+            for column, (key, _, fmt) in enumerate(METRICS, len(names)):
+                self.table.setItem(row, column, NumericItem(stats[key], fmt))
+        self.table.setSortingEnabled(True)
+
+    def render_heatmap(self):
+        """선택한 통계로 히트맵 색 지정 (아직 결과가 없거나 제외된 조합 칸은 투명)"""
+        key = self.metric_combo.currentData()
+        values = self.heat_values.get(key) if self.results else None
+        self.heat_dirty = False
+        if values is None:
+            return
+        finite = values[np.isfinite(values)]
+        low, high = (float(finite.min()), float(finite.max())) if len(finite) else (0.0, 1.0)
+        with perf_monitor.stage('sweep_heatmap'):
+            self.heat_image.setImage(values, levels=(low, high if high > low else low + 1.0))
+
+    def apply_theme_colors(self):
+        """테마 전환 - 히트맵 배경을 지금 테마 색으로"""
+        self.heat_plot.setBackground(palette()['chart_bg'])
+
+    def closeEvent(self, event):
+        """창을 닫으면 진행 중인 스윕 취소 (작업 프로세스 종료까지 대기)"""
+        self.render_timer.stop()
+        if self.sweep_thread is not None:
+            self.sweep_thread.cancel()
+            self.sweep_thread.wait()
+        super().closeEvent(event)
@@ -1,7 +1,8 @@
 from PyQt5.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView, QGraphicsDropShadowEffect
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QFontDatabase, QFont
-import os
+from PyQt5.QtGui import QColor, QFont
+
+from ui.theme import load_app_font, palette
 
 class TradeHistoryTable(QTableWidget):
     def __init__(self):
@@ -18,8 +19,8 @@ class TradeHistoryTable(QTableWidget):
         row_count = self.rowCount()
         col_count = self.columnCount()
         
-        # 어두운 보라색 배경 (styles.py와 동일한 색상 사용)
-        dark_bg = "#0F0326"  # 매우 어두운 보라색 배경
+        # 지금 테마의 창 배경색 (네온: 매우 어두운 보라색)
+        dark_bg = palette()['window_bg']
         
         # 모든 셀에 기본 아이템 설정
         for row in range(row_count):
@@ -28,26 +29,19 @@ class TradeHistoryTable(QTableWidget):
                     item = QTableWidgetItem("")
                     item.setBackground(QColor(dark_bg))  # 기본 배경색 설정
                     self.setItem(row, col, item)
-    
-        # 세로 헤더(행 번호) 색상 설정
-        vheader = self.verticalHeader()
-        vheader.setStyleSheet(f"background-color: {dark_bg}; color: #077A8F;")  # 부드러운 청록색 텍스트
 
     def load_custom_fonts(self):
-        """커스텀 폰트 로드"""
-        fonts_dir = os.path.join('assets', 'fonts')
-        app_font_name = "NanumSquare"  # 기본값 설정
-        
-        # 폰트 파일들을 QFontDatabase에 등록
-        font_path = os.path.join(fonts_dir, "NanumSquareOTF_acR.otf")
-        if os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            if font_id != -1:
-                font_families = QFontDatabase.applicationFontFamilies(font_id)
-                if font_families and font_families[0]:
-                    app_font_name = font_families[0]
-        
-        self.app_font_name = app_font_name  # 인스턴스 변수로 저장
+        """앱 글꼴 이름 (등록은 theme.load_app_font 에서 한 번만)"""
+        self.app_font_name = load_app_font()
+
+    def apply_theme_colors(self):
+        """테마 전환 - 빈 칸 배경을 지금 테마 색으로 (데이터 칸은 스타일시트 배경을 씀)"""
+        dark_bg = QColor(palette()['window_bg'])
+        for row in range(self.rowCount()):
+            for col in range(self.columnCount()):
+                item = self.item(row, col)
+                if item is not None and not item.text():
+                    item.setBackground(dark_bg)
 
     def setup_table(self):
         """테이블 기본 설정 (헤더 중앙 정렬 적용)"""
@@ -81,7 +75,9 @@ class TradeHistoryTable(QTableWidget):
                         "quantity": 0.1,        # 수량
                         "liq_price": 50000.0,   # 청산가
                         "unrealized_pl": 5.2,   # 미실현 손익(%)
-                        "realized_pl": 100.5    # 실현 손익
+                        "realized_pl": 100.5,   # 실현 손익
+                        "liq_distance": 12.3,   # 청산가까지 거리(%) (선택)
+                        "at_risk": False        # 청산 위험 여부 (선택)
                     }
                 ]
         """
@@ -99,39 +95,7 @@ class TradeHistoryTable(QTableWidget):
             return
         
         for row, trade in enumerate(trade_data):
-            # 코인명 (중앙 정렬, 흰색)
-            coin_item = QTableWidgetItem(trade['coin'])
-            coin_item.setTextAlignment(Qt.AlignCenter)
-            coin_item.setForeground(QColor('#ffffff'))
-            self.setItem(row, 0, coin_item)
-            
-            # 수량 (소수점 8자리까지, 중앙 정렬, 흰색)
-            quantity_item = QTableWidgetItem(f"{trade['quantity']:.8f}")
-            quantity_item.setTextAlignment(Qt.AlignCenter)
-            quantity_item.setForeground(QColor('#ffffff'))
-            self.setItem(row, 1, quantity_item)
-            
-            # 청산가 (소수점 2자리까지, 중앙 정렬, 흰색)
-            liq_price_item = QTableWidgetItem(f"{trade['liq_price']:.2f}")
-            liq_price_item.setTextAlignment(Qt.AlignCenter)
-            liq_price_item.setForeground(QColor('#ffffff'))
-            self.setItem(row, 2, liq_price_item)
-            
-            # 미실현 손익 (색상 적용, 중앙 정렬)
-            unrealized = QTableWidgetItem(f"{trade['unrealized_pl']:+.2f}%")
-            unrealized.setTextAlignment(Qt.AlignCenter)
-            unrealized.setForeground(
-                QColor('#4CAF50' if trade['unrealized_pl'] >= 0 else '#FF5252')
-            )
-            self.setItem(row, 3, unrealized)
-            
-            # 실현 손익 (색상 적용, 중앙 정렬)
-            realized = QTableWidgetItem(f"{trade['realized_pl']:+.2f}")
-            realized.setTextAlignment(Qt.AlignCenter)
-            realized.setForeground(
-                QColor('#4CAF50' if trade['realized_pl'] >= 0 else '#FF5252')
-            )
-            self.setItem(row, 4, realized)
+            self.set_trade_row(row, trade)
         
         # 데이터 업데이트 후, 남은 셀도 배경색 설정
         # 만약 데이터가 10개 미만이면 10행까지 채움
@@ -141,7 +105,7 @@ class TradeHistoryTable(QTableWidget):
             for row in range(len(trade_data), 10):
                 for col in range(self.columnCount()):
                     item = QTableWidgetItem("")
-                    item.setBackground(QColor("#0F0326"))  # 어두운 보라색 배경
+                    item.setBackground(QColor(palette()['window_bg']))  # 지금 테마의 창 배경색
                     self.setItem(row, col, item)
             
     def add_trade(self, trade):
@@ -150,7 +114,15 @@ class TradeHistoryTable(QTableWidget):
         self.setRowCount(current_row + 1)
         
         # 마지막 행 인덱스와 trade 데이터를 사용하여 직접 행 업데이트
-        row = current_row
+        self.set_trade_row(current_row, trade)
+
+    def set_trade_row(self, row, trade):
+        """
+        한 행에 거래 데이터 표시
+        청산 위험 포지션(trade['at_risk'])은 행 배경과 청산가를 빨간색으로 강조
+        """
+        at_risk = trade.get('at_risk', False)
+        risk_bg = QColor('#4A0A1E')  # 위험 포지션 행 배경 (어두운 빨간색)
         
         # 코인명 (중앙 정렬, 흰색)
         coin_item = QTableWidgetItem(trade['coin'])
@@ -164,10 +136,13 @@ class TradeHistoryTable(QTableWidget):
         quantity_item.setForeground(QColor('#ffffff'))
         self.setItem(row, 1, quantity_item)
         
-        # 청산가 (소수점 2자리까지, 중앙 정렬, 흰색)
-        liq_price_item = QTableWidgetItem(f"{trade['liq_price']:.2f}")
+        # 청산가 (소수점 2자리까지, 중앙 정렬, 위험 시 빨간색 + 청산까지 거리 표시)
+        liq_text = f"{trade['liq_price']:.2f}"
+        if 'liq_distance' in trade:
+            liq_text += f" ({trade['liq_distance']:.1f}%)"
+        liq_price_item = QTableWidgetItem(liq_text)
         liq_price_item.setTextAlignment(Qt.AlignCenter)
-        liq_price_item.setForeground(QColor('#ffffff'))
+        liq_price_item.setForeground(QColor('#FF2D2D' if at_risk else '#ffffff'))
         self.setItem(row, 2, liq_price_item)
         
         # 미실현 손익 (색상 적용, 중앙 정렬)
@@ -185,6 +160,11 @@ class TradeHistoryTable(QTableWidget):
             QColor('#4CAF50' if trade['realized_pl'] >= 0 else '#FF5252')
         )
         self.setItem(row, 4, realized)
+        
+        # 청산 위험 포지션은 행 전체 배경 강조
+        if at_risk:
+            for col in range(self.columnCount()):
+                self.item(row, col).setBackground(risk_bg)
 
 
     def apply_modern_style(self):
@@ -197,11 +177,5 @@ class TradeHistoryTable(QTableWidget):
         header.setDefaultAlignment(Qt.AlignCenter)
         header.setStretchLastSection(True)
         
-        # 세로 헤더(행 번호) 색상 적용
-        dark_bg = "#0F0326"  # 어두운 보라색 배경
-        soft_cyan = "#077A8F"  # 부드러운 청록색
-        vheader = self.verticalHeader()
-        vheader.setStyleSheet(f"background-color: {dark_bg}; color: {soft_cyan};")
-        
         # 빈 셀에도 배경색을 적용하기 위해 한 번 더 모든 셀 초기화
         self.initialize_empty_rows()
\ No newline at end of file
@@ -0,0 +1,197 @@
+from datetime import datetime, timedelta
+
+from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QTableView, QHeaderView, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor
+
+from engine.trade_tape import TradeTape, BUY
+from ui.theme import palette
+from utils.perf_monitor import perf_monitor
+
+# 한국 시간(KST) = UTC+9
+KST = timedelta(hours=9)
+EPOCH = datetime(1970, 1, 1)
+
+
+def format_time(timestamp_ms, with_ms=True):
+    """체결 시각(UTC ms) → 한국 시간 문자열"""
+    moment = EPOCH + timedelta(milliseconds=int(timestamp_ms)) + KST
+    if with_ms:
+        return moment.strftime('%H:%M:%S.') + f'{timestamp_ms % 1000:03d}'
+    return moment.strftime('%H:%M:%S')
+
+
+class TradeTapeModel(QAbstractTableModel):
+    """
+    TradeTape 를 그대로 보여주는 가상 테이블 모델
+
+    - 행 데이터를 미리 만들지 않고, 뷰가 요청한 행(화면에 보이는 행)만 링 버퍼에서 읽어 문자열로 변환
+    - 체결이 많으면(초당 aggregate_rate 건 이상) slice_ms 구간별 매수/매도 합계로 전환
+    """
+
+    RAW_HEADERS = ['시간', '가격', '수량']
+    AGGREGATE_HEADERS = ['시간', '평균가', '매수', '매도', '건수']
+
+    def __init__(self, tape, slice_ms=1000, aggregate_rate=20.0, parent=None):
+        super().__init__(parent)
+        self.tape = tape
+        self.slice_ms = slice_ms
+        self.aggregate_rate = aggregate_rate
+        self.aggregated = False
+        self.buckets = None  # 집계 모드일 때 TradeTape.aggregate() 결과
+        self.rows = 0
+
+        self.buy_color = None   # 매수 (네온: 형광 연두색)
+        self.sell_color = None  # 매도 (네온: 형광 빨간색)
+        self.apply_theme_colors()
+
+    def apply_theme_colors(self):
+        """테마 전환 - 매수/매도 글자 색을 지금 테마 색으로 (보이는 행은 바로 다시 그림)"""
+        colors = palette()
+        self.buy_color = QColor(colors['up'])
+        self.sell_color = QColor(colors['down'])
+        if self.rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rows - 1, self.columnCount() - 1),
+                                  [Qt.ForegroundRole])
+
+    def headers(self):
+        return self.AGGREGATE_HEADERS if self.aggregated else self.RAW_HEADERS
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers())
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers()[section]
+        return None
+
+    def refresh(self, added):
+        """
+        새 체결 added 건이 추가된 뒤 호출
+        일반 모드: 맨 위에 행 삽입 (버퍼가 가득 차면 맨 아래 행 제거)
+        집계 모드: 구간 재계산 후 모델 재설정
+        """
+        aggregated = self.tape.rate() >= self.aggregate_rate
+        if aggregated or aggregated != self.aggregated:
+            self.beginResetModel()
+            self.aggregated = aggregated
+            if aggregated:
+                self.buckets = self.tape.aggregate(self.slice_ms)
+                self.rows = len(self.buckets['timestamps'])
+            else:
+                self.buckets = None
+                self.rows = len(self.tape)
+            self.endResetModel()
+            return
+
+        added = min(added, len(self.tape))
+        if added <= 0:
+            return
+        removed = self.rows + added - len(self.tape)
+        if removed > 0:
+            self.beginRemoveRows(QModelIndex(), self.rows - removed, self.rows - 1)
+            self.rows -= removed
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), 0, added - 1)
+        self.rows += added
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter if column == 0 else Qt.AlignRight | Qt.AlignVCenter)
+
+        if self.aggregated:
+            buckets = self.buckets
+            if role == Qt.DisplayRole:
+                if column == 0:
+                    return format_time(int(buckets['timestamps'][row]), with_ms=False)
+                if column == 1:
+                    return f"{buckets['vwap'][row]:,.1f}"
+                if column == 2:
+                    return f"{buckets['buy'][row]:.4f}"
+                if column == 3:
+                    return f"{buckets['sell'][row]:.4f}"
+                return str(int(buckets['count'][row]))
+            if role == Qt.ForegroundRole:
+                if column == 2:
+                    return self.buy_color
+                if column == 3:
+                    return self.sell_color
+                if column == 1:
+                    return self.buy_color if buckets['buy'][row] >= buckets['sell'][row] else self.sell_color
+            return None
+
+        timestamp, price, size, side = self.tape.row(row)
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return format_time(timestamp)
+            if column == 1:
+                return f'{price:,.1f}'
+            return f'{size:.5f}'
+        if role == Qt.ForegroundRole and column > 0:
+            return self.buy_color if side == BUY else self.sell_color
+        return None
+
+
+class TradeTapeView(QWidget):
+    """체결 내역 (최근 체결 목록 + 체결 속도 표시)"""
+
+    def __init__(self, capacity=10000, parent=None):
+        super().__init__(parent)
+        self.tape = TradeTape(capacity)
+        self.model = TradeTapeModel(self.tape)
+
+        self.missed = 0  # 다시 받지 못한 체결 수
+        self.status_label = QLabel('체결 대기 중')
+        self.status_label.setObjectName("trade_tape_status")
+
+        self.table_view = QTableView()
+        self.table_view.setObjectName("trade_tape_table")
+        self.table_view.setModel(self.model)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table_view.setShowGrid(False)
+        self.table_view.setWordWrap(False)
+        self.table_view.verticalHeader().hide()
+        # 행 높이를 고정해서 뷰가 보이는 행만 계산하도록 함
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(18)
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.table_view)
+
+    def apply_theme_colors(self):
+        """테마 전환 - 매수/매도 색을 지금 테마 색으로"""
+        self.model.apply_theme_colors()
+
+    def add_trades(self, batch):
+        """
+        체결 묶음 추가
+        Args:
+            batch: {'timestamps', 'prices', 'sizes', 'sides'} numpy 배열
+        """
+        with perf_monitor.stage('trade_tape'):
+            added = self.tape.extend(batch['timestamps'], batch['prices'],
+                                     batch['sizes'], batch['sides'])
+            self.model.refresh(added)
+            mode = f'{self.model.slice_ms // 1000}초 집계' if self.model.aggregated else '개별 체결'
+            missed = f' · 누락 {self.missed:,}건' if self.missed else ''
+            self.status_label.setText(
+                f'체결 {self.tape.rate():.0f}건/초 · {mode} · 보관 {len(self.tape):,}/{self.tape.capacity:,}{missed}'
+            )
+
+    def note_gap(self, missed):
+        """다시 받지 못한 체결 수 누적 (체결 속도가 실제보다 낮게 보일 수 있음을 상태 줄에 표시)"""
+        self.missed += missed
+        self.status_label.setToolTip(f'거래소에서 다시 받지 못한 체결 {self.missed:,}건 (체결 속도가 실제보다 낮을 수 있음)')
@@ -5,10 +5,13 @@ from PyQt5.QtGui import QIcon
 import json
 import sys
 
+from ui.theme import apply_theme
+
 class ExchangeSelector(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle('거래소 선택창')
+        self.setObjectName("exchange_selector")  # 테마 스타일시트 선택자 (자식 위젯보다 먼저 지정)
         self.setFixedSize(350, 170)
         
         central_widget = QWidget()
@@ -62,56 +65,5 @@ class ExchangeSelector(QMainWindow):
             print("설정 저장 실패")
 
     def apply_styles(self):
-        self.setStyleSheet('''
-            QMainWindow {
-                background-color: #2a3447;
-            }
-            QLabel {
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                margin-bottom: 5px;
-            }
-            QComboBox {
-                background-color: #3d4760;
-                color: white;
-                padding: 8px;
-                padding-right: 25px;
-                border: 2px solid #4d5b7c;
-                border-radius: 5px;
-                font-size: 13px;
-                min-height: 20px;
-            }
-            QComboBox:hover {
-                background-color: #4d5b7c;
-                border: 2px solid #5d6b8c;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3d4760;
-                color: white;
-                selection-background-color: #4d5b7c;
-                selection-color: white;
-                border: none;
-                outline: none;
-                border-radius: 5px;
-                padding: 0px;
-                margin: 0px;
-                spacing: 2px;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 15px;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        ''')
\ No newline at end of file
+        # 스타일은 앱 전체 테마 스타일시트의 #exchange_selector 규칙 (main 에서 이미 적용했으면 건너뜀)
+        apply_theme(QApplication.instance())
\ No newline at end of file
@@ -0,0 +1,436 @@
+import os
+import time
+
+from PyQt5.QtGui import QFontDatabase
+
+from utils.perf_monitor import perf_monitor
+
+# 테마별 색상 정의 - 스타일시트와 차트 색은 모두 여기서 가져옴
+THEMES = {
+    # 몽환적인 네온 테마 (기본)
+    'neon': {
+        'window_bg': '#0F0326',        # 매우 어두운 보라색 배경
+        'window_bg_end': '#200A40',    # 창 배경 그라데이션 끝 색
+        'chart_bg': '#0F0326',
+        'surface': '#2a2f3a',          # 콤보박스/버튼 배경
+        'text': '#e6e9ef',
+        'table_text': '#E2E0FF',       # 밝은 라벤더 텍스트
+        'title': 'white',
+        'accent': '#0AFFE6',           # 형광 청록색
+        'accent_soft': '#077A8F',      # 부드러운 청록색
+        'border': '#FF10F0',           # 형광 핑크
+        'border_soft': '#AA0A80',      # 부드러운 핑크
+        'highlight': '#B026FF',        # 형광 보라색
+        'highlight_soft': '#5E1387',   # 부드러운 보라색
+        'alt_row': '#1A082E',          # 약간 밝은 보라색 배경
+        'selected_text': '#B3AD33',    # 부드러운 노랑색
+        'muted': '#8A84A3',            # 저장된(오래된) 값 표시
+        'up': '#39FF14',               # 형광 연두색
+        'down': '#FF2D2D',             # 형광 빨간색
+        'sma': '#FFFF33',              # SMA 선 (형광 노랑)
+        'hud_bg': 'rgba(15, 3, 38, 200)',
+    },
+    # 차분한 회청색 테마
+    'classic': {
+        'window_bg': '#1a1d2d',
+        'window_bg_end': '#2a3041',
+        'chart_bg': '#1a1d2d',
+        'surface': '#2a3447',
+        'text': '#e6e9ef',
+        'table_text': '#e6e9ef',
+        'title': 'white',
+        'accent': '#8fb8ff',
+        'accent_soft': '#6d7b9c',
+        'border': '#5d6b8c',
+        'border_soft': '#4d5b7c',
+        'highlight': '#5d6b8c',
+        'highlight_soft': '#3d4760',
+        'alt_row': '#232738',
+        'selected_text': 'white',
+        'muted': '#8a93a8',
+        'up': '#4CAF50',
+        'down': '#FF5252',
+        'sma': '#e0c35c',
+        'hud_bg': 'rgba(26, 29, 45, 220)',
+    },
+}
+DEFAULT_THEME = os.environ.get('TRADING_THEME', 'neon')
+
+# 거래소 선택 창은 테마와 상관없이 같은 색 사용
+SELECTOR_COLORS = {
+    'bg': '#2a3447',
+    'field': '#3d4760',
+    'field_hover': '#4d5b7c',
+    'border_hover': '#5d6b8c',
+    'button': '#4CAF50',
+    'button_hover': '#45a049',
+    'button_pressed': '#3d8b40',
+}
+
+FONT_PATH = os.path.join('assets', 'fonts', 'NanumSquareOTF_acR.otf')
+DEFAULT_FONT = 'NanumSquare'
+
+_font_family = None
+_compiled = {}        # (테마, 폰트) → 스타일시트 문자열
+current_theme = None  # 마지막으로 적용한 (테마, 폰트)
+
+
+def load_app_font():
+    """NanumSquareOTF_acR 폰트를 한 번만 등록하고 글꼴 이름 반환 (실패하면 기본 글꼴)"""
+    global _font_family
+    if _font_family is not None:
+        return _font_family
+    _font_family = DEFAULT_FONT
+    if os.path.exists(FONT_PATH):
+        font_id = QFontDatabase.addApplicationFont(FONT_PATH)
+        families = QFontDatabase.applicationFontFamilies(font_id) if font_id != -1 else []
+        if families:
+            print(f"✅ 로드된 폰트: {families[0]}")
+            _font_family = families[0]
+            return _font_family
+    print("⚠️ NanumSquareOTF_acR 폰트 로드 실패")
+    return _font_family
+
+
+def palette(name=None):
+    """테마 색상 (None 이면 지금 적용된 테마)"""
+    if name is None:
+        name = current_theme[0] if current_theme else DEFAULT_THEME
+    return THEMES[name]
+
+
+def build_stylesheet(colors, font_family):
+    """
+    색상 정의로 앱 전체 스타일시트 생성
+    위젯마다 따로 setStyleSheet 하지 않고 objectName 선택자로 모두 여기서 지정
+    """
+    c = colors
+    s = SELECTOR_COLORS
+    return f"""
+        QWidget {{
+            color: {c['text']};
+            font-family: '{font_family}';
+        }}
+        QMainWindow, QDialog {{
+            background-color: {c['window_bg']};
+        }}
+
+        /* ---------- 메인 창 ---------- */
+        QMainWindow#trading_view {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 {c['window_bg']}, stop:1 {c['window_bg_end']});
+        }}
+        #trading_view QLabel, #trading_view QPushButton {{
+            font-size: 13px;
+        }}
+        #trading_view QLabel#program_name, #trading_view QLabel#price_label {{
+            font-size: 16px;
+            font-weight: bold;
+            color: {c['title']};
+        }}
+        #trading_view QLabel#program_name {{
+            padding: 5px;
+        }}
+        #trading_view QLabel#price_label[stale="true"] {{
+            color: {c['muted']};
+        }}
+        #trading_view QLabel#price_label[flash="up"] {{
+            color: {c['up']};
+        }}
+        #trading_view QLabel#price_label[flash="down"] {{
+            color: {c['down']};
+        }}
+        #trading_view QLabel#poll_rate_label {{
+            color: {c['accent_soft']};
+            font-size: 11px;
+        }}
+        #trading_view QLabel#time_label {{
+            font-size: 14px;
+            padding: 5px;
+            border: 1px solid {c['border']};
+            border-radius: 5px;
+            background-color: {c['window_bg']};
+        }}
+        #trading_view QPushButton {{
+            background-color: {c['surface']};
+            color: white;
+            padding: 5px;
+        }}
+        #trading_view QComboBox {{
+            background-color: {c['surface']};
+            color: white;
+            border: 2px solid {c['highlight']};
+            border-radius: 5px;
+            padding: 5px;
+            min-width: 80px;
+            font-weight: bold;
+        }}
+        #trading_view QComboBox:hover {{
+            border: 2px solid {c['accent']};
+        }}
+        #trading_view QComboBox::drop-down {{
+            border: none;
+            background: {c['highlight']};
+            width: 20px;
+        }}
+        #trading_view QComboBox QAbstractItemView {{
+            background-color: {c['window_bg']};
+            color: {c['accent']};
+            border: 2px solid {c['highlight']};
+            selection-background-color: {c['highlight']};
+            selection-color: {c['accent']};
+        }}
+        #trading_view QHeaderView::section {{
+            font-size: 14px;
+            font-weight: bold;
+        }}
+        QWidget#right_empty_widget {{
+            background-color: {c['window_bg']};
+            border: 2px solid {c['border_soft']};
+            border-radius: 10px;
+        }}
+        QGraphicsView#price_chart, QGraphicsView#profit_chart {{
+            border: 2px solid {c['border_soft']};
+            border-radius: 10px;
+        }}
+        QLabel#depth_spread_label {{
+            color: {c['accent']};
+            font-size: 11px;
+            border: none;
+            padding: 2px 4px;
+        }}
+        QLabel#stale_label {{
+            background-color: {c['hud_bg']};
+            color: {c['muted']};
+            border: 1px dashed {c['border_soft']};
+            border-radius: 5px;
+            padding: 4px;
+            font-size: 11px;
+        }}
+        QLabel#perf_hud {{
+            background-color: {c['hud_bg']};
+            color: {c['accent']};
+            border: 1px solid {c['border_soft']};
+            border-radius: 5px;
+            padding: 4px;
+            font-family: monospace;
+            font-size: 11px;
+        }}
+
+        /* ---------- 체결 내역 ---------- */
+        QDockWidget#trade_tape_dock {{
+            color: {c['selected_text']};
+            font-weight: bold;
+        }}
+        QDockWidget#trade_tape_dock::title {{
+            background-color: {c['window_bg']};
+            padding: 4px;
+        }}
+        QLabel#trade_tape_status {{
+            color: {c['accent']};
+            font-size: 11px;
+            font-weight: normal;
+            padding: 2px 4px;
+        }}
+        QTableView#trade_tape_table {{
+            background-color: {c['window_bg']};
+            color: {c['text']};
+            border: none;
+            font-size: 11px;
+            font-weight: normal;
+        }}
+        QTableView#trade_tape_table QHeaderView::section {{
+            background-color: {c['window_bg']};
+            color: {c['accent_soft']};
+            border: none;
+            border-bottom: 1px solid {c['highlight_soft']};
+            padding: 2px;
+        }}
+
+        /* ---------- 거래 기록/수익률 표 ---------- */
+        QTableWidget {{
+            background-color: {c['window_bg']};
+            color: {c['table_text']};
+            gridline-color: {c['highlight_soft']};
+            font-size: 13px;
+            border: 2px solid {c['border_soft']};
+            border-radius: 8px;
+        }}
+        QTableWidget::item {{
+            border-bottom: 1px solid {c['highlight_soft']};
+            padding: 8px 12px;
+            background-color: {c['window_bg']};
+            font-weight: bold;
+        }}
+        QTableWidget::item:alternate {{
+            background-color: {c['alt_row']};
+        }}
+        QTableWidget::item:selected {{
+            background-color: {c['highlight_soft']};
+            color: {c['selected_text']};
+        }}
+        QTableWidget QHeaderView {{
+            background-color: {c['window_bg']};
+            color: {c['accent_soft']};
+        }}
+        QTableWidget QHeaderView::section {{
+            background-color: {c['window_bg']};
+            color: {c['accent_soft']};
+            padding: 8px;
+            border: none;
+            border-bottom: 1px solid {c['border_soft']};
+            text-align: center;
+            font-size: 14px;
+            font-weight: bold;
+        }}
+        QTableWidget QHeaderView::section:vertical {{
+            border-right: 1px solid {c['border_soft']};
+            border-bottom: 1px solid {c['border_soft']};
+        }}
+        QTableWidget QTableCornerButton::section {{
+            background-color: {c['window_bg']};
+            border: 1px solid {c['border_soft']};
+        }}
+        QTableWidget QScrollBar:vertical {{
+            background: {c['window_bg']};
+            width: 8px;
+            margin: 0px;
+            border-radius: 4px;
+        }}
+        QTableWidget QScrollBar::handle:vertical {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 {c['down']}, stop:0.5 {c['highlight_soft']}, stop:1 {c['up']});
+            min-height: 20px;
+            border-radius: 4px;
+        }}
+        QTableWidget QScrollBar::add-line:vertical, QTableWidget QScrollBar::sub-line:vertical {{
+            height: 0px;
+        }}
+
+        /* ---------- 멀티 차트 창 ---------- */
+        QWidget#chart_grid, #chart_grid QWidget {{
+            background-color: {c['window_bg']};
+        }}
+        #chart_grid QFrame#chart_panel {{
+            border: 1px solid {c['highlight_soft']};
+            border-radius: 4px;
+        }}
+        #chart_grid QLabel {{
+            color: {c['accent']};
+            font-size: 11px;
+            font-weight: bold;
+            padding: 2px;
+        }}
+
+        /* ---------- 파라미터 스윕 창 ---------- */
+        QWidget#sweep_window, #sweep_window QWidget {{
+            background-color: {c['window_bg']};
+        }}
+        #sweep_window QLabel#sweep_status {{
+            color: {c['accent']};
+            font-size: 11px;
+            font-weight: bold;
+            padding: 2px;
+        }}
+        #sweep_window QTableWidget {{
+            color: {c['text']};
+            gridline-color: {c['border_soft']};
+        }}
+
+        /* ---------- 거래소 선택 창 ---------- */
+        QMainWindow#exchange_selector {{
+            background-color: {s['bg']};
+        }}
+        #exchange_selector QLabel {{
+            color: white;
+            font-size: 14px;
+            font-weight: bold;
+            margin-bottom: 5px;
+        }}
+        #exchange_selector QComboBox {{
+            background-color: {s['field']};
+            color: white;
+            padding: 8px;
+            padding-right: 25px;
+            border: 2px solid {s['field_hover']};
+            border-radius: 5px;
+            font-size: 13px;
+            min-height: 20px;
+        }}
+        #exchange_selector QComboBox:hover {{
+            background-color: {s['field_hover']};
+            border: 2px solid {s['border_hover']};
+        }}
+        #exchange_selector QComboBox QAbstractItemView {{
+            background-color: {s['field']};
+            color: white;
+            selection-background-color: {s['field_hover']};
+            selection-color: white;
+            border: none;
+            outline: none;
+            border-radius: 5px;
+            padding: 0px;
+            margin: 0px;
+            spacing: 2px;
+        }}
+        #exchange_selector QPushButton {{
+            background-color: {s['button']};
+            color: white;
+            padding: 8px 15px;
+            border: none;
+            border-radius: 5px;
+            font-size: 14px;
+            font-weight: bold;
+            min-height: 20px;
+        }}
+        #exchange_selector QPushButton:hover {{
+            background-color: {s['button_hover']};
+        }}
+        #exchange_selector QPushButton:pressed {{
+            background-color: {s['button_pressed']};
+        }}
+    """
+
+
+def compile_theme(name, font_family):
+    """(테마, 폰트) 별 스타일시트를 한 번만 만들어 보관"""
+    key = (name, font_family)
+    stylesheet = _compiled.get(key)
+    if stylesheet is None:
+        with perf_monitor.stage('theme_compile'):
+            stylesheet = build_stylesheet(THEMES[name], font_family)
+        _compiled[key] = stylesheet
+    return stylesheet
+
+
+def apply_theme(app, name=None, font_family=None):
+    """
+    앱 전체에 테마 적용 - app.setStyleSheet 한 번으로 모든 창을 한 번만 다시 polish
+    같은 테마와 폰트가 이미 적용되어 있으면 아무것도 하지 않음
+    Returns:
+        적용에 걸린 시간 (ms), 건너뛰었으면 0
+    """
+    global current_theme
+    name = name or (current_theme[0] if current_theme else DEFAULT_THEME)
+    if name not in THEMES:
+        print(f"알 수 없는 테마: {name}")
+        name = 'neon'
+    font_family = font_family or load_app_font()
+    if current_theme == (name, font_family):
+        return 0.0
+
+    started = time.perf_counter()
+    stylesheet = compile_theme(name, font_family)
+    with perf_monitor.stage('theme_apply'):
+        app.setStyleSheet(stylesheet)
+    current_theme = (name, font_family)
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"테마 적용: {name} ({elapsed:.1f}ms)")
+    return elapsed
+
+
+def next_theme():
+    """테마 순환 (F6)"""
+    names = list(THEMES)
+    current = current_theme[0] if current_theme else DEFAULT_THEME
+    return names[(names.index(current) + 1) % len(names)]
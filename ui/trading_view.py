@@ -1,71 +1,180 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-    QTableWidgetItem, QLabel, QComboBox, QHeaderView, QSizePolicy, QSplitter, QGraphicsDropShadowEffect
+    QTableWidgetItem, QLabel, QComboBox, QHeaderView, QSizePolicy, QSplitter, QGraphicsDropShadowEffect,
+    QShortcut, QPushButton, QDockWidget, QApplication
 )
-from PyQt5.QtCore import Qt, QTimer, QEvent  
-from PyQt5.QtGui import QColor, QFontDatabase, QFont
+from PyQt5.QtCore import Qt, QTimer, QEvent, QThread, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QKeySequence
 import pyqtgraph as pg
 import numpy as np
 import datetime
 from dateutil.relativedelta import relativedelta
 import os
+import time
 from datetime import datetime, timedelta
 
 # 차트 관련 클래스들 임포트
 from chart.candlestick import CandlestickItem
-from chart.candlestick import apply_matching_neon_style
+from chart.candlestick import apply_matching_neon_style, tint_chart
 from chart.trade_marker import TradeMarker
-from data.data_fetcher import DataFetcher
+from chart.indicator_overlay import IndicatorOverlay
+from chart.volume_item import VolumeItem
+from chart.time_axis import kst_time_ticks, tick_step_for
+from chart.depth_chart import DepthChart
+from chart.crosshair import Crosshair
+from data.market_recorder import create_data_fetcher, history_dir_for, ReplayDataFetcher
+from data.candle_store import CandleStore
+from data.fetch_scheduler import FetchScheduler
+from data.adaptive_poller import AdaptivePoller
+from data.session_snapshot import SNAPSHOT_PATH, save_snapshot, load_snapshot
+from data.order_book_feed import OrderBookThread, RestDepthFeed, create_depth_feed
+from data.ingest_process import create_ingest_process
+from data.exporter import ExportThread, candle_source, equity_source, fill_source
+from data.trade_feed import RestTradeFeed, TradeFeedThread, create_trade_feed
 from utils.naver_time import NaverTimeFetcher
 from chart.profit_rate_chart import TotalProfitChart
 from ui.components.trade_history_table import TradeHistoryTable
 from ui.components.profit_rate_table import ProfitRateTable
+from ui.components.perf_hud import PerfHud
+from ui.components.chart_grid import ChartGrid
+from ui.components.trade_tape_view import TradeTapeView
+from ui.components.sweep_window import SweepWindow
+from utils.perf_monitor import perf_monitor
+from engine.returns_engine import ReturnsEngine
+from engine.position_engine import PositionEngine
+from engine.margin_engine import MarginEngine
+from engine.indicator_engine import IndicatorEngine
+from engine.bar_aggregator import BarAggregator, resample_ohlcv, timeframe_to_ms
+from engine.candle_buffer import load_spilled, spill_path_for
+from engine.backtester import STRATEGIES, run_backtest
 from ui.styles import apply_soft_neon_style  # 공통 스타일 함수 임포트
+from ui.theme import apply_theme, load_app_font, next_theme, palette
 
-# 글로벌 변수로 app_font_name 선언
-app_font_name = "NanumSquare"  # 기본값
+# NanumSquareOTF_acR 폰트 로드 (테마 스타일시트와 차트 축 글꼴에 사용)
+app_font_name = load_app_font()
 
-def load_nanum_font():
-    """NanumSquareOTF_acR 폰트를 로드하고 기본 폰트로 설정"""
-    global app_font_name  # 글로벌 변수 사용
-    
-    font_dir = os.path.join("assets", "fonts")  # 폰트가 저장된 폴더 위치
-    font_path = os.path.join(font_dir, "NanumSquareOTF_acR.otf")  # 사용할 폰트
-    
-    if os.path.exists(font_path):
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id != -1:
-            font_families = QFontDatabase.applicationFontFamilies(font_id)
-            if font_families:
-                print(f"✅ 로드된 폰트: {font_families[0]}")
-                app_font_name = font_families[0]  # 글로벌 변수 업데이트
-                return app_font_name
-    
-    print("⚠️ NanumSquareOTF_acR 폰트 로드 실패")
-    return app_font_name  # 기본 폰트 (예비용)
+# 단계별 지연 시간 Prometheus 텍스트 파일 경로
+METRICS_PATH = os.path.join("metrics", "trading_ui.prom")
+
+# 메인 차트 봉 간격 (초 단위 봉은 체결로 직접 만듦)
+TIMEFRAMES = ['1s', '5s', '15s', '1m', '5m', '15m']
+# 거래소 klines 로 직접 만든 봉을 보정하는 주기 (초)
+RECONCILE_INTERVAL = 30
+# 메인 차트에 그릴 봉 개수
+CHART_BARS = 300
+# 보관 개수를 넘긴 봉을 내보낼 폴더
+HISTORY_DIR = os.environ.get('TRADING_HISTORY_DIR', 'history')
+
+# 네이버 서버 시간을 다시 맞추는 주기 (ms), 그 사이에는 로컬 시계로 흐른 시간만 더함
+TIME_SYNC_INTERVAL = 60000
+# 화면에 표시할 폴링 채널 이름
+POLL_LABELS = {'price': '시세', 'klines': '봉', 'trades': '체결', 'depth': '호가', 'clock': '시계'}
+
+# 백테스트 시작 자산
+BACKTEST_BALANCE = 10000.0
+# 백테스트에 쓰는 최대 봉 개수 (저장된 봉이 더 많으면 최근 봉만, 1s 봉 몇 년치를 한꺼번에 올리지 않도록)
+BACKTEST_MAX_BARS = int(os.environ.get('TRADING_BACKTEST_MAX_BARS', 2_000_000))
+
+# 멀티 차트 창에 기본으로 띄울 (심볼, 봉 간격)
+GRID_CHARTS = [
+    ('BTC/USDT', '1m'), ('ETH/USDT', '1m'), ('SOL/USDT', '1m'), ('XRP/USDT', '1m'),
+    ('BTC/USDT', '15m'), ('ETH/USDT', '15m'), ('BTC/USDT', '1h'), ('ETH/USDT', '1h'),
+]
+
+class BacktestThread(QThread):
+    """디스크로 내보낸 봉을 읽고 전략 하나를 백테스트하는 작업 스레드 (UI 스레드를 막지 않음)"""
+
+    backtest_finished = pyqtSignal(object, object, int, float)  # BacktestResult, ReturnsEngine, 봉 개수, 걸린 시간 (ms)
+    backtest_failed = pyqtSignal(str)
+
+    def __init__(self, strategy, spill_path, live, max_bars=BACKTEST_MAX_BARS, parent=None):
+        super().__init__(parent)
+        self.strategy = strategy
+        self.spill_path = spill_path
+        self.live = live
+        self.max_bars = max_bars
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            history = load_spilled(self.spill_path, self.max_bars)
+        except (OSError, ValueError) as e:
+            print(f"백테스트 봉 읽기 실패: {e}")
+            self.backtest_failed.emit(str(e))
+            return
+        live = self.live
+        if len(history):
+            live = live[live[:, 0] > history[-1, 0]]
+        bars = np.concatenate((history, live))[-self.max_bars:]
+        if len(bars) < 2:
+            self.backtest_failed.emit('백테스트할 봉이 없음')
+            return
+        with perf_monitor.stage('backtest'):
+            timestamps, open_, high, low, close = (bars[:, i] for i in range(5))
+            signal = STRATEGIES[self.strategy](open_, high, low, close)
+            result = run_backtest(timestamps, open_, high, low, close, signal, initial_balance=BACKTEST_BALANCE)
+            returns = ReturnsEngine(capacity=len(result.equity))
+            returns.load_history(result.mark_times, result.equity)
+        self.backtest_finished.emit(result, returns, len(bars), (time.perf_counter() - started) * 1000)
 
-# QApplication 실행 전에 폰트 로드
-app_font_name = load_nanum_font()
 
 class TradingView(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle('Trading Platform')
+        self.setObjectName("trading_view")  # 테마 스타일시트 선택자
         self.total_profit_rate = 0.0
         
         # 컴포넌트 초기화
         self.profit_chart = TotalProfitChart()
-        self.data_fetcher = DataFetcher()
-        self.trades = []
+        self.data_fetcher = create_data_fetcher()  # 환경 변수로 실시간/기록/재생 선택
+        # 내보낸 봉 폴더 (가짜 거래소/재생 봉은 실제 거래소 봉과 다른 하위 폴더)
+        self.history_dir = history_dir_for(HISTORY_DIR, self.data_fetcher)
+        self.returns_engine = ReturnsEngine()
+        self.position_engine = PositionEngine()
+        self.margin_engine = MarginEngine()
+        self.indicator_engine = IndicatorEngine()
+        self.trades = self.position_engine.fills  # 체결 기록 (포지션 엔진과 공유)
+
+        # 멀티 차트가 공유하는 캔들 저장소와 가져오기 스케줄러
+        self.candle_store = CandleStore()
+        self.fetch_scheduler = FetchScheduler(self.data_fetcher, self.candle_store, parent=self)
+        self.chart_grid = None
         self.open_positions = {}
+
+        # 폴링 주기 - 변동성/창 표시 여부/요청 가중치 여유에 따라 조절
+        self.poller = AdaptivePoller(self.data_fetcher, parent=self)
+        self.time_synced = None  # (마지막으로 받은 네이버 시간, 그때의 monotonic 시각)
+
+        # 지난 세션 스냅샷 - 있으면 네트워크 응답 전에 바로 그리고 백그라운드로 보정
+        # 재생 모드는 기록 파일의 (지난) 시세라 실시간 세션 스냅샷을 읽지도 덮어쓰지도 않음
+        self.persist_session = not isinstance(self.data_fetcher, ReplayDataFetcher)
+        self.snapshot = load_snapshot(SNAPSHOT_PATH) if self.persist_session else None
+        self.stale_label = None
+        self.last_price = None
+
+        # 메인 차트 봉 - 실시간 모드에서는 체결로 직접 만들고 klines 로 주기적으로 보정
+        # 재생 모드나 TRADING_CANDLES=poll 이면 예전처럼 매초 OHLCV 를 다시 가져옴
+        self.timeframe = '1m'
+        if self.snapshot is not None and self.snapshot.get('timeframe') in TIMEFRAMES:
+            self.timeframe = self.snapshot['timeframe']
+        # TRADING_INGEST=process 이면 현재가/봉/호가를 별도 프로세스가 가져와 공유 메모리로 전달
+        self.ingest = create_ingest_process(self.data_fetcher, 'BTC/USDT', self.timeframe, CHART_BARS)
+        self.stream_candles = (os.environ.get('TRADING_CANDLES', 'stream') == 'stream'
+                               and not isinstance(self.data_fetcher, ReplayDataFetcher)
+                               and self.ingest is None)
+        self.bar_aggregator = BarAggregator(self.timeframe, spill_dir=self.history_dir)
+        self.reconcile_key = None    # 보정용으로 구독 중인 (심볼, klines 간격)
+        self.reconcile_limit = None
+        self.candles_seeded = False  # 첫 보정 전에는 과거 봉이 없으므로 그리지 않음
+        self.rendered_version = -1
         
         # UI 초기화 및 설정
         self.initialize_ui()
     
     def initialize_ui(self):
         """UI 초기화 및 설정을 위한 통합 메서드"""
-        # 기본 설정
-        self.load_fonts()
+        # 기본 설정 (앱 글꼴은 모듈을 불러올 때 load_app_font 로 한 번만 등록됨)
         self.setGeometry(200, 200, 1280, 720)
         
         # UI 기본 요소 설정
@@ -77,35 +186,15 @@ class TradingView(QMainWindow):
         # 스타일 및 시각적 효과 적용 - 그래픽 효과 중복 방지를 위해 순서 중요
         self.apply_styles()  
         
-        # 타이머 설정 및 초기 데이터 로드
+        # 지난 세션 화면을 바로 그림 (네트워크를 기다리지 않음), 첫 데이터는 백그라운드로 요청
+        self.restore_snapshot()
         self.setup_timers()
-        self.update_data()
+        if not self.stream_candles and self.ingest is None:
+            self.fetch_scheduler.fetch_once('BTC/USDT', self.timeframe, limit=CHART_BARS)
         
         # modern UI 효과는 가장 마지막에 적용 (다른 스타일 설정 후)
         self.apply_modern_ui()
     
-    def load_fonts(self):
-        """모든 필요한 폰트를 로드하는 메서드"""
-        # 나눔 폰트는 이미 글로벌로 로드되었으므로 추가 폰트만 로드
-        self.load_additional_fonts()
-    
-    def load_additional_fonts(self):
-        """추가 커스텀 폰트 로드"""
-        fonts_dir = os.path.join('assets', 'fonts')
-        font_families = []
-        
-        # 폰트 파일들을 QFontDatabase에 등록
-        if os.path.exists(fonts_dir):
-            for font_file in os.listdir(fonts_dir):
-                if font_file.endswith('.ttf') or font_file.endswith('.otf'):
-                    font_path = os.path.join(fonts_dir, font_file)
-                    if os.path.exists(font_path):
-                        font_id = QFontDatabase.addApplicationFont(font_path)
-                        if font_id != -1:
-                            font_families.extend(QFontDatabase.applicationFontFamilies(font_id))
-        
-        return font_families
-    
     def setup_ui(self):
         """UI 레이아웃 및 컴포넌트 설정"""
         # 메인 윈도우 설정
@@ -138,16 +227,19 @@ class TradingView(QMainWindow):
         
         # 오른쪽 영역 구성
         self.setup_right_area(right_layout)
+
+        # 체결 내역 (도킹 창, 기본 숨김)
+        self.setup_trade_tape()
         
-        # 테스트 데이터 로드
-        self.load_test_data()
+        # 테스트 데이터 로드 (스냅샷이 있으면 restore_snapshot 에서 지난 세션 값으로 채움)
+        if self.snapshot is None:
+            self.load_test_data()
     
     def setup_header(self, parent_layout):
         """헤더 영역 설정 (프로그램 이름)"""
         program_name_layout = QHBoxLayout()
         self.program_name = QLabel('Program Name')
         self.program_name.setObjectName("program_name")
-        self.program_name.setStyleSheet('font-size: 16px; font-weight: bold; color: white;')
         program_name_layout.addWidget(self.program_name)
         parent_layout.addLayout(program_name_layout)
     
@@ -172,28 +264,89 @@ class TradingView(QMainWindow):
         # 현재가 표시 라벨
         self.price_label = QLabel()
         self.price_label.setObjectName("price_label")  # 객체 이름 설정
-        self.price_label.setStyleSheet('font-size: 16px; font-weight: bold; color: white;')
 
         # 차트 타입 선택 콤보박스 (캔들/라인)
         self.chart_type = QComboBox()
         self.chart_type.addItems(['Candle', 'Line'])
-        self.chart_type.setStyleSheet('background-color: #2a2f3a; color: white; padding: 5px;')
         self.chart_type.currentTextChanged.connect(self.update_chart)
         self.chart_type.setMaximumWidth(80)  # 콤보박스 너비 제한
 
+        # 보조 지표 선택 콤보박스 (RSI/MACD)
+        self.indicator_type = QComboBox()
+        self.indicator_type.addItems(['RSI', 'MACD'])
+        self.indicator_type.currentTextChanged.connect(self.update_indicator_type)
+        self.indicator_type.setMaximumWidth(80)
+
+        # 봉 간격 선택 콤보박스
+        self.timeframe_combo = QComboBox()
+        self.timeframe_combo.addItems(TIMEFRAMES)
+        self.timeframe_combo.setCurrentText(self.timeframe)
+        self.timeframe_combo.currentTextChanged.connect(self.set_timeframe)
+        self.timeframe_combo.setMaximumWidth(70)
+
+        # 백테스트 전략 선택 콤보박스 ('Live' = 실시간 수익률, 전략을 고르면 저장된 봉으로 백테스트)
+        self.backtest_type = QComboBox()
+        self.backtest_type.addItems(['Live'] + list(STRATEGIES))
+        self.backtest_type.currentTextChanged.connect(self.run_strategy)
+        self.backtest_type.setMaximumWidth(130)
+        self.backtest_result = None
+        self.backtest_returns = None
+        self.marker_key = None
+
+        # 멀티 차트 창 열기 버튼 (F4)
+        self.grid_button = QPushButton('Grid')
+        self.grid_button.setMaximumWidth(60)
+        self.grid_button.clicked.connect(self.open_chart_grid)
+        self.grid_shortcut = QShortcut(QKeySequence('F4'), self)
+        self.grid_shortcut.activated.connect(self.open_chart_grid)
+
+        # 체결 내역 표시/숨김 버튼 (F5)
+        self.tape_button = QPushButton('Tape')
+        self.tape_button.setMaximumWidth(60)
+        self.tape_button.clicked.connect(self.toggle_trade_tape)
+        self.tape_shortcut = QShortcut(QKeySequence('F5'), self)
+        self.tape_shortcut.activated.connect(self.toggle_trade_tape)
+
+        # 봉/체결/자산 이력 내보내기 (F7, 진행 중에 누르면 취소)
+        self.export_button = QPushButton('Export')
+        self.export_button.setMaximumWidth(60)
+        self.export_button.clicked.connect(self.export_data)
+        self.export_shortcut = QShortcut(QKeySequence('F7'), self)
+        self.export_shortcut.activated.connect(self.export_data)
+        self.export_thread = None
+        self.backtest_thread = None
+
+        # 전략 파라미터 스윕 창 열기 (F8)
+        self.sweep_button = QPushButton('Sweep')
+        self.sweep_button.setMaximumWidth(60)
+        self.sweep_button.clicked.connect(self.open_sweep_window)
+        self.sweep_shortcut = QShortcut(QKeySequence('F8'), self)
+        self.sweep_shortcut.activated.connect(self.open_sweep_window)
+        self.sweep_window = None
+
+        # 테마 전환 (F6)
+        self.theme_shortcut = QShortcut(QKeySequence('F6'), self)
+        self.theme_shortcut.activated.connect(self.switch_theme)
+
+        # 현재 폴링 주기 표시 라벨 (자세한 계수는 툴팁)
+        self.poll_label = QLabel()
+        self.poll_label.setObjectName("poll_rate_label")
+
         # 네이버 시간 표시 라벨
         self.time_label = QLabel()
         self.time_label.setObjectName("time_label")  # CSS 스타일 적용을 위한 객체 이름 설정
-        self.time_label.setStyleSheet(f'''
-            color: #e6e9ef;
-            font-family: '{app_font_name}';
-            font-size: 14px;
-            padding: 5px;
-        ''')
 
         left_top_info.addWidget(self.price_label)
         left_top_info.addWidget(self.chart_type)
+        left_top_info.addWidget(self.indicator_type)
+        left_top_info.addWidget(self.timeframe_combo)
+        left_top_info.addWidget(self.backtest_type)
+        left_top_info.addWidget(self.grid_button)
+        left_top_info.addWidget(self.tape_button)
+        left_top_info.addWidget(self.export_button)
+        left_top_info.addWidget(self.sweep_button)
         left_top_info.addStretch()  # 왼쪽 요소들과 시간 사이 공간
+        left_top_info.addWidget(self.poll_label)
         left_top_info.addWidget(self.time_label)
         parent_layout.addLayout(left_top_info)
     
@@ -201,6 +354,7 @@ class TradingView(QMainWindow):
         """차트 설정"""
         # 차트 위젯 생성
         self.left_chart_widget = pg.PlotWidget()
+        self.left_chart_widget.setObjectName("price_chart")
         self.left_chart_widget.setBackground('black')
         self.left_chart_widget.showGrid(x=True, y=True)
         self.left_chart_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -209,40 +363,96 @@ class TradingView(QMainWindow):
         self.candlestick_item = CandlestickItem()
         self.left_chart_widget.addItem(self.candlestick_item)
 
-        # 라인 차트 초기화
-        self.line_plot = None
+        # 라인 차트 - 보이는 구간만 그리고(clipToView), 점이 많으면 피크 보존 다운샘플링
+        self.line_plot = self.left_chart_widget.plot(
+            pen='w', clipToView=True, autoDownsample=True,
+            downsampleMethod='peak', skipFiniteCheck=True
+        )
+        self.line_plot.hide()
+
+        # 최신 캔들 데이터와 시리즈별 갱신 필요 여부 (보이는 시리즈만 계산)
+        self.latest_candle_data = None
+        self.latest_bars = None  # (시각, 시가, 고가, 저가, 종가, 거래량) - 세션 스냅샷 저장용
+        self.series_dirty = {'Candle': False, 'Line': False}
         
         # 매매 표시 마커
         self.trade_markers = TradeMarker()
         self.left_chart_widget.addItem(self.trade_markers)
 
+        # 거래량 차트 - 가격 차트와 X축 공유
+        self.volume_chart_widget = pg.PlotWidget()
+        self.volume_chart_widget.setBackground('black')
+        self.volume_chart_widget.showGrid(x=True, y=False)
+        self.volume_chart_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.volume_chart_widget.setMaximumHeight(80)
+        self.volume_chart_widget.hideButtons()
+        self.volume_chart_widget.setMouseEnabled(x=True, y=False)
+        self.volume_chart_widget.getAxis('bottom').setStyle(showValues=False)
+        self.volume_chart_widget.setXLink(self.left_chart_widget)
+
+        self.volume_item = VolumeItem()
+        self.volume_chart_widget.addItem(self.volume_item)
+
+        # 보조 지표(RSI/MACD) 차트 - 가격 차트와 X축 공유
+        self.indicator_chart_widget = pg.PlotWidget()
+        self.indicator_chart_widget.setBackground('black')
+        self.indicator_chart_widget.showGrid(x=True, y=True)
+        self.indicator_chart_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.indicator_chart_widget.setMaximumHeight(120)
+        self.indicator_chart_widget.hideButtons()
+        self.indicator_chart_widget.setXLink(self.left_chart_widget)
+
+        # 보조 지표 오버레이
+        self.indicator_overlay = IndicatorOverlay(self.left_chart_widget, self.indicator_chart_widget)
+
+        # 십자선 - 커서 아래 봉의 OHLCV/지표 값 표시 (거래량/보조 차트에는 세로선만)
+        self.crosshair = Crosshair(
+            self.left_chart_widget, linked_charts=(self.volume_chart_widget, self.indicator_chart_widget)
+        )
+
+        # 단계별 지연 시간 오버레이 (F3 으로 표시/숨김)
+        self.perf_hud = PerfHud(self.left_chart_widget, memory_usage=self.memory_usage)
+        self.perf_hud_shortcut = QShortcut(QKeySequence('F3'), self)
+        self.perf_hud_shortcut.activated.connect(self.perf_hud.toggle)
+
         # 레이아웃에 차트 추가
         parent_layout.addWidget(self.left_chart_widget)
+        parent_layout.addWidget(self.volume_chart_widget)
+        parent_layout.addWidget(self.indicator_chart_widget)
     
+    def setup_trade_tape(self):
+        """체결 내역 도킹 창 설정"""
+        self.trade_tape = TradeTapeView()
+        self.trade_tape_dock = QDockWidget('체결 내역', self)
+        self.trade_tape_dock.setObjectName("trade_tape_dock")
+        self.trade_tape_dock.setWidget(self.trade_tape)
+        self.trade_tape_dock.setMinimumWidth(260)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.trade_tape_dock)
+        self.trade_tape_dock.hide()
+
+    def toggle_trade_tape(self):
+        """체결 내역 표시/숨김 전환"""
+        self.trade_tape_dock.setVisible(not self.trade_tape_dock.isVisible())
+
     def setup_right_area(self, parent_layout):
         """오른쪽 영역 설정 (위젯, 차트, 수익률 표)"""
-        # 1. 오른쪽 상단 빈 공간
+        # 1. 오른쪽 상단 호가 깊이 차트
         right_empty_widget = QWidget()
         right_empty_widget.setObjectName("right_empty_widget")
+        right_empty_widget.setAttribute(Qt.WA_StyledBackground)
         right_empty_widget.setMinimumWidth(300)
         right_empty_widget.setMaximumSize(300, 150)
+        # 배경/테두리는 테마 스타일시트의 QWidget#right_empty_widget 규칙 (안쪽 차트에는 상속되지 않음)
 
-        # 소프트한 네온 색상 정의
-        dark_bg = "#0F0326"     # 매우 어두운 보라색 배경
-        soft_pink = "#AA0A80"   # 부드러운 핑크 테두리
-        soft_purple = "#5E1387" # 부드러운 보라색
-
-        # 스타일시트 적용
-        right_empty_widget.setStyleSheet(f'''
-            background-color: {dark_bg};
-            border: 2px solid {soft_pink};
-            border-radius: 10px;
-        ''')
+        self.depth_chart = DepthChart()
+        depth_layout = QVBoxLayout(right_empty_widget)
+        depth_layout.setContentsMargins(3, 3, 3, 3)
+        depth_layout.addWidget(self.depth_chart)
 
         # 부드러운 네온 효과 추가
         glow = QGraphicsDropShadowEffect()
         glow.setBlurRadius(15)  # 부드러운 블러
-        glow.setColor(QColor(soft_purple))
+        glow.setColor(QColor(palette()['highlight_soft']))
         glow.setOffset(0, 0)
         right_empty_widget.setGraphicsEffect(glow)
 
@@ -260,43 +470,56 @@ class TradingView(QMainWindow):
     
     def load_test_data(self):
         """테스트용 데이터 로드"""
-        # 거래 기록 테스트 데이터
-        test_trades = [
-            {
-                "coin": "BTC",
-                "quantity": 0.1234,
-                "liq_price": 50000.0,
-                "unrealized_pl": 5.2,
-                "realized_pl": 100.5
-            }
-        ]
-        self.left_table.update_trade_history(test_trades)
-        
-        # 수익률 표 테스트용 데이터
-        test_profit_data = {
-            'my_rate': -5.2,
-            'daily': 1.5,
-            'weekly': 4.2,
-            'monthly': 15.7,
-            'yearly': 45.2,
-            'total': -25.5
-        }
-        self.right_table.update_profit_rates(test_profit_data)
-        
-        # 수익률 차트 테스트 데이터
-        # 기존 데이터 초기화 (중복 방지)
-        self.profit_chart.daily_total_profits = []
-        
-        # 테스트 데이터 생성
-        base_date = datetime.now()
-        dates = [(base_date - timedelta(days=i)).strftime('%m/%d') for i in range(6, -1, -1)]
-        test_data = [1,-6.4]
-        
-        for date, profit in zip(dates, test_data):
-            self.profit_chart.daily_total_profits.append((date, profit))
-        
-        # 차트 업데이트
-        self.profit_chart.update_display()
+        # 수익률 테스트 데이터 - 1시간 간격 자산 이력을 생성하여 수익률 엔진에 로드
+        now_ms = int(datetime.now().timestamp() * 1000)
+        hour_ms = 60 * 60 * 1000
+        timestamps = now_ms - np.arange(400 * 24, 0, -1) * hour_ms
+        rng = np.random.default_rng(7)
+        equity = 10000.0 * np.cumprod(1.0 + rng.normal(0.00005, 0.004, len(timestamps)))
+        self.returns_engine.load_history(timestamps, equity)
+
+        # 거래 기록 테스트 데이터 - 테스트 체결을 포지션 엔진에 반영
+        self.position_engine.initial_balance = self.returns_engine.last_equity()
+        self.position_engine.set_leverage("BTC", 10)
+        self.apply_fill("BTC", 0.1234, 60000.0, fee=2.96)
+
+    def apply_fill(self, symbol, quantity, price, fee=0.0):
+        """
+        체결 한 건을 포지션/수익률 엔진에 반영하고 화면 갱신
+        Args:
+            symbol: 코인명 (예: "BTC")
+            quantity: 체결 수량 (매수 +, 매도 -)
+            price: 체결 가격
+            fee: 수수료
+        """
+        now_ms = int(datetime.now().timestamp() * 1000)
+        self.position_engine.apply_fill(symbol, quantity, price, fee=fee, timestamp=now_ms)
+        self.returns_engine.add_mark(now_ms, self.position_engine.equity())
+        self.refresh_positions()
+        self.refresh_profit_views()
+
+    def refresh_positions(self):
+        """포지션 엔진 결과를 거래 기록 테이블에 반영 (청산가/증거금 비율 재계산 포함)"""
+        with perf_monitor.stage('positions'):
+            self.margin_engine.update(self.position_engine)
+            self.open_positions = self.margin_engine.annotate_positions(
+                self.position_engine.open_positions(), self.position_engine.slot_index
+            )
+        with perf_monitor.stage('trade_table'):
+            self.left_table.update_trade_history(list(self.open_positions.values()))
+
+    def refresh_profit_views(self):
+        """수익률 엔진 결과를 수익률 표와 수익률 차트에 반영 (백테스트 중이면 백테스트 결과)"""
+        returns_engine = self.backtest_returns if self.backtest_returns is not None else self.returns_engine
+        profit_rates = returns_engine.get_profit_rates()
+        self.total_profit_rate = profit_rates['total']
+        profit_rates['my_rate'] = self.total_profit_rate
+        with perf_monitor.stage('profit_table'):
+            self.right_table.update_profit_rates(profit_rates)
+
+        # 오늘 값만 바뀌면 마지막 점만 고치고, 새 날이 추가될 때만 차트 전체를 다시 그림
+        with perf_monitor.stage('profit_chart'):
+            self.profit_chart.set_profits(returns_engine.daily_total_profits())
     
     def setup_focus_policy(self):
         """테이블 포커스 정책 설정"""
@@ -345,93 +568,615 @@ class TradingView(QMainWindow):
     
     def setup_timers(self):
         """모든 타이머 설정"""
-        # 차트 데이터 업데이트 (1분)
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_data)
-        self.update_timer.start(1000)  # 1초마다 업데이트 (테스트 용도)
+        # 실시간 모드: 현재가 평가만, 차트는 체결이 들어올 때 갱신
+        # 재생/폴링 모드: 현재가와 OHLCV 를 다시 가져옴 (거래소 요청 가중치 사용)
+        # 주기는 1초 기준으로 가격이 크게 움직이면 0.5초까지 빨라지고, 멈춰 있거나 창이 안 보이면 느려짐
+        # 수집 프로세스 모드: 수집 프로세스가 가져오고 UI 는 알림이 올 때 공유 메모리에서 읽기만 함
+        if self.ingest is not None:
+            self.update_timer = None
+        elif self.stream_candles:
+            self.update_timer = self.poller.add('price', 1000, 500, 5000, callback=self.mark_last_trade,
+                                                volatility=True)
+            self.subscribe_reconcile()
+        else:
+            self.update_timer = self.poller.add('price', 1000, 500, 10000, callback=self.update_data,
+                                                volatility=True, uses_weight=True)
+        self.fetch_scheduler.updated.connect(self.on_klines_fetched)
+        # 멀티 차트/보정용 klines 요청 - 요청 가중치 여유만 반영 (멀티 차트 창은 따로 보일 수 있음)
+        self.poller.add('klines', 1000, timer=self.fetch_scheduler.timer, uses_weight=True, hidden_factor=1)
+
+        # 시간 표시 (1초, 창이 안 보이면 10초), 네이버 서버 시간은 1분마다 다시 맞춤
+        self.time_timer = self.poller.add('clock', 1000, callback=self.update_time, hidden_factor=10)
+        self.poller.add('time_sync', TIME_SYNC_INTERVAL, callback=self.sync_time, hidden_factor=1)
+
+        # 체결(최근 500건)/호가(100단계) REST 요청은 작업 스레드가 하고 주기만 poller 가 정함
+        # (가중치를 가장 많이 쓰는 채널이라 변동성/창 표시 여부/가중치 여유를 똑같이 반영)
+        depth_feed = None
+        if self.ingest is None:
+            depth_feed = create_depth_feed(self.data_fetcher, interval=lambda: self.poller.seconds('depth'))
+            if isinstance(depth_feed, RestDepthFeed):
+                self.poller.add('depth', 1000, 500, 10000, volatility=True, uses_weight=True)
+        trade_feed = create_trade_feed(self.data_fetcher, interval=lambda: self.poller.seconds('trades'))
+        if isinstance(trade_feed, RestTradeFeed):
+            self.poller.add('trades', 1000, 500, 10000, volatility=True, uses_weight=True)
+        self.poller.rates_changed.connect(self.update_poll_label)
+        self.poller.start()
         
-        # 시간 표시 업데이트 (1초)
-        self.time_timer = QTimer()
-        self.time_timer.timeout.connect(self.update_time)
-        self.time_timer.start(1000)
+        # 단계별 지연 시간 파일 내보내기 (10초)
+        self.metrics_timer = QTimer()
+        self.metrics_timer.timeout.connect(lambda: perf_monitor.write_prometheus(METRICS_PATH))
+        self.metrics_timer.start(10000)
+
+        # 호가창 - 작업 스레드(또는 수집 프로세스)에서 델타를 반영하고 깊이 스냅샷만 UI 로 전달
+        if self.ingest is not None:
+            self.order_book_thread = None
+            self.ingest.updated.connect(self.on_ingest_updated)
+            self.ingest.start()
+        elif depth_feed is None:
+            # 호가가 없는 재생 기록 - 가짜 호가 대신 비워 두고 이유만 표시
+            self.order_book_thread = None
+            self.depth_chart.set_status('재생 기록에 호가 없음')
+        else:
+            self.order_book_thread = OrderBookThread(depth_feed)
+            self.order_book_thread.depth_updated.connect(self.depth_chart.set_depth)
+            self.order_book_thread.status_changed.connect(self.depth_chart.set_status)
+            self.order_book_thread.start()
+
+        # 체결 내역 - 작업 스레드에서 받은 체결을 모아서 전달
+        if trade_feed is None:
+            # 체결이 없는 재생 기록 - 가짜 체결 대신 비워 두고 이유만 표시
+            self.trade_feed_thread = None
+            self.trade_tape.status_label.setText('재생 기록에 체결 없음')
+        else:
+            self.trade_feed_thread = TradeFeedThread(trade_feed)
+            self.trade_feed_thread.trades_received.connect(self.trade_tape.add_trades)
+            self.trade_feed_thread.gap_detected.connect(self.on_trade_gap)
+            if self.stream_candles:
+                self.trade_feed_thread.trades_received.connect(self.on_trades)
+            self.trade_feed_thread.start()
+    
+    def live_bars(self):
+        """메모리에 있는 메인 차트 봉 (N, 6) 복사본 - 실시간 모드는 링 버퍼 전체, 그 외에는 마지막으로 그린 봉"""
+        if self.stream_candles:
+            self.bar_aggregator.close()  # 대기 중인 봉을 파일에 먼저 기록
+            return self.bar_aggregator.ohlcv()
+        if self.latest_bars is not None:
+            return np.column_stack(self.latest_bars)
+        return np.empty((0, 6))
+
+    def stored_bars(self):
+        """디스크로 내보낸 봉 + 메모리 봉 (겹치는 봉 제거)"""
+        history = load_spilled(spill_path_for(self.history_dir, 'BTC/USDT', self.timeframe))
+        live = self.live_bars()
+        if len(history):
+            live = live[live[:, 0] > history[-1, 0]]
+        return np.concatenate((history, live))
+
+    def run_strategy(self, name):
+        """
+        백테스트 콤보 선택 - 저장된 봉(최근 BACKTEST_MAX_BARS 봉까지)으로 작업 스레드에서 백테스트하고
+        끝나면 수익률 표/차트와 매매 마커에 결과 표시, 요약은 콤보 툴팁에 표시
+        'Live' 를 고르면 실시간 수익률로 돌아감 (진행 중인 백테스트 결과는 버림)
+        """
+        self.backtest_thread = None
+        if name not in STRATEGIES:
+            self.backtest_result = None
+            self.backtest_returns = None
+            self.trade_markers.clear()
+            self.marker_key = None
+            self.backtest_type.setToolTip('')
+            self.refresh_profit_views()
+            return
+
+        # 메모리 봉 복사와 대기 중인 봉 기록만 여기서, 파일 읽기와 계산은 작업 스레드에서
+        thread = BacktestThread(name, spill_path_for(self.history_dir, 'BTC/USDT', self.timeframe),
+                                self.live_bars(), parent=self)
+        thread.backtest_finished.connect(self.on_backtest_finished)
+        thread.backtest_failed.connect(self.on_backtest_failed)
+        thread.finished.connect(thread.deleteLater)
+        self.backtest_thread = thread
+        self.backtest_type.setToolTip(f'{name} {self.timeframe} 백테스트 중...')
+        thread.start()
+
+    def on_backtest_finished(self, result, returns, bar_count, elapsed):
+        thread = self.sender()
+        if thread is not self.backtest_thread:
+            return  # 그 사이 다른 전략/Live 로 바뀜
+        self.backtest_thread = None
+        self.backtest_result = result
+        self.backtest_returns = returns
+        self.marker_key = None
+        self.update_backtest_markers()
+        self.refresh_profit_views()
+        stats = result.stats
+        summary = (f"{thread.strategy} {self.timeframe} {bar_count:,}봉 ({elapsed:.0f}ms) · "
+                   f"수익률 {stats['total_return']:+.2f}% · 최대 낙폭 {stats['max_drawdown']:.2f}% · "
+                   f"체결 {stats['trades']:,}건 · 수수료 {stats['fees']:,.2f} · 승률 {stats['win_rate']:.1f}%")
+        self.backtest_type.setToolTip(summary)
+
+    def on_backtest_failed(self, message):
+        if self.sender() is not self.backtest_thread:
+            return
+        self.backtest_thread = None
+        self.backtest_type.setToolTip(f'백테스트 실패: {message}')
+
+    def update_backtest_markers(self):
+        """화면에 그린 봉 구간 안의 백테스트 체결만 마커로 표시 (봉 구간이 바뀔 때만 다시 그림)"""
+        result = self.backtest_result
+        if result is None or self.latest_bars is None or len(self.latest_bars[0]) == 0:
+            return
+        times = self.latest_bars[0]
+        key = (int(times[0]), len(times))
+        if key == self.marker_key:
+            return
+        self.marker_key = key
+        self.trade_markers.clear()
+        begin = np.searchsorted(result.trade_times, times[0], side='left')
+        end = np.searchsorted(result.trade_times, times[-1], side='right')
+        positions = np.searchsorted(times, result.trade_times[begin:end])
+        for x, price, kind in zip(positions.tolist(), result.trade_prices[begin:end].tolist(),
+                                  result.trade_kinds[begin:end]):
+            self.trade_markers.add_trade(x, price, kind)
+
+    def export_data(self):
+        """
+        메인 차트 봉(디스크로 내보낸 봉 포함), 체결 기록, 자산 이력을 CSV 와 열 형식 파일로 내보내기
+        읽기/쓰기는 작업 스레드에서 청크 단위로 하고, 여기서는 메모리에 있는 값의 복사본만 만듦
+        """
+        if self.export_thread is not None and self.export_thread.isRunning():
+            self.export_thread.cancel()
+            return
+
+        size = self.returns_engine.size
+        sources = [
+            candle_source(f'BTC-USDT_{self.timeframe}', spill_path_for(self.history_dir, 'BTC/USDT', self.timeframe),
+                          self.live_bars()),
+            fill_source(list(self.position_engine.fills)),
+            equity_source(self.returns_engine.timestamps[:size].copy(), self.returns_engine.equity[:size].copy()),
+        ]
+        self.export_thread = ExportThread(sources, parent=self)
+        self.export_thread.progress.connect(self.on_export_progress)
+        self.export_thread.export_finished.connect(self.on_export_finished)
+        self.export_thread.export_failed.connect(self.on_export_failed)
+        self.export_thread.start()
+
+    def on_export_progress(self, done, total):
+        self.export_button.setText(f'{done / total:.0%}' if total else '0%')
+
+    def on_export_finished(self, directory):
+        print(f"내보내기 완료: {directory}")
+        self.export_button.setText('Export')
+        self.export_button.setToolTip(f'마지막 내보내기: {os.path.abspath(directory)}')
+
+    def on_export_failed(self, message):
+        self.export_button.setText('Export')
+        self.export_button.setToolTip(f'내보내기 실패: {message}')
+
+    def open_chart_grid(self):
+        """멀티 차트 창 열기 (이미 열려 있으면 앞으로 가져옴)"""
+        if self.chart_grid is None:
+            self.chart_grid = ChartGrid(self.fetch_scheduler, self.candle_store, GRID_CHARTS)
+            self.chart_grid.resize(1280, 720)
+            self.chart_grid.destroyed.connect(self.on_chart_grid_closed)
+            self.chart_grid.setAttribute(Qt.WA_DeleteOnClose)
+        self.chart_grid.show()
+        self.chart_grid.raise_()
+        self.chart_grid.activateWindow()
+
+    def on_chart_grid_closed(self):
+        self.chart_grid = None
+
+    def open_sweep_window(self):
+        """파라미터 스윕 창 열기 (백테스트 콤보에서 고른 전략으로 시작, 이미 열려 있으면 앞으로 가져옴)"""
+        if self.sweep_window is None:
+            self.sweep_window = SweepWindow(self.stored_bars, self.backtest_type.currentText(),
+                                            {'initial_balance': BACKTEST_BALANCE})
+            self.sweep_window.resize(1100, 600)
+            self.sweep_window.destroyed.connect(self.on_sweep_window_closed)
+            self.sweep_window.setAttribute(Qt.WA_DeleteOnClose)
+        self.sweep_window.show()
+        self.sweep_window.raise_()
+        self.sweep_window.activateWindow()
+
+    def on_sweep_window_closed(self):
+        self.sweep_window = None
+
+    def closeEvent(self, event):
+        """창을 닫을 때 세션 스냅샷 저장, 멀티 차트/스윕 창과 가져오기 스레드 정리, 시세 기록 파일 마무리"""
+        self.save_session()
+        if self.export_thread is not None:
+            self.export_thread.cancel()
+            self.export_thread.wait(5000)
+        for thread in self.findChildren(BacktestThread):
+            thread.wait(5000)
+        if self.chart_grid is not None:
+            self.chart_grid.close()
+        if self.sweep_window is not None:
+            self.sweep_window.close()
+        self.poller.stop()
+        self.fetch_scheduler.shutdown()
+        if self.ingest is not None:
+            self.ingest.stop()
+        if self.order_book_thread is not None:
+            self.order_book_thread.stop()
+        if self.trade_feed_thread is not None:
+            self.trade_feed_thread.stop()
+        self.bar_aggregator.close()
+        recorder = getattr(self.data_fetcher, 'recorder', None)
+        if recorder is not None:
+            recorder.close()
+        super().closeEvent(event)
     
     def update_data(self):
         """데이터 업데이트"""
+        with perf_monitor.stage('update_data'):
+            self._update_data()
+    
+    def _update_data(self):
         # 현재가 업데이트
         current_price = self.data_fetcher.get_current_price()
         if current_price:
-            self.price_label.setText(f'BTC/USDT: {current_price:,.1f}')
+            self.mark_to_market(current_price)
 
         # 차트 데이터 업데이트
-        candle_data, df = self.data_fetcher.fetch_ohlcv()
+        candle_data, df = self.data_fetcher.fetch_ohlcv(timeframe=self.timeframe)
         if candle_data is not None:
             self.update_chart_data(candle_data, df)
+
+    def show_price(self, price):
+        """현재가 표시 (저장된 가격을 표시 중이었으면 stale 표시 해제)"""
+        self.last_price = float(price)
+        self.price_label.setText(f'BTC/USDT: {price:,.1f}')
+        if self.price_label.property('stale'):
+            self.price_label.setProperty('stale', False)
+            self.price_label.style().unpolish(self.price_label)
+            self.price_label.style().polish(self.price_label)
+
+    def mark_to_market(self, current_price):
+        """현재가 표시 후 보유 포지션 재평가, 자산 이력에 기록"""
+        self.show_price(current_price)
+        self.poller.observe_price(current_price)
+        self.position_engine.mark({"BTC": current_price})
+        now_ms = int(datetime.now().timestamp() * 1000)
+        self.returns_engine.add_mark(now_ms, self.position_engine.equity())
+        self.refresh_positions()
+        self.refresh_profit_views()
+
+    def on_ingest_updated(self, kind, value):
+        """수집 프로세스 알림 - 바뀐 종류만 공유 메모리에서 읽어서 반영"""
+        with perf_monitor.stage('ingest_read'):
+            if kind == 'ticker':
+                ticker = self.ingest.last_ticker()
+                if ticker is not None and np.isfinite(ticker[1]):
+                    self.mark_to_market(float(ticker[1]))
+            elif kind == 'candles':
+                # 봉 간격을 바꾼 직후 도착한 이전 간격의 봉은 버림
+                rows = self.ingest.candles()
+                if value == self.timeframe and len(rows):
+                    self.render_rows(rows)
+                    self.clear_stale()
+            elif kind == 'book':
+                self.depth_chart.set_depth(self.ingest.depth())
+            elif kind == 'status':
+                self.depth_chart.set_status(value)
+
+    def mark_last_trade(self):
+        """실시간 모드: 마지막 체결가로 포지션 평가 (1초마다)"""
+        if len(self.trade_tape.tape):
+            self.mark_to_market(self.trade_tape.tape.row(0)[1])
+
+    def on_trades(self, batch):
+        """
+        체결 묶음으로 진행 중인 봉 갱신 후 차트 다시 그림
+        Args:
+            batch: {'timestamps', 'prices', 'sizes', 'sides'} numpy 배열
+        """
+        with perf_monitor.stage('bar_aggregate'):
+            self.bar_aggregator.add_trades(batch['timestamps'], batch['prices'], batch['sizes'])
+        if len(batch['prices']):
+            self.show_price(batch['prices'][-1])
+        self.render_aggregated_bars()
+
+    def render_aggregated_bars(self):
+        """직접 만든 봉이 바뀌었으면 차트에 반영"""
+        if not self.candles_seeded or self.bar_aggregator.version == self.rendered_version:
+            return
+        self.rendered_version = self.bar_aggregator.version
+        # 링 버퍼의 최근 구간을 복사 없이 그대로 차트에 넘김
+        bars = self.bar_aggregator.window(CHART_BARS)
+        self.render_bars(bars[:, :5], bars[:, 0].astype(np.int64),
+                         bars[:, 1], bars[:, 2], bars[:, 3], bars[:, 4], bars[:, 5])
+
+    def memory_usage(self):
+        """(심볼 봉 간격)별 캔들 데이터 메모리 사용량 (바이트) - 성능 HUD 에 표시"""
+        usage = {}
+        if self.stream_candles:
+            aggregator = self.bar_aggregator
+            usage[f'{aggregator.symbol} {aggregator.timeframe} live'] = aggregator.nbytes
+        usage['indicators'] = self.indicator_engine.nbytes
+        if self.ingest is not None:
+            usage['shared memory'] = self.ingest.nbytes
+        for (symbol, timeframe), size in self.candle_store.memory_usage().items():
+            usage[f'{symbol} {timeframe}'] = size
+        return usage
+
+    def kline_timeframe(self):
+        """보정에 쓸 거래소 klines 간격 (거래소에 없는 초 단위 간격은 1초봉을 묶어서 사용)"""
+        available = getattr(self.data_fetcher.exchange, 'timeframes', None) or {}
+        return self.timeframe if self.timeframe in available else '1s'
+
+    def subscribe_reconcile(self):
+        """현재 봉 간격의 보정용 klines 구독 (이전 구독은 해제)"""
+        if self.reconcile_key is not None:
+            self.fetch_scheduler.unsubscribe(*self.reconcile_key)
+        kline_timeframe = self.kline_timeframe()
+        ratio = self.bar_aggregator.timeframe_ms // timeframe_to_ms(kline_timeframe)
+        limit = min(1000, self.bar_aggregator.capacity * ratio)  # 거래소 한 번 요청 최대 1000개
+        self.reconcile_key = ('BTC/USDT', kline_timeframe)
+        self.reconcile_limit = limit
+        self.fetch_scheduler.subscribe(*self.reconcile_key, limit=limit, interval=RECONCILE_INTERVAL)
+
+    def on_trade_gap(self, missed):
+        """
+        체결 소스가 빠진 체결을 다 채우지 못함 - 직접 만든 봉의 거래량/고가/저가가 틀렸을 수 있으므로
+        다음 보정 주기(RECONCILE_INTERVAL)까지 기다리지 않고 바로 klines 로 보정
+        """
+        self.trade_tape.note_gap(missed)
+        if self.stream_candles and self.reconcile_key is not None:
+            self.fetch_scheduler.fetch_once(*self.reconcile_key, limit=self.reconcile_limit)
+
+    def on_klines_fetched(self, symbol, timeframe):
+        """보정용 klines 가 도착하면 직접 만든 봉을 거래소 값으로 맞추고 지표 전체 재계산"""
+        if not self.stream_candles:
+            # 폴링 모드: 시작할 때 백그라운드로 요청한 봉 (이후는 update_data 가 매 주기 가져옴)
+            if self.ingest is None and (symbol, timeframe) == ('BTC/USDT', self.timeframe):
+                _, candle_data, df = self.candle_store.get(symbol, timeframe)
+                if candle_data is not None:
+                    self.update_chart_data(candle_data, df)
+            return
+        if (symbol, timeframe) != self.reconcile_key:
+            return
+        _, _, df = self.candle_store.get(symbol, timeframe)
+        if df is None or len(df) == 0:
+            return
+        with perf_monitor.stage('bar_reconcile'):
+            timestamps_ms = df['timestamp'].to_numpy().astype('datetime64[ms]').astype(np.int64)
+            ohlcv = np.column_stack((timestamps_ms, df['open'].values, df['high'].values,
+                                     df['low'].values, df['close'].values, df['volume'].values))
+            if timeframe != self.timeframe:
+                ohlcv = resample_ohlcv(ohlcv, self.bar_aggregator.timeframe_ms)
+            self.bar_aggregator.reconcile(ohlcv)
+        self.indicator_engine.reset()
+        self.candles_seeded = True
+        self.render_aggregated_bars()
+        self.clear_stale()
+
+    def set_timeframe(self, timeframe):
+        """메인 차트 봉 간격 변경"""
+        self.timeframe = timeframe
+        self.indicator_engine.reset()
+        if not self.stream_candles:
+            if self.ingest is not None:
+                self.ingest.set_timeframe(timeframe)
+            else:
+                self.update_data()
+            return
+        # 체결 내역에 남아 있는 체결로 새 간격의 봉을 먼저 만들고, 과거 봉은 보정 klines 로 채움
+        self.bar_aggregator.close()
+        self.bar_aggregator = BarAggregator(timeframe, spill_dir=self.history_dir)
+        timestamps, prices, sizes, _ = self.trade_tape.tape.chronological()
+        self.bar_aggregator.add_trades(timestamps, prices, sizes)
+        self.candles_seeded = False
+        self.rendered_version = -1
+        self.subscribe_reconcile()
     
     def update_chart_data(self, candle_data, df):
         """차트 데이터 업데이트 처리"""
-        # UTC 시간을 한국 시간(KST)으로 변환 (UTC+9)
-        if 'timestamp' in df.columns:
-            df['timestamp'] = df['timestamp'].dt.tz_localize('UTC').dt.tz_convert('Asia/Seoul')
-        
-        # x축 레이블 설정 - 30분 단위만 표시
-        ticks = []
-        for i, ts in enumerate(df['timestamp']):
-            # 정각(00분)이나 30분인 경우에만 레이블 추가
-            if ts.minute in [0, 30]:
-                time_str = ts.strftime('%H:%M')
-                ticks.append((i, time_str))
-            
-        self.left_chart_widget.getAxis('bottom').setTicks([ticks])
-        
-        # 캔들스틱 데이터 설정
-        self.candlestick_item.set_data(candle_data)
-
-         # 라인차트 데이터 설정
-        if self.line_plot is None:
-            self.line_plot = self.left_chart_widget.plot(
-                np.arange(len(df)), 
-                df['close'].values,
-                pen='w'
-            )
+        timestamps_ms = df['timestamp'].to_numpy().astype('datetime64[ms]').astype(np.int64)
+        self.render_bars(candle_data, timestamps_ms, df['open'].values, df['high'].values,
+                         df['low'].values, df['close'].values, df['volume'].values)
+        self.clear_stale()
+
+    def save_session(self):
+        """마지막 봉/현재가/포지션/자산 이력/화면 범위를 세션 스냅샷으로 저장 (재생 모드는 저장하지 않음)"""
+        if not self.persist_session or self.latest_bars is None:
+            return
+        with perf_monitor.stage('snapshot_save'):
+            candles = np.column_stack(self.latest_bars)
+            engine = self.position_engine
+            view_box = self.left_chart_widget.getViewBox()
+            x_range, y_range = view_box.viewRange()
+            size = self.returns_engine.size
+            save_snapshot(SNAPSHOT_PATH, candles,
+                          self.returns_engine.timestamps[:size], self.returns_engine.equity[:size], {
+                'saved_at': int(datetime.now().timestamp() * 1000),
+                'symbol': 'BTC/USDT',
+                'timeframe': self.timeframe,
+                'price': self.last_price,
+                'chart_type': self.chart_type.currentText(),
+                'indicator_type': self.indicator_type.currentText(),
+                'x_range': list(x_range),
+                'y_range': list(y_range),
+                'auto_range': [bool(flag) for flag in view_box.state['autoRange']],
+                'initial_balance': engine.initial_balance,
+                'leverage': {symbol: float(engine.leverage[i]) for symbol, i in engine.slot_index.items()},
+                'fills': [[fill.timestamp, fill.symbol, fill.quantity, fill.price, fill.fee]
+                          for fill in engine.fills],
+            })
+
+    def restore_snapshot(self):
+        """
+        지난 세션 스냅샷을 바로 그림 (네트워크 응답을 기다리지 않음)
+        실시간 데이터가 들어오기 전까지 현재가와 차트에 저장된 값이라는 표시(stale)를 남김
+        """
+        snapshot = self.snapshot
+        if snapshot is None:
+            return
+        with perf_monitor.stage('snapshot_restore'):
+            # 자산 이력과 포지션 - 저장된 체결을 포지션 엔진에 다시 반영
+            self.returns_engine.load_history(snapshot['equity_timestamps'], snapshot['equity'])
+            engine = self.position_engine
+            engine.initial_balance = snapshot.get('initial_balance', self.returns_engine.last_equity())
+            for symbol, leverage in snapshot.get('leverage', {}).items():
+                engine.set_leverage(symbol, leverage)
+            for timestamp, symbol, quantity, price, fee in snapshot.get('fills', []):
+                engine.apply_fill(symbol, quantity, price, fee=fee, timestamp=timestamp)
+            price = snapshot.get('price')
+            if price:
+                engine.mark({"BTC": price})
+                self.show_price(price)
+            self.refresh_positions()
+            self.refresh_profit_views()
+
+            # 차트 종류와 봉
+            self.chart_type.setCurrentText(snapshot.get('chart_type', 'Candle'))
+            self.indicator_type.setCurrentText(snapshot.get('indicator_type', 'RSI'))
+            candles = snapshot['candles']
+            if len(candles):
+                self.render_rows(candles)
+                if not all(snapshot.get('auto_range', [True, True])):
+                    self.left_chart_widget.setRange(xRange=snapshot['x_range'], yRange=snapshot['y_range'],
+                                                    padding=0)
+
+        saved_at = datetime.fromtimestamp(snapshot.get('saved_at', 0) / 1000)
+        self.price_label.setProperty('stale', True)
+        self.stale_label = QLabel(f'저장된 화면 ({saved_at:%m-%d %H:%M} 기준) · 갱신 중', self.left_chart_widget)
+        self.stale_label.setObjectName("stale_label")
+        self.stale_label.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.stale_label.move(60, 10)
+        self.stale_label.adjustSize()
+        self.stale_label.show()
+
+    def clear_stale(self):
+        """실시간 봉이 반영되면 저장된 화면 표시 제거"""
+        if self.stale_label is not None:
+            self.stale_label.deleteLater()
+            self.stale_label = None
+
+    def render_rows(self, rows):
+        """(N, 6) [시각(ms), 시가, 고가, 저가, 종가, 거래량] 배열로 차트 갱신 (세션 스냅샷, 수집 프로세스)"""
+        candle_data = np.column_stack((np.arange(len(rows)), rows[:, 1:5]))
+        self.render_bars(candle_data, rows[:, 0].astype(np.int64), rows[:, 1], rows[:, 2],
+                         rows[:, 3], rows[:, 4], rows[:, 5])
+
+    def render_bars(self, candle_data, timestamps_ms, open_, high, low, close, volume):
+        """
+        봉 배열로 캔들/지표/거래량/시간축 갱신
+        Args:
+            candle_data: (N, 5) [x, 시가, 고가, 저가, 종가] (x 열은 쓰지 않고 0 부터의 인덱스로 그림)
+            timestamps_ms: 봉 시작 시각 (UTC ms)
+        """
+        # 보조 지표 갱신 - 진행 중인 봉만 바뀐 경우 마지막 한 점만 다시 계산
+        with perf_monitor.stage('indicators'):
+            update_kind = self.indicator_engine.update(timestamps_ms, open_, high, low, close, volume)
+            self.indicator_overlay.set_data(self.indicator_engine, len(candle_data))
+
+        # 십자선이 참조할 봉과 지표 (복사 없이 참조만 넘김)
+        n = len(candle_data)
+        engine = self.indicator_engine
+        self.crosshair.set_data(timestamps_ms, open_, high, low, close, volume, indicators={
+            'SMA': engine.window_view('sma', n), 'EMA': engine.window_view('ema', n),
+            'BB+': engine.window_view('bb_upper', n), 'BB-': engine.window_view('bb_lower', n),
+            'VWAP': engine.window_view('vwap', n), 'RSI': engine.window_view('rsi', n),
+            'MACD': engine.window_view('macd', n),
+        })
+
+        # 거래량 갱신 - 진행 중인 봉만 바뀐 경우 마지막 막대만 다시 그림
+        rising = close >= open_
+        if update_kind == 'tick' and self.volume_item.volume is not None \
+                and len(self.volume_item.volume) == len(volume):
+            self.volume_item.update_last(volume[-1], rising[-1])
         else:
-            self.line_plot.setData(
-                np.arange(len(df)), 
-                df['close'].values
-            )
+            self.volume_item.set_data(volume, rising)
+
+        # x축 레이블 설정 - 한국 시간(KST) 기준 정각(00분)이나 30분인 봉만 표시
+        with perf_monitor.stage('axis_ticks'):
+            ticks = kst_time_ticks(timestamps_ms, step_minutes=tick_step_for(timestamps_ms, max_labels=10))
+            self.left_chart_widget.getAxis('bottom').setTicks([ticks])
         
-        # 현재 선택된 차트 타입에 따라 표시 여부 결정
-        current_chart_type = self.chart_type.currentText()
-        if current_chart_type == 'Candle':
+        # 최신 데이터만 보관하고, 현재 보이는 차트 종류만 계산
+        self.latest_candle_data = candle_data
+        self.latest_bars = (timestamps_ms, open_, high, low, close, volume)
+        self.update_backtest_markers()
+        self.series_dirty = {'Candle': True, 'Line': True}
+        self.render_visible_series()
+    
+    def render_visible_series(self):
+        """
+        현재 선택된 차트 종류(캔들/라인)의 시리즈만 계산하여 표시
+        숨겨진 시리즈는 dirty 로 남겨두었다가 전환 시 한 번만 따라잡음
+        """
+        chart_type = self.chart_type.currentText()
+        candle_data = self.latest_candle_data
+
+        if candle_data is not None and self.series_dirty.get(chart_type):
+            if chart_type == 'Candle':
+                self.candlestick_item.set_data(candle_data)
+            else:
+                # 라인 차트는 화면 밖 구간 생략 + 피크 보존 다운샘플링으로 그림
+                with perf_monitor.stage('line_series'):
+                    self.line_plot.setData(np.arange(len(candle_data)), candle_data[:, 4])
+            self.series_dirty[chart_type] = False
+
+        if chart_type == 'Candle':
             self.candlestick_item.show()
             self.line_plot.hide()
         else:  # 'Line'
             self.candlestick_item.hide()
             self.line_plot.show()
     
+    def sync_time(self):
+        """네이버 서버 시간을 가져와서 기준 시각으로 저장"""
+        self.time_synced = (NaverTimeFetcher.get_naver_time(), time.monotonic())
+
     def update_time(self):
-        """네이버 서버 시간을 가져와서 업데이트"""
-        kr_time = NaverTimeFetcher.get_naver_time()
+        """마지막으로 맞춘 네이버 서버 시간에 흐른 시간을 더해서 표시 (요청 없음)"""
+        if self.time_synced is None:
+            self.sync_time()
+        synced_time, synced_at = self.time_synced
+        kr_time = synced_time + timedelta(seconds=time.monotonic() - synced_at)
         weekday = ['월', '화', '수', '목', '금', '토', '일'][kr_time.weekday()]
         time_str = kr_time.strftime(f'%Y-%m-%d({weekday}) %H:%M:%S')
         self.time_label.setText(time_str)
+        self.update_poll_label()
+
+    def update_poll_label(self):
+        """현재 폴링 주기와 요청 가중치 여유 표시"""
+        intervals = self.poller.intervals()
+        parts = [f'{label} {intervals[name] / 1000:g}s' for name, label in POLL_LABELS.items()
+                 if name in intervals]
+        headroom = self.poller.headroom()
+        if headroom is not None:
+            parts.append(f'여유 {headroom:.0%}')
+        self.poll_label.setText(' · '.join(parts))
+        self.poll_label.setToolTip(
+            f'변동성 ×{self.poller.volatility_factor():.2f} · '
+            f'요청 가중치 ×{self.poller.weight_factor():.2f} '
+            f'({self.poller.used_weight if self.poller.used_weight is not None else "-"}/{self.poller.weight_limit}) · '
+            f'{"창 표시 중" if self.poller.visible else "창 숨김"}'
+        )
     
     def update_chart(self, chart_type):
-        """차트 타입에 따라 보여줄 차트 선택"""
-        if chart_type == 'Candle':
-            self.candlestick_item.show()
-            self.line_plot.hide()
-        else:
-            self.candlestick_item.hide()
-            self.line_plot.show()
+        """차트 타입에 따라 보여줄 차트 선택 (숨겨져 있던 동안 밀린 데이터는 이때 반영)"""
+        self.render_visible_series()
+    
+    def update_indicator_type(self, indicator_type):
+        """보조 차트에 표시할 지표 선택"""
+        self.indicator_overlay.set_sub_type(indicator_type)
+        if self.latest_candle_data is not None:
+            self.indicator_overlay.set_data(self.indicator_engine, len(self.latest_candle_data))
     
     def apply_styles(self):
         """UI 스타일 적용"""
-        # 기본 UI 스타일
-        self.apply_ui_styles()
-        
-        # 차트 스타일 - 기존 효과 중복 방지를 위해 그래픽 효과 제거 먼저 수행
-        self.remove_graphics_effects()
-        self.apply_chart_styles(self.left_chart_widget)
+        with perf_monitor.stage('apply_styles'):
+            # 위젯 스타일은 앱 전체 테마 스타일시트 하나로 지정 (main 에서 이미 적용했으면 건너뜀)
+            apply_theme(QApplication.instance(), font_family=app_font_name)
+
+            # 차트 스타일 - 기존 효과 중복 방지를 위해 그래픽 효과 제거 먼저 수행
+            self.remove_graphics_effects()
+            self.apply_chart_styles(self.left_chart_widget)
+            self.apply_chart_styles(self.volume_chart_widget)
+            self.apply_chart_styles(self.indicator_chart_widget)
         
         # 프로그램 이름 설정
         self.program_name.setText("프로그램명")
@@ -447,103 +1192,40 @@ class TradingView(QMainWindow):
         if profit_chart_widget.graphicsEffect():
             profit_chart_widget.setGraphicsEffect(None)
     
-    def apply_ui_styles(self):
-        """UI 스타일 적용 - 몽환적인 네온 테마"""
-        # 기본 색상 정의
-        dark_bg = "#0F0326"  # 매우 어두운 보라색 배경
-        neon_pink = "#FF10F0"  # 형광 핑크
-        neon_purple = "#B026FF"  # 형광 보라색
-        neon_cyan = "#0AFFE6"  # 형광 청록색
-        neon_yellow = "#FFFF33"  # 형광 노랑
-        
-        self.setStyleSheet(f'''
-            QMainWindow {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                        stop:0 {dark_bg}, stop:1 #200A40);
-                color: #ffffff;
-                font-family: "{app_font_name}";
-            }}
-            
-            QLabel, QTableWidget, QPushButton {{
-                font-family: "{app_font_name}";
-                font-size: 13px;
-            }}
-            
-            QLabel#program_name {{
-                font-family: "{app_font_name}";
-                font-size: 24px;
-                font-weight: bold;
-                color: {neon_cyan};
-                padding: 5px;
-            }}
-            
-            QHeaderView::section {{
-                font-family: "{app_font_name}";
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            
-            /* 콤보박스 스타일 */
-            QComboBox {{
-                background-color: {dark_bg};
-                color: {neon_cyan};
-                border: 2px solid {neon_purple};
-                border-radius: 5px;
-                padding: 5px;
-                min-width: 80px;
-                font-weight: bold;
-            }}
-            
-            QComboBox:hover {{
-                border: 2px solid {neon_cyan};
-            }}
-            
-            QComboBox::drop-down {{
-                border: none;
-                background: {neon_purple};
-                width: 20px;
-            }}
-            
-            QComboBox QAbstractItemView {{
-                background-color: {dark_bg};
-                color: {neon_cyan};
-                border: 2px solid {neon_purple};
-                selection-background-color: {neon_purple};
-                selection-color: {neon_cyan};
-            }}
-            
-            /* 시간 표시 라벨 */
-            #time_label {{
-                color: {neon_cyan};
-                font-size: 14px;
-                padding: 5px;
-                border: 1px solid {neon_pink};
-                border-radius: 5px;
-                background-color: {dark_bg};
-            }}
-            
-            /* 가격 라벨 */
-            #price_label {{
-                color: {neon_purple};
-                font-size: 18px;
-                font-weight: bold;
-            }}
-            
-            /* 오른쪽 상단 위젯 스타일 */
-            #right_empty_widget {{
-                background-color: {dark_bg};
-                border: 2px solid {neon_pink};
-                border-radius: 8px;
-            }}
-        ''')
-    
+    def switch_theme(self):
+        """
+        다음 테마로 전환 (F6) - 앱 스타일시트를 한 번 교체하고 차트 배경/축/그림자 색과
+        코드에서 칠하는 색(지표 선, 거래량 막대, 체결 내역, 빈 표 칸, 멀티 차트/스윕 창)을 새 테마로 다시 칠함
+        """
+        apply_theme(QApplication.instance(), next_theme(), app_font_name)
+        colors = palette()
+        for chart_widget in (self.volume_chart_widget, self.indicator_chart_widget):
+            self.apply_chart_styles(chart_widget)
+        # 시작할 때와 같은 순서: 공통 차트 스타일 → 캔들 차트 네온 스타일
+        self.apply_chart_styles(self.left_chart_widget)
+        apply_matching_neon_style(self)
+        tint_chart(self.profit_chart.get_widget(), colors, add_glow=False)
+        tint_chart(self.depth_chart.plot_widget, colors, axis_width=1, add_glow=False)
+        right_empty_widget = self.findChild(QWidget, "right_empty_widget")
+        if right_empty_widget is not None and right_empty_widget.graphicsEffect():
+            right_empty_widget.graphicsEffect().setColor(QColor(colors['border']))
+        self.indicator_overlay.apply_theme_colors()
+        self.volume_item.apply_theme_colors()
+        self.trade_tape.apply_theme_colors()
+        self.left_table.apply_theme_colors()
+        if self.chart_grid is not None:
+            self.chart_grid.apply_theme_colors()
+        if self.sweep_window is not None:
+            self.sweep_window.apply_theme_colors()
+
     def apply_chart_styles(self, chart_widget):
         """차트 스타일 통합 적용 - 그래픽 효과 중복 방지"""
-        # 네온 스타일 색상
-        dark_bg = "#0F0326"
-        neon_pink = "#FF10F0"
-        neon_purple = "#B026FF"
-        neon_cyan = "#0AFFE6"
+        # 테마 색상
+        colors = palette()
+        dark_bg = colors['chart_bg']
+        neon_pink = colors['border']
+        neon_purple = colors['highlight']
+        neon_cyan = colors['accent']
         
         # 차트 배경색 설정
         chart_widget.setBackground(QColor(dark_bg))
@@ -563,32 +1245,37 @@ class TradingView(QMainWindow):
         grid_pen = pg.mkPen(color=grid_color, width=1, style=Qt.DotLine)
         chart_widget.showGrid(x=True, y=True)
         
-        # 네온 효과 그림자 추가 (기존 효과가 없는 경우에만)
-        if not chart_widget.graphicsEffect():
+        # 네온 효과 그림자 추가 (기존 효과가 있으면 색만 바꿈 - 테마 전환)
+        shadow = chart_widget.graphicsEffect()
+        if not isinstance(shadow, QGraphicsDropShadowEffect):
             shadow = QGraphicsDropShadowEffect()
             shadow.setBlurRadius(20)
-            shadow.setColor(QColor(neon_purple))
             shadow.setOffset(0, 0)
             chart_widget.setGraphicsEffect(shadow)
+        shadow.setColor(QColor(neon_purple))
     
     def apply_modern_ui(self):
         """현대적인 UI 요소 적용 - 그래픽 효과 중복 방지"""
         try:
             # modern_ui 모듈 가져오기
             from modern_ui import (add_price_update_effect, add_smooth_chart_updates, 
-                                add_animated_background, add_table_row_animation)
-                    
+                                add_table_row_animation, AnimationGovernor)
+
+            # 장식용 애니메이션은 창이 보일 때만, 정해진 fps 까지만 움직임
+            self.animation_governor = AnimationGovernor(self)
+            # 창이 안 보이면 폴링도 느리게
+            self.animation_governor.active_changed.connect(self.poller.set_visible)
+
             # 애니메이션 효과 추가 (차트 효과는 제외 - 이미 적용됨)
-            add_price_update_effect(self.price_label)  # 가격 변화 시 깜빡임 효과
+            add_price_update_effect(self.price_label, self.animation_governor)  # 가격 변화 시 깜빡임 효과
             add_table_row_animation(self.left_table)  # 테이블 행 추가 애니메이션
-            add_animated_background(self)  # 배경 그라데이션 애니메이션
             
             # 오른쪽 상단 위젯에 네온 효과 추가
             right_empty_widget = self.findChild(QWidget, "right_empty_widget")
             if right_empty_widget and not right_empty_widget.graphicsEffect():
                 shadow = QGraphicsDropShadowEffect()
                 shadow.setBlurRadius(15)
-                shadow.setColor(QColor("#FF10F0"))  # 네온 핑크 그림자
+                shadow.setColor(QColor(palette()['border']))  # 네온 테마는 네온 핑크 그림자
                 shadow.setOffset(0, 0)
                 right_empty_widget.setGraphicsEffect(shadow)
             
@@ -601,19 +1288,6 @@ class TradingView(QMainWindow):
             
         except Exception as e:
             print(f"현대적 UI 적용 실패: {e}")
-            # 기본 스타일 폴백
-            self.setStyleSheet(f"""
-                QMainWindow {{
-                    background-color: #1a1d2d;
-                }}
-                
-                QLabel#program_name {{
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: white;
-                    font-family: "{app_font_name}";
-                }}
-            """)
             
         # 프로그램 이름을 맨 앞으로 가져오기 - 그래픽 효과 적용 후
         self.program_name.raise_()
\ No newline at end of file
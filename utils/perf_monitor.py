@@ -0,0 +1,152 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class StageStats:
+    """한 단계의 최근 실행 시간을 고정 크기 링 버퍼에 보관"""
+
+    def __init__(self, window):
+        self.samples = np.zeros(window)  # 초 단위
+        self.index = 0                   # 다음에 쓸 위치
+        self.count = 0                   # 전체 기록 횟수
+        self.total = 0.0                 # 전체 누적 시간 (초)
+
+    def add(self, seconds):
+        self.samples[self.index] = seconds
+        self.index = (self.index + 1) % len(self.samples)
+        self.count += 1
+        self.total += seconds
+
+    def recent(self):
+        """링 버퍼에 남아있는 최근 기록"""
+        return self.samples[:min(self.count, len(self.samples))]
+
+
+class PerfMonitor:
+    """
+    단계별 지연 시간 측정기
+
+    - stage() 로 감싼 구간의 실행 시간을 단계 이름별로 기록
+    - 최근 window 개 기록으로 p50/p95/p99 계산
+    - Prometheus 텍스트 형식(summary)으로 파일 내보내기
+    - 가져오기 스레드/작업 스레드에서 기록하고 UI 스레드에서 읽으므로 기록과 읽기는 lock 안에서
+      (읽을 때는 lock 안에서 최근 기록만 복사하고 분위수 계산은 밖에서)
+    """
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, window=512, metric_name='trading_ui_stage_seconds'):
+        self.window = window
+        self.metric_name = metric_name
+        self.stages = {}  # 단계 이름 → StageStats (추가된 순서 유지)
+        self.enabled = True
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        """
+        with 블록의 실행 시간을 기록
+        사용 예:
+            with perf_monitor.stage('fetch_ohlcv'):
+                ...
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        """측정값 한 개 기록"""
+        with self.lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats(self.window)
+            stats.add(seconds)
+
+    def clear(self):
+        """모든 기록 지우기"""
+        with self.lock:
+            self.stages.clear()
+
+    def snapshot(self):
+        """
+        단계별 기록 복사본
+        Returns:
+            [(단계 이름, 최근 기록 배열, 마지막 값, 기록 횟수, 누적 시간)]
+        """
+        with self.lock:
+            return [(name, stats.recent().copy(), float(stats.samples[stats.index - 1]), stats.count, stats.total)
+                    for name, stats in self.stages.items()]
+
+    def quantiles(self, recent):
+        """최근 기록 배열의 (p50, p95, p99)"""
+        if len(recent) == 0:
+            return (0.0, 0.0, 0.0)
+        return tuple(np.quantile(recent, self.QUANTILES).tolist())
+
+    def percentiles(self, name):
+        """단계의 (p50, p95, p99) 초 단위 반환"""
+        with self.lock:
+            stats = self.stages.get(name)
+            recent = stats.recent().copy() if stats is not None else np.empty(0)
+        return self.quantiles(recent)
+
+    def summary(self):
+        """
+        전체 단계 요약
+        Returns:
+            {단계 이름: {'p50', 'p95', 'p99', 'last', 'count'}} (초 단위)
+        """
+        result = {}
+        for name, recent, last, count, _ in self.snapshot():
+            p50, p95, p99 = self.quantiles(recent)
+            result[name] = {
+                'p50': p50,
+                'p95': p95,
+                'p99': p99,
+                'last': last,
+                'count': count,
+            }
+        return result
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 형식 문자열 생성"""
+        lines = [
+            f'# HELP {self.metric_name} UI 업데이트 단계별 실행 시간 (최근 {self.window}회 기준 분위수)',
+            f'# TYPE {self.metric_name} summary',
+        ]
+        for name, recent, _, count, total in self.snapshot():
+            for q, value in zip(self.QUANTILES, self.quantiles(recent)):
+                lines.append(f'{self.metric_name}{{stage="{name}",quantile="{q}"}} {value:.9f}')
+            lines.append(f'{self.metric_name}_sum{{stage="{name}"}} {total:.9f}')
+            lines.append(f'{self.metric_name}_count{{stage="{name}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """
+        Prometheus 텍스트 파일로 저장 (node_exporter textfile 수집기용)
+        수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        """
+        try:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"성능 지표 저장 실패: {e}")
+            return False
+
+
+# 앱 전체에서 공유하는 측정기
+perf_monitor = PerfMonitor()